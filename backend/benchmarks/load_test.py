@@ -0,0 +1,318 @@
+"""
+Drive the API with open-loop arrival rates from a scenario file and report the throughput, latency percentiles and
+error rate of every operation per arrival rate, so that the saturation point of a worker shows up here first.
+
+Arrivals are scheduled independently of the responses, and every latency is measured from the scheduled arrival,
+so a saturated server shows up as growing latencies instead of a silently lower request rate. Run it from
+`backend/` with the usual application environment loaded, either in-process against the ASGI app (which starts
+the app lifespan, i.e. against the configured database, or hermetically with `DB_STORAGE_ENGINE=memory`) or over
+HTTP against a running server:
+
+    python -m benchmarks.load_test benchmarks/scenarios/mixed.toml --output results.json
+    python -m benchmarks.load_test benchmarks/scenarios/mixed.toml --base-url http://localhost:8000 \\
+        --account alice:Pa55w0rd! --account bob:Pa55w0rd!
+
+Over HTTP, new accounts cannot be verified by e-mail, so `current-user` and `blog-write` use the `--account`
+credentials of already verified users.
+"""
+
+from argparse import ArgumentParser
+from asyncio import create_task, gather, run, sleep, Task, wait_for
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from itertools import count
+from json import dumps
+from os import cpu_count
+from pathlib import Path
+from platform import platform, python_version
+from random import choice, choices, expovariate
+from statistics import quantiles
+from time import perf_counter
+from tomllib import loads as load_toml
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from httpx import ASGITransport, AsyncClient, Response
+
+authenticated_operations: tuple[str, ...] = ("current-user", "blog-write")
+
+
+class LoadTestState:
+    """
+    The accounts, their access tokens and the blog ids that the operations of a load test draw from.
+    """
+
+    def __init__(self, client: AsyncClient, password: str) -> None:
+        self.client: AsyncClient = client
+        self.password: str = password
+        self.accounts: list[tuple[str, str]] = list()
+        self.access_tokens: list[str] = list()
+        self.blog_ids: list[str] = list()
+        self.sequence = count()
+
+    def build_cookies(self) -> dict[str, str]:
+        from src.config.manager import settings
+
+        return {settings.TOKEN_COOKIE_NAME: f"Bearer {choice(self.access_tokens)}"}
+
+    def next_username(self) -> str:
+        return f"load{uuid4().hex[:10]}{next(self.sequence)}"
+
+
+async def register_account(state: LoadTestState, username: str) -> Response:
+    return await state.client.post(
+        "/api/auth/registration",
+        json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": state.password,
+            "repeatedPassword": state.password,
+        },
+    )
+
+
+async def register(state: LoadTestState) -> Response:
+    return await register_account(state=state, username=state.next_username())
+
+
+async def login(state: LoadTestState) -> Response:
+    username, password = choice(state.accounts)
+    return await state.client.post("/api/auth/login", data={"username": username, "password": password})
+
+
+async def read_current_user(state: LoadTestState) -> Response:
+    return await state.client.get("/api/auth/current-user", cookies=state.build_cookies())
+
+
+async def write_blog(state: LoadTestState) -> Response:
+    response = await state.client.post(
+        "/api/blogs/write",
+        json={"title": f"Load test {next(state.sequence)}", "body": "Lorem ipsum dolor sit amet. " * 40},
+        cookies=state.build_cookies(),
+    )
+    if response.status_code == 201:
+        state.blog_ids.append(response.json()["id"])
+    return response
+
+
+async def list_blogs(state: LoadTestState) -> Response:
+    return await state.client.get("/api/blogs/")
+
+
+async def get_blog(state: LoadTestState) -> Response:
+    return await state.client.get(f"/api/blogs/{choice(state.blog_ids)}")
+
+
+operations: dict[str, Callable[[LoadTestState], Awaitable[Response]]] = {
+    "registration": register,
+    "login": login,
+    "current-user": read_current_user,
+    "blog-write": write_blog,
+    "blog-list": list_blogs,
+    "blog-get": get_blog,
+}
+
+
+async def seed_accounts(state: LoadTestState, accounts: list[tuple[str, str]], account_count: int) -> None:
+    """
+    Log in with the given accounts or, in-process, register and verify `account_count` new ones.
+    """
+    if not accounts:
+        from src.repository.crud.user import UserCRUDRepository
+
+        user_repo = UserCRUDRepository(collection_name="users")
+        for _ in range(account_count):
+            username = state.next_username()
+            response = await register_account(state=state, username=username)
+            response.raise_for_status()
+            db_user = await user_repo.collection.find_one({"username": username})  # type: ignore
+            await user_repo.read_user_in_email_verification(verification_code=db_user["emailVerificationCode"])
+            accounts.append((username, state.password))
+    for username, password in accounts:
+        response = await state.client.post("/api/auth/login", data={"username": username, "password": password})
+        if response.status_code == 202:
+            state.accounts.append((username, password))
+            state.access_tokens.append(response.json()["accessToken"])
+
+
+async def seed_blogs(state: LoadTestState, blog_count: int) -> None:
+    if state.access_tokens:
+        for _ in range(blog_count):
+            await write_blog(state=state)
+    if not state.blog_ids:
+        response = await state.client.get("/api/blogs/", params={"limit": 100})
+        state.blog_ids.extend(blog["id"] for blog in response.json().get("blogs", []))
+
+
+def summarize_stage(
+    records: dict[str, list[tuple[float, bool]]], dropped: dict[str, int], elapsed: float
+) -> dict[str, dict[str, float]]:
+    summary = dict()
+    for name in sorted(set(records) | set(dropped)):
+        latencies_ms = sorted(latency * 1000 for latency, _ in records.get(name, []))
+        errors = sum(not is_succeeded for _, is_succeeded in records.get(name, []))
+        completed = len(latencies_ms)
+        percentiles = quantiles(latencies_ms, n=100, method="inclusive") if completed > 1 else latencies_ms * 99
+        summary[name] = {
+            "requests": completed,
+            "rps": completed / elapsed,
+            "error_rate": (errors + dropped.get(name, 0)) / (completed + dropped.get(name, 0)),
+            "dropped": dropped.get(name, 0),
+            "p50_ms": percentiles[49] if completed else 0.0,
+            "p90_ms": percentiles[89] if completed else 0.0,
+            "p99_ms": percentiles[98] if completed else 0.0,
+            "max_ms": latencies_ms[-1] if completed else 0.0,
+        }
+    return summary
+
+
+async def run_stage(
+    state: LoadTestState,
+    weights: dict[str, float],
+    rate: float,
+    duration: float,
+    max_in_flight: int,
+    timeout: float,
+    is_poisson: bool,
+) -> dict[str, Any]:
+    """
+    Start operations at `rate` arrivals per second for `duration` seconds, whether or not the previous ones have
+    completed. Arrivals beyond `max_in_flight` outstanding requests are dropped and counted as errors.
+    """
+    records: dict[str, list[tuple[float, bool]]] = dict()
+    dropped: dict[str, int] = dict()
+    in_flight: set[Task] = set()
+    names, name_weights = list(weights), list(weights.values())
+
+    async def measure(name: str, scheduled_at: float) -> None:
+        try:
+            response = await wait_for(operations[name](state), timeout=timeout)
+            is_succeeded = response.status_code < 400
+        except Exception:
+            is_succeeded = False
+        records.setdefault(name, list()).append((perf_counter() - scheduled_at, is_succeeded))
+
+    started_at = perf_counter()
+    scheduled_at = started_at
+    while scheduled_at - started_at < duration:
+        delay = scheduled_at - perf_counter()
+        if delay > 0:
+            await sleep(delay)
+        name = choices(names, weights=name_weights)[0]
+        if len(in_flight) >= max_in_flight:
+            dropped[name] = dropped.get(name, 0) + 1
+        else:
+            task = create_task(measure(name=name, scheduled_at=scheduled_at))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        scheduled_at += expovariate(rate) if is_poisson else 1 / rate
+    if in_flight:
+        await gather(*in_flight)
+    elapsed = perf_counter() - started_at
+    operations_summary = summarize_stage(records=records, dropped=dropped, elapsed=elapsed)
+    total_requests = sum(summary["requests"] for summary in operations_summary.values())
+    total_failures = sum(
+        summary["error_rate"] * (summary["requests"] + summary["dropped"]) for summary in operations_summary.values()
+    )
+    total_arrivals = total_requests + sum(summary["dropped"] for summary in operations_summary.values())
+    return {
+        "rate": rate,
+        "rps": total_requests / elapsed,
+        "error_rate": total_failures / total_arrivals if total_arrivals else 0.0,
+        "p99_ms": max((summary["p99_ms"] for summary in operations_summary.values()), default=0.0),
+        "operations": operations_summary,
+    }
+
+
+def print_stage(stage: dict[str, Any]) -> None:
+    print(f"\nrate {stage['rate']:.1f}/s: {stage['rps']:.1f} rps, {stage['error_rate']:.2%} errors")
+    print(f"  {'operation':<14} {'rps':>8} {'errors':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, summary in stage["operations"].items():
+        print(
+            f"  {name:<14} {summary['rps']:>8.1f} {summary['error_rate']:>8.2%} {summary['p50_ms']:>9.1f}"
+            f" {summary['p90_ms']:>9.1f} {summary['p99_ms']:>9.1f} {summary['max_ms']:>9.1f}"
+        )
+
+
+async def run_scenario(
+    scenario: dict[str, Any], base_url: str | None, accounts: list[tuple[str, str]]
+) -> dict[str, Any]:
+    async with AsyncExitStack() as stack:
+        if base_url:
+            client = AsyncClient(base_url=base_url, timeout=scenario.get("timeout", 10.0))
+        else:
+            from asgi_lifespan import LifespanManager
+
+            from src.main import initialize_application
+
+            app = initialize_application()
+            await stack.enter_async_context(LifespanManager(app, startup_timeout=60))
+            client = AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
+        await stack.enter_async_context(client)
+        state = LoadTestState(client=client, password=scenario.get("password", "Load-Te5t-Pa55w0rd!"))
+        await seed_accounts(
+            state=state, accounts=list(accounts) if base_url else list(), account_count=scenario.get("accounts", 10)
+        )
+        await seed_blogs(state=state, blog_count=scenario.get("blogs", 50))
+        weights = dict(scenario["operations"])
+        for name in list(weights):
+            if name not in operations:
+                raise ValueError(f"Unknown operation `{name}`, expected one of {', '.join(operations)}!")
+            if (name in authenticated_operations or name == "login") and not state.access_tokens:
+                print(f"Skipping `{name}`: no account could log in")
+                del weights[name]
+            elif name == "blog-get" and not state.blog_ids:
+                print(f"Skipping `{name}`: there are no blogs to read")
+                del weights[name]
+        stages, saturation_rate = list(), None
+        slo = scenario.get("slo", dict())
+        for rate in scenario["rates"]:
+            stage = await run_stage(
+                state=state,
+                weights=weights,
+                rate=rate,
+                duration=scenario.get("duration", 30.0),
+                max_in_flight=scenario.get("max_in_flight", 1000),
+                timeout=scenario.get("timeout", 10.0),
+                is_poisson=scenario.get("arrival", "poisson") == "poisson",
+            )
+            stages.append(stage)
+            print_stage(stage=stage)
+            if saturation_rate is None and (
+                stage["p99_ms"] > slo.get("p99_ms", float("inf")) or stage["error_rate"] > slo.get("error_rate", 1.0)
+            ):
+                saturation_rate = rate
+    if saturation_rate is not None:
+        print(f"\nSaturated at {saturation_rate}/s (p99 > {slo.get('p99_ms')} ms or errors > {slo.get('error_rate')})")
+    return {
+        "benchmark": "load_test",
+        "scenario": scenario.get("name"),
+        "target": base_url or "in-process",
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "host": {"platform": platform(), "cpu_count": cpu_count(), "python_version": python_version()},
+        "saturation_rate": saturation_rate,
+        "stages": stages,
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Run an open-loop load test scenario against the API.")
+    parser.add_argument("scenario", type=Path, help="A TOML scenario file, see `benchmarks/scenarios/`")
+    parser.add_argument("--base-url", help="Load a running server over HTTP instead of the in-process ASGI app")
+    parser.add_argument("--account", action="append", default=list(), help="A verified `username:password`")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file")
+    arguments = parser.parse_args()
+
+    report = run(
+        run_scenario(
+            scenario=load_toml(arguments.scenario.read_text()),
+            base_url=arguments.base_url,
+            accounts=[tuple(account.split(":", 1)) for account in arguments.account],  # type: ignore
+        )
+    )
+    if arguments.output:
+        arguments.output.write_text(dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Benchmark `PasswordManager` end to end for every layer combination and hashing cost parameter set.
+
+Every measurement runs in a freshly spawned process whose environment carries the parameter set, so that the
+settings, the lru-cached hashing functions and the peak RSS are never shared between two measurements. Run it from
+`backend/` with the usual application environment loaded:
+
+    python -m benchmarks.password_hashing --output results.json
+    python -m benchmarks.password_hashing --layers a2:bc,bc:a2 --scaling --compare results.json
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import product
+from json import dumps, loads
+from multiprocessing import get_context
+from os import cpu_count, environ
+from pathlib import Path
+from platform import platform, processor, python_version
+from resource import getrusage, RUSAGE_SELF
+from statistics import mean, quantiles
+from sys import platform as sys_platform
+from time import perf_counter
+from typing import Any
+
+layer_algorithms: tuple[str, ...] = ("a2", "bc", "256", "512")
+
+parameter_sets: dict[str, dict[str, str]] = {
+    "configured": {},
+    "low": {"ARGON2_TIME_COST": "1", "ARGON2_MEMORY_COST": "16384", "ARGON2_PARALLELISM": "1", "BCRYPT_ROUNDS": "10"},
+    "high": {
+        "ARGON2_TIME_COST": "4",
+        "ARGON2_MEMORY_COST": "131072",
+        "ARGON2_PARALLELISM": "4",
+        "BCRYPT_ROUNDS": "13",
+    },
+}
+
+benchmark_password: str = "benchmark-Pa55w0rd!"
+
+
+def apply_parameter_set(parameters: dict[str, str]) -> None:
+    environ.update(parameters)
+
+
+def peak_rss_kib() -> int:
+    peak_rss = getrusage(RUSAGE_SELF).ru_maxrss
+    return peak_rss // 1024 if sys_platform == "darwin" else peak_rss
+
+
+def summarize_latencies(latencies_ms: list[float]) -> dict[str, float]:
+    percentiles = quantiles(latencies_ms, n=100, method="inclusive") if len(latencies_ms) > 1 else latencies_ms * 99
+    return {
+        "ops_per_second": len(latencies_ms) / (sum(latencies_ms) / 1000),
+        "mean_ms": mean(latencies_ms),
+        "p50_ms": percentiles[49],
+        "p99_ms": percentiles[98],
+    }
+
+
+def measure_layer_combination(layer_1_algorithm: str, layer_2_algorithm: str, iterations: int) -> dict[str, Any]:
+    """
+    Time registration (both layers hashed) and login (layer 2 verified) in this process, and report the peak RSS
+    growth of the process as the memory cost of a single hash. One untimed hash and verify run first, since
+    passlib and the algorithm backends are only imported on the first hash.
+    """
+    from src.services.security.password.manager import PasswordManager
+
+    manager = PasswordManager(layer_1_algorithm=layer_1_algorithm, layer_2_algorithm=layer_2_algorithm)
+    hashed_salt, hashed_password = manager.generate_double_layered_password(password=benchmark_password)
+    manager.is_hashed_password_verified(
+        hashed_salt=hashed_salt, password=benchmark_password, hashed_password=hashed_password
+    )
+    baseline_rss_kib = peak_rss_kib()
+    registration_ms, login_ms = list(), list()
+    for _ in range(iterations):
+        started_at = perf_counter()
+        hashed_salt, hashed_password = manager.generate_double_layered_password(password=benchmark_password)
+        registration_ms.append((perf_counter() - started_at) * 1000)
+        started_at = perf_counter()
+        is_verified = manager.is_hashed_password_verified(
+            hashed_salt=hashed_salt, password=benchmark_password, hashed_password=hashed_password
+        )
+        login_ms.append((perf_counter() - started_at) * 1000)
+        if not is_verified:
+            raise RuntimeError(f"Layers `{layer_1_algorithm}:{layer_2_algorithm}` failed to verify their own hash!")
+    return {
+        "registration": summarize_latencies(registration_ms),
+        "login": summarize_latencies(login_ms),
+        "peak_memory_per_hash_kib": peak_rss_kib() - baseline_rss_kib,
+    }
+
+
+def run_login_batch(layer_1_algorithm: str, layer_2_algorithm: str, iterations: int) -> int:
+    from src.services.security.password.manager import PasswordManager
+
+    manager = PasswordManager(layer_1_algorithm=layer_1_algorithm, layer_2_algorithm=layer_2_algorithm)
+    hashed_salt, hashed_password = manager.generate_double_layered_password(password=benchmark_password)
+    for _ in range(iterations):
+        manager.is_hashed_password_verified(
+            hashed_salt=hashed_salt, password=benchmark_password, hashed_password=hashed_password
+        )
+    return iterations
+
+
+def measure_scaling(
+    layer_1_algorithm: str,
+    layer_2_algorithm: str,
+    parameters: dict[str, str],
+    iterations: int,
+    worker_counts: list[int],
+) -> dict[str, float]:
+    """
+    Measure the aggregate login throughput with 1..N worker processes hashing concurrently, i.e. what a process
+    pool of that size can sustain on this host.
+    """
+    scaling = dict()
+    for worker_count in worker_counts:
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=get_context("spawn"),
+            initializer=apply_parameter_set,
+            initargs=(parameters,),
+        ) as executor:
+            list(executor.map(run_login_batch, [layer_1_algorithm], [layer_2_algorithm], [1]))
+            started_at = perf_counter()
+            completed = sum(
+                executor.map(
+                    run_login_batch,
+                    [layer_1_algorithm] * worker_count,
+                    [layer_2_algorithm] * worker_count,
+                    [iterations] * worker_count,
+                )
+            )
+            scaling[str(worker_count)] = completed / (perf_counter() - started_at)
+    return scaling
+
+
+def run_benchmarks(
+    layer_combinations: list[tuple[str, str]],
+    parameter_set_names: list[str],
+    iterations: int,
+    worker_counts: list[int] | None,
+) -> dict[str, Any]:
+    results = list()
+    for parameter_set_name in parameter_set_names:
+        parameters = parameter_sets[parameter_set_name]
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=get_context("spawn"),
+            initializer=apply_parameter_set,
+            initargs=(parameters,),
+            max_tasks_per_child=1,
+        ) as executor:
+            for layer_1_algorithm, layer_2_algorithm in layer_combinations:
+                result = executor.submit(
+                    measure_layer_combination, layer_1_algorithm, layer_2_algorithm, iterations
+                ).result()
+                if worker_counts:
+                    result["login_scaling_ops_per_second"] = measure_scaling(
+                        layer_1_algorithm=layer_1_algorithm,
+                        layer_2_algorithm=layer_2_algorithm,
+                        parameters=parameters,
+                        iterations=iterations,
+                        worker_counts=worker_counts,
+                    )
+                results.append(
+                    {
+                        "name": f"{parameter_set_name}/{layer_1_algorithm}:{layer_2_algorithm}",
+                        "parameter_set": parameter_set_name,
+                        "parameters": parameters,
+                        "layer_1_algorithm": layer_1_algorithm,
+                        "layer_2_algorithm": layer_2_algorithm,
+                        **result,
+                    }
+                )
+                print(
+                    f"{results[-1]['name']:<24} registration {result['registration']['ops_per_second']:>9.1f} ops/s"
+                    f"  login {result['login']['ops_per_second']:>9.1f} ops/s"
+                    f"  p99 {result['login']['p99_ms']:>8.2f} ms  memory {result['peak_memory_per_hash_kib']} KiB"
+                )
+    return {
+        "benchmark": "password_hashing",
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "host": {
+            "platform": platform(),
+            "processor": processor(),
+            "cpu_count": cpu_count(),
+            "python_version": python_version(),
+        },
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any]) -> None:
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    print(f"\n{'benchmark':<24} {'metric':<13} {'baseline':>10} {'current':>10} {'change':>8}")
+    for result in current["results"]:
+        if result["name"] not in baseline_results:
+            continue
+        for metric in ("registration", "login"):
+            before = baseline_results[result["name"]][metric]["ops_per_second"]
+            after = result[metric]["ops_per_second"]
+            print(f"{result['name']:<24} {metric:<13} {before:>10.1f} {after:>10.1f} {(after / before - 1):>+8.1%}")
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the double layered password hashing.")
+    parser.add_argument("--layers", help="Comma separated `layer1:layer2` pairs, all 16 combinations by default")
+    parser.add_argument("--parameter-sets", default=",".join(parameter_sets), help="Comma separated set names")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--scaling", action="store_true", help="Also measure login throughput with 1..N workers")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Compare against a previous JSON result file")
+    arguments = parser.parse_args()
+
+    layer_combinations = (
+        [tuple(pair.split(":")) for pair in arguments.layers.split(",")]
+        if arguments.layers
+        else list(product(layer_algorithms, repeat=2))
+    )
+    worker_counts = None
+    if arguments.scaling:
+        worker_counts = sorted({1, 2, 4, cpu_count() or 1} & set(range(1, (cpu_count() or 1) + 1)))
+    report = run_benchmarks(
+        layer_combinations=layer_combinations,  # type: ignore
+        parameter_set_names=arguments.parameter_sets.split(","),
+        iterations=arguments.iterations,
+        worker_counts=worker_counts,
+    )
+    if arguments.output:
+        arguments.output.write_text(dumps(report, indent=2))
+    if arguments.compare:
+        compare_results(baseline=loads(arguments.compare.read_text()), current=report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from time import perf_counter
+
+import_started_at: float = perf_counter()
@@ -0,0 +1,201 @@
+from asyncio import to_thread
+from gzip import compress as gzip_compress
+from typing import Callable
+from zlib import compressobj, DEFLATED, MAX_WBITS, Z_SYNC_FLUSH
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.manager import settings
+from src.services.cache.lru import cache_miss, TTLLRUCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+compressible_media_types: tuple[str, ...] = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    encodings = dict()
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            name, _, value = parameter.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        encodings[coding.strip().lower()] = quality
+    return encodings
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    """
+    Pick brotli over gzip whenever the client accepts both; `*` stands for every coding it did not list.
+    """
+    encodings = parse_accept_encoding(accept_encoding=accept_encoding)
+    wildcard = encodings.get("*", 0.0)
+    for encoding in ("br", "gzip") if brotli is not None else ("gzip",):
+        if encodings.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)  # type: ignore
+    return gzip_compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def build_stream_compressor(encoding: str) -> tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)  # type: ignore
+        return (lambda chunk: compressor.process(chunk) + compressor.flush(), compressor.finish)
+    compressor = compressobj(settings.COMPRESSION_GZIP_LEVEL, DEFLATED, MAX_WBITS | 16)
+    return (lambda chunk: compressor.compress(chunk) + compressor.flush(Z_SYNC_FLUSH), compressor.flush)
+
+
+def is_compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return "content-encoding" not in headers and content_type.startswith(compressible_media_types)
+
+
+def is_cacheable(scope: Scope, status_code: int, headers: Headers) -> bool:
+    return (
+        scope["method"] == "GET"
+        and status_code in (200, 202)
+        and "etag" in headers
+        and "no-store" not in headers.get("cache-control", "")
+    )
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip, depending on `Accept-Encoding`, once their body reaches
+    `minimum_size` bytes. Bodies of cacheable GET responses are compressed once and then served from
+    `compressed_response_cache`, keyed by their ETag and the encoding. Bodies of `offload_size` bytes and more are
+    compressed in a thread, so that they never block the event loop. Streamed responses are compressed chunk by
+    chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, offload_size: int, cache: TTLLRUCache) -> None:
+        self.app: ASGIApp = app
+        self.minimum_size: int = minimum_size
+        self.offload_size: int = offload_size
+        self.cache: TTLLRUCache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(accept_encoding=Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await CompressionResponder(middleware=self, scope=scope, send=send, encoding=encoding)(receive=receive)
+
+
+class CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, send: Send, encoding: str) -> None:
+        self.middleware: CompressionMiddleware = middleware
+        self.scope: Scope = scope
+        self.send: Send = send
+        self.encoding: str = encoding
+        self.start_message: Message | None = None
+        self.is_passed_through: bool = False
+        self.compress_chunk: Callable[[bytes], bytes] | None = None
+        self.finish_stream: Callable[[], bytes] | None = None
+
+    async def __call__(self, receive: Receive) -> None:
+        await self.middleware.app(self.scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.is_passed_through = not is_compressible(headers=headers)
+            if self.is_passed_through:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.is_passed_through:
+            await self.send(message)
+            return
+        body, more_body = message.get("body", b""), message.get("more_body", False)
+        if self.compress_chunk is not None:
+            compressed_chunk = self.compress_chunk(body) if body else b""
+            if not more_body:
+                compressed_chunk += self.finish_stream()  # type: ignore
+            await self.send({"type": "http.response.body", "body": compressed_chunk, "more_body": more_body})
+        elif more_body:
+            await self.start_stream(first_chunk=body)
+        else:
+            await self.send_whole(body=body)
+
+    def build_headers(self, content_length: int | None) -> MutableHeaders:
+        headers = MutableHeaders(raw=self.start_message["headers"])  # type: ignore
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers and not headers["etag"].startswith("W/"):
+            headers["ETag"] = "W/" + headers["etag"]
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        return headers
+
+    async def send_whole(self, body: bytes) -> None:
+        if len(body) < self.middleware.minimum_size:
+            await self.send(self.start_message)  # type: ignore
+            await self.send({"type": "http.response.body", "body": body})
+            return
+        status_code, headers = self.start_message["status"], Headers(raw=self.start_message["headers"])  # type: ignore
+        cache_key = None
+        if is_cacheable(scope=self.scope, status_code=status_code, headers=headers):
+            cache_key = (headers["etag"].removeprefix("W/"), self.encoding)
+            compressed_body = self.middleware.cache.get(key=cache_key)
+            if compressed_body is not cache_miss:
+                await self.send_compressed_body(compressed_body=compressed_body)
+                return
+        if len(body) >= self.middleware.offload_size:
+            compressed_body = await to_thread(compress_body, body, self.encoding)
+        else:
+            compressed_body = compress_body(body=body, encoding=self.encoding)
+        if cache_key is not None:
+            self.middleware.cache.set(key=cache_key, value=compressed_body)
+        await self.send_compressed_body(compressed_body=compressed_body)
+
+    async def send_compressed_body(self, compressed_body: bytes) -> None:
+        self.build_headers(content_length=len(compressed_body))
+        await self.send(self.start_message)  # type: ignore
+        await self.send({"type": "http.response.body", "body": compressed_body})
+
+    async def start_stream(self, first_chunk: bytes) -> None:
+        self.compress_chunk, self.finish_stream = build_stream_compressor(encoding=self.encoding)
+        self.build_headers(content_length=None)
+        await self.send(self.start_message)  # type: ignore
+        await self.send({"type": "http.response.body", "body": self.compress_chunk(first_chunk), "more_body": True})
+
+
+def get_compressed_response_cache() -> TTLLRUCache:
+    return TTLLRUCache(
+        name="compressed-responses",
+        max_size=settings.COMPRESSION_CACHE_MAX_SIZE,
+        ttl=settings.COMPRESSION_CACHE_TTL,
+        is_registered=True,
+    )
+
+
+compressed_response_cache = get_compressed_response_cache()
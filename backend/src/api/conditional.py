@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import sha256
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+from src.config.manager import settings
+
+
+def compute_etag(*parts: str | None) -> str:
+    """
+    Build a strong ETag from the parts that fully determine a representation, e.g. the document ids and versions
+    plus the requested fields, so that the ETag is known before the body is encoded.
+    """
+    return '"' + sha256("\x1f".join(part or "" for part in parts).encode()).hexdigest()[:32] + '"'
+
+
+def document_version(document: dict) -> str:
+    version = document.get("updatedAt") or document.get("createdAt")
+    return version.isoformat() if isinstance(version, datetime) else str(version)
+
+
+def document_last_modified(document: dict) -> datetime | None:
+    version = document.get("updatedAt") or document.get("createdAt")
+    if isinstance(version, str):
+        try:
+            version = datetime.fromisoformat(version.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(version, datetime):
+        return None
+    if version.tzinfo is None:
+        version = version.replace(tzinfo=timezone.utc)
+    return version.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def is_etag_matched(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    """
+    Evaluate `If-None-Match` and, only when it is absent, `If-Modified-Since` as RFC 9110 prescribes.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return is_etag_matched(if_none_match=if_none_match, etag=etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        modified_since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if modified_since.tzinfo is None:
+        modified_since = modified_since.replace(tzinfo=timezone.utc)
+    return last_modified <= modified_since
+
+
+def build_validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": settings.BLOG_CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def build_not_modified_response(etag: str, last_modified: datetime | None) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=build_validator_headers(etag=etag, last_modified=last_modified),
+    )
@@ -0,0 +1,24 @@
+from typing import AsyncIterator, Callable
+
+from src.services.admission.controller import AdmissionController
+from src.services.exceptions.custom import RequestAdmissionRejected
+from src.services.exceptions.http.exc_503 import http_exc_503_service_unavailable_request
+
+
+def get_admission(controller: AdmissionController, cost: int) -> Callable:
+    """
+    Build a dependency that admits the request into `controller` with the given cost for as long as the request is
+    handled, and answers 503 with `Retry-After` when the request is shed.
+    """
+
+    async def _get_admission() -> AsyncIterator[None]:
+        try:
+            await controller.acquire(cost=cost)
+        except RequestAdmissionRejected:
+            raise await http_exc_503_service_unavailable_request(retry_after=controller.retry_after)
+        try:
+            yield
+        finally:
+            controller.release(cost=cost)
+
+    return _get_admission
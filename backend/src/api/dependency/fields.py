@@ -0,0 +1,31 @@
+from typing import Callable
+
+from fastapi import HTTPException, Query, status
+
+from src.schema.base import snake_2_camel
+
+
+def get_fields(allowed_fields: list[str], default_fields: list[str] | None = None) -> Callable:
+    """
+    Build a dependency that parses the sparse fieldset `fields=` query parameter into snake_case field names.
+    Both the camelCase response aliases and the snake_case names are accepted.
+    """
+    field_names = {snake_2_camel(field): field for field in allowed_fields} | {
+        field: field for field in allowed_fields
+    }
+
+    def _get_fields(
+        fields: str | None = Query(default=None, description="Comma-separated list of the fields to return."),
+    ) -> list[str] | None:
+        if not fields:
+            return default_fields
+        requested_fields = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown_fields = [field for field in requested_fields if field not in field_names]
+        if unknown_fields:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown or forbidden fields `{', '.join(unknown_fields)}`!",
+            )
+        return list(dict.fromkeys(["id"] + [field_names[field] for field in requested_fields]))
+
+    return _get_fields
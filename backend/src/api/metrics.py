@@ -0,0 +1,68 @@
+from time import perf_counter
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.metrics.registry import (
+    http_request_duration,
+    http_request_size,
+    http_requests,
+    http_requests_in_progress,
+    http_response_size,
+)
+
+unmatched_route: str = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Record the latency, status code, in-flight count and body sizes of every HTTP request under its route
+    template, e.g. `/api/blogs/{blog_id}`, so that the label cardinality stays bounded by the number of routes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    def resolve_route(self, scope: Scope) -> str:
+        partially_matched_route = unmatched_route
+        for route in scope["app"].routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partially_matched_route == unmatched_route:
+                partially_matched_route = route.path
+        return partially_matched_route
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method, status_code, request_size, response_size = scope["method"], 500, 0, 0
+
+        async def receive_counted() -> Message:
+            nonlocal request_size
+            message = await receive()
+            request_size += len(message.get("body", b""))
+            return message
+
+        async def send_counted(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        route = self.resolve_route(scope=scope)
+        in_progress = http_requests_in_progress.labels(method=method, route=route)
+        in_progress.inc()
+        started_at = perf_counter()
+        try:
+            await self.app(scope, receive_counted, send_counted)
+        finally:
+            duration = perf_counter() - started_at
+            in_progress.dec()
+            http_requests.labels(method=method, route=route, status_code=str(status_code)).inc()
+            http_request_duration.labels(method=method, route=route).observe(duration)
+            http_request_size.labels(method=method, route=route).observe(request_size)
+            http_response_size.labels(method=method, route=route).observe(response_size)
@@ -0,0 +1,86 @@
+from typing import Any, AsyncIterable, AsyncIterator, Callable
+from zlib import compressobj, DEFLATED, MAX_WBITS
+
+from fastapi.responses import StreamingResponse
+from orjson import JSONDecodeError, loads
+
+from src.api.responses import dumps_json
+
+
+async def iterate_ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_length: int
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Split a streamed NDJSON body into its non-empty lines, numbered from 1, while holding at most one line in
+    memory. A line longer than `max_line_length` bytes is skipped and yielded as `None`.
+    """
+    buffer, line_number, is_oversized = b"", 0, False
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if is_oversized or len(line) > max_line_length:
+                is_oversized = False
+                yield (line_number, None)
+            elif line.strip():
+                yield (line_number, line)
+        if len(buffer) > max_line_length:
+            buffer, is_oversized = b"", True
+    if is_oversized or buffer.strip():
+        yield (line_number + 1, None if is_oversized else buffer)
+
+
+async def iterate_ndjson_rows(
+    chunks: AsyncIterator[bytes], max_line_length: int
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """
+    Decode every line of a streamed NDJSON body into a JSON object, or into the reason why it cannot be decoded.
+    """
+    async for line_number, line in iterate_ndjson_lines(chunks=chunks, max_line_length=max_line_length):
+        if line is None:
+            yield (line_number, f"Line is longer than {max_line_length} bytes!")
+            continue
+        try:
+            row = loads(line)
+        except JSONDecodeError:
+            yield (line_number, "Line is not valid JSON!")
+            continue
+        yield (line_number, row if isinstance(row, dict) else "Line is not a JSON object!")
+
+
+async def stream_ndjson(
+    documents: AsyncIterable[dict],
+    encode: Callable[[dict], dict[str, Any]],
+    chunk_size: int,
+    compression_level: int | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Encode documents into NDJSON lines and yield them in chunks of about `chunk_size` bytes, gzip-compressed as a
+    single stream when a `compression_level` is given. Only one chunk is held in memory at a time.
+    """
+    compressor = None if compression_level is None else compressobj(compression_level, DEFLATED, MAX_WBITS | 16)
+    lines, size = list(), 0
+    async for document in documents:
+        line = dumps_json(content=encode(document)) + b"\n"
+        lines.append(line)
+        size += len(line)
+        if size < chunk_size:
+            continue
+        chunk, lines, size = b"".join(lines), list(), 0
+        chunk = chunk if compressor is None else compressor.compress(chunk)
+        if chunk:
+            yield chunk
+    chunk = b"".join(lines)
+    if compressor is not None:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def build_ndjson_response(chunks: AsyncIterator[bytes], filename: str, is_gzipped: bool) -> StreamingResponse:
+    return StreamingResponse(
+        content=chunks,
+        media_type="application/gzip" if is_gzipped else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}.ndjson{".gz" if is_gzipped else ""}"'},
+    )
@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Any, Type
+
+from bson import ObjectId
+from fastapi.responses import Response
+from orjson import dumps, OPT_NAIVE_UTC, OPT_UTC_Z
+
+from src.schema.base import BaseSchema, snake_2_camel
+from src.services.metrics.timing import timed_span
+
+
+def normalize_iso_datetime(value: str) -> str:
+    """
+    Mirror `datetime_2_isoformat` on a datetime that is stored as an ISO string: the timezone is taken as UTC and
+    written as `Z`.
+    """
+    if value.endswith("Z"):
+        return value
+    if len(value) > 6 and value[-6] in "+-" and value[-3] == ":":
+        return value[:-6] + "Z"
+    return value + "Z"
+
+
+def encode_extra_types(value: Any) -> str:
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type `{type(value).__name__}` is not JSON serializable!")
+
+
+def dumps_json(content: Any) -> bytes:
+    return dumps(content, default=encode_extra_types, option=OPT_NAIVE_UTC | OPT_UTC_Z)
+
+
+class DocumentEncoder:
+    """
+    Encode trusted Mongo documents straight into the JSON shape of a response schema, i.e. its camelCase aliases
+    and the `BaseSchema.Config` encoders, without building and re-validating a pydantic model per document. The
+    documents were validated once when they were written, so reads only rename keys and normalise datetimes.
+    """
+
+    def __init__(self, schema: Type[BaseSchema], field_keys: dict[str, str]) -> None:
+        self.schema: Type[BaseSchema] = schema
+        self.plan: list[tuple[str, str, str, bool]] = [
+            (field, field_keys[field], model_field.alias, model_field.type_ is datetime)
+            for field, model_field in schema.__fields__.items()
+            if field in field_keys
+        ]
+
+    def encode(self, document: dict, fields: list[str] | None = None) -> dict[str, Any]:
+        encoded_document = dict()
+        for field, key, alias, is_datetime in self.plan:
+            if key not in document or (fields is not None and field not in fields):
+                continue
+            value = document[key]
+            if key == "_id":
+                value = str(value)
+            elif is_datetime and isinstance(value, str):
+                value = normalize_iso_datetime(value=value)
+            encoded_document[alias] = value
+        return encoded_document
+
+    def encode_page(
+        self, documents: list[dict], next_cursor: str | None, items_name: str, fields: list[str] | None = None
+    ) -> dict[str, Any]:
+        with timed_span(name="encode"):
+            return {
+                items_name: [self.encode(document=document, fields=fields) for document in documents],
+                snake_2_camel("next_cursor"): next_cursor,
+            }
+
+
+class TrustedJSONResponse(Response):
+    """
+    Render already encoded content with orjson. Routes return it directly, so FastAPI skips the `response_model`
+    validation and `jsonable_encoder`; the `response_model` is still declared for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        with timed_span(name="encode"):
+            return dumps_json(content=content)
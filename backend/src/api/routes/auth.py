@@ -6,10 +6,14 @@ from pydantic import EmailStr
 from pyotp import random_base32
 from pyotp.totp import TOTP
 
+from src.api.dependency.admission import get_admission
 from src.api.dependency.crud import get_crud
+from src.api.dependency.fields import get_fields
 from src.api.dependency.user import get_current_user
 from src.config.manager import settings
+from src.repository.crud.outbox import OutboxCRUDRepository
 from src.repository.crud.user import UserCRUDRepository
+from src.repository.serializers.user import user_public_fields
 from src.schema.email_verification import EmailVerificationResponse
 from src.schema.otp import (
     OTPDataDisableFeatureSchema,
@@ -23,16 +27,19 @@ from src.schema.otp import (
 )
 from src.schema.token import TokenResponseSchema
 from src.schema.user import (
-    UserBaseSchema,
     UserCreateSchema,
     UserLogoutResponseSchema,
     UserRegistrationResponseSchema,
     UserResponseSchema,
 )
+from src.services.admission.controller import hashing_admission_controller
+from src.services.exceptions.custom import PasswordHashingUnavailable
 from src.services.exceptions.http.exc_400 import http_exc_400_bad_request
+from src.services.exceptions.http.exc_503 import http_exc_503_service_unavailable_request
 from src.services.security.auth.email_verification import EmailService
 from src.services.security.auth.jwt.token import token_manager
 from src.services.security.auth.oauth2.scopes import cookie_scopes_keys
+from src.services.security.auth.principal import UserPrincipal
 from src.services.security.auth.token.registration import (
     generate_registration_token,
     generate_url_token,
@@ -48,11 +55,13 @@ router = APIRouter(prefix="/auth")
     name="auth:user-registration",
     response_model=UserRegistrationResponseSchema,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(get_admission(controller=hashing_admission_controller, cost=2))],
 )
 async def register_user(
     request: Request,
     payload: UserCreateSchema,
     user_repo: UserCRUDRepository = Depends(get_crud(repo_type=UserCRUDRepository, collection_name="users")),
+    outbox_repo: OutboxCRUDRepository = Depends(get_crud(repo_type=OutboxCRUDRepository, collection_name="outbox")),
 ) -> UserRegistrationResponseSchema:
     jsonified_user_data = jsonable_encoder(obj=payload)
 
@@ -77,12 +86,14 @@ async def register_user(
             username=new_user["username"],  # type: ignore
             url=generate_url_token(request=request, token=registration_token),
             emails=[EmailStr(new_user["email"])],
-        ).send_account_verification()
+        ).send_account_verification(outbox_repo=outbox_repo)
+    except PasswordHashingUnavailable:
+        raise await http_exc_503_service_unavailable_request()
     except Exception as err:
         print(err)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="There was an error sending the confirmation email",
+            detail="There was an error queueing the confirmation email",
         )
     registration_status = "success" if new_user else "failed"
     message = (
@@ -124,6 +135,7 @@ async def verify_user_email(
     name="auth:user-login",
     response_model=TokenResponseSchema,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(get_admission(controller=hashing_admission_controller, cost=1))],
 )
 async def login_user(
     response: Response,
@@ -133,6 +145,8 @@ async def login_user(
     jsonified_user_data = jsonable_encoder(obj=payload)
     try:
         db_user = await user_repo.read_user_in_login(user_data=jsonified_user_data)
+    except PasswordHashingUnavailable:
+        raise await http_exc_503_service_unavailable_request()
     except Exception:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect credentials!")
     if not db_user["is_verified"]:
@@ -157,15 +171,14 @@ async def login_user(
 )
 async def logout_account(
     response: Response,
-    current_user: UserBaseSchema = Security(get_current_user, scopes=cookie_scopes_keys),
+    current_user: UserPrincipal = Security(get_current_user, scopes=cookie_scopes_keys),
     user_repo: UserCRUDRepository = Depends(get_crud(repo_type=UserCRUDRepository, collection_name="users")),
 ) -> UserLogoutResponseSchema:
-    jsonified_current_user = jsonable_encoder(obj=current_user)
-    if not jsonified_current_user["isLoggedIn"]:
+    if not current_user.is_logged_in:
         raise Exception("You cannot logout when you haven't logged in! Please login.")
     if not current_user:
         raise await http_exc_400_bad_request()
-    logged_out_user = await user_repo.update_user_before_logout(id=jsonified_current_user["_id"])  # type: ignore
+    logged_out_user = await user_repo.update_user_before_logout(id=current_user.id)
     response.delete_cookie("access_token")
     return UserLogoutResponseSchema(is_logged_in=logged_out_user["is_logged_in"], is_otp_verified=logged_out_user["is_otp_verified"])  # type: ignore
 
@@ -175,12 +188,14 @@ async def logout_account(
     tags=["User Authentication"],
     name="home:current-user-retrieval",
     response_model=UserResponseSchema,
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
 )
 async def get_auth_account(
-    current_user: UserBaseSchema = Security(get_current_user, scopes=[cookie_scopes_keys[0]])
+    fields: list[str] = Depends(get_fields(allowed_fields=user_public_fields, default_fields=user_public_fields)),
+    current_user: UserPrincipal = Security(get_current_user, scopes=[cookie_scopes_keys[0]]),
 ) -> UserResponseSchema:
-    return UserResponseSchema(**current_user.dict())  # type: ignore
+    return UserResponseSchema(**current_user.dict(include=set(fields)))  # type: ignore
 
 
 @router.post(
@@ -1,16 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Security, status
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
+from src.api.conditional import (
+    build_not_modified_response,
+    build_validator_headers,
+    compute_etag,
+    document_last_modified,
+    document_version,
+    is_not_modified,
+)
 from src.api.dependency.crud import get_crud
+from src.api.dependency.fields import get_fields
 from src.api.dependency.user import get_current_user
+from src.api.ndjson import build_ndjson_response, iterate_ndjson_rows, stream_ndjson
+from src.api.responses import DocumentEncoder, TrustedJSONResponse
+from src.config.manager import settings
 from src.repository.crud.blog import BlogCRUDRepository
-from src.schema.blog import BlogCreateSchema, BlogDeletionResponseSchema, BlogResponseSchema, BlogsResponseSchema
-from src.schema.user import UserBaseSchema
+from src.repository.serializers.blog import blog_fields
+from src.schema.blog import (
+    BlogCreateSchema,
+    BlogDeletionResponseSchema,
+    BlogImportErrorSchema,
+    BlogImportResponseSchema,
+    BlogResponseSchema,
+    BlogSearchResponseSchema,
+    BlogSearchResultSchema,
+    BlogsResponseSchema,
+)
 from src.services.exceptions.http.exc_400 import http_exc_400_bad_request
 from src.services.exceptions.http.exc_401 import http_exc_401_unauthorized_request
 from src.services.security.auth.oauth2.scopes import cookie_scopes_keys
+from src.services.security.auth.principal import UserPrincipal
 
 router = APIRouter(prefix="/blogs", tags=["Blog"])
+blog_encoder = DocumentEncoder(schema=BlogResponseSchema, field_keys=blog_fields)
 
 
 @router.post(
@@ -21,15 +45,14 @@ router = APIRouter(prefix="/blogs", tags=["Blog"])
 )
 async def write_blog(
     payload: BlogCreateSchema,
-    current_user: UserBaseSchema = Security(get_current_user, scopes=[cookie_scopes_keys[3]]),
+    current_user: UserPrincipal = Security(get_current_user, scopes=[cookie_scopes_keys[3]]),
     blog_repo: BlogCRUDRepository = Depends(get_crud(repo_type=BlogCRUDRepository, collection_name="blogs")),
 ) -> BlogResponseSchema:
     if not current_user:
         raise await http_exc_400_bad_request()
     jsonified_blog_data = jsonable_encoder(obj=payload)
-    jsonified_current_user_data = jsonable_encoder(obj=current_user)
-    jsonified_blog_data["authorName"] = jsonified_current_user_data["username"]
-    jsonified_blog_data["authorId"] = jsonified_current_user_data["_id"]
+    jsonified_blog_data["authorName"] = current_user.username
+    jsonified_blog_data["authorId"] = current_user.id
     try:
         new_blog = await blog_repo.create_blog(blog_data=jsonified_blog_data)
     except Exception:
@@ -37,41 +60,146 @@ async def write_blog(
     return BlogResponseSchema(**new_blog)  # type: ignore
 
 
+@router.post(
+    path="/import",
+    name="blog:blogs-import",
+    response_model=BlogImportResponseSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def import_blogs(
+    request: Request,
+    current_user: UserPrincipal = Security(get_current_user, scopes=[cookie_scopes_keys[3]]),
+    blog_repo: BlogCRUDRepository = Depends(get_crud(repo_type=BlogCRUDRepository, collection_name="blogs")),
+) -> BlogImportResponseSchema:
+    if not current_user:
+        raise await http_exc_400_bad_request()
+    inserted_count, failed_count, errors = await blog_repo.import_blogs(
+        rows=iterate_ndjson_rows(chunks=request.stream(), max_line_length=settings.BLOG_IMPORT_MAX_LINE_LENGTH),
+        author_name=current_user.username,
+        author_id=current_user.id,
+    )
+    return BlogImportResponseSchema(
+        inserted_count=inserted_count,
+        failed_count=failed_count,
+        errors=[BlogImportErrorSchema(line=line, detail=detail) for line, detail in errors],
+    )
+
+
 @router.get(
     path="/",
     name="blog:blogs-retrieval",
-    response_model=list[BlogResponseSchema],
+    response_model=BlogsResponseSchema,
+    response_model_exclude_unset=True,
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def get_all_blogs(
+    request: Request,
+    limit: int = Query(default=settings.PAGINATION_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    cursor: str | None = Query(default=None),
+    fields: list[str] | None = Depends(get_fields(allowed_fields=list(blog_fields))),
     blog_repo: BlogCRUDRepository = Depends(get_crud(repo_type=BlogCRUDRepository, collection_name="blogs")),
-) -> list[BlogResponseSchema]:
+) -> Response:
     try:
-        db_blogs = await blog_repo.read_all()
+        db_blogs, next_cursor = await blog_repo.read_all_documents(limit=limit, cursor=cursor, fields=fields)
     except Exception:
         raise await http_exc_400_bad_request()
-    blogs = list()
-    for db_blog in db_blogs:
-        blog = BlogResponseSchema(**db_blog)  # type: ignore
-        blogs.append(blog)
-    return blogs
+    # A page is validated by its ETag only: deleting one of its blogs does not move its latest `createdAt`, so a
+    # `Last-Modified` date would let `If-Modified-Since` keep serving the stale page.
+    etag = compute_etag(
+        "blogs",
+        ",".join(fields or []),
+        next_cursor,
+        *(f"{db_blog['_id']}@{document_version(document=db_blog)}" for db_blog in db_blogs),
+    )
+    if is_not_modified(request=request, etag=etag, last_modified=None):
+        return build_not_modified_response(etag=etag, last_modified=None)
+    return TrustedJSONResponse(
+        content=blog_encoder.encode_page(
+            documents=db_blogs, next_cursor=next_cursor, items_name="blogs", fields=fields
+        ),
+        status_code=status.HTTP_202_ACCEPTED,
+        headers=build_validator_headers(etag=etag, last_modified=None),
+    )
+
+
+@router.get(
+    path="/export",
+    name="blog:blogs-export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_blogs(
+    cursor: str | None = Query(default=None),
+    is_gzipped: bool = Query(default=False, alias="gzip"),
+    current_user: UserPrincipal = Security(get_current_user),
+    blog_repo: BlogCRUDRepository = Depends(get_crud(repo_type=BlogCRUDRepository, collection_name="blogs")),
+) -> StreamingResponse:
+    if not current_user:
+        raise await http_exc_400_bad_request()
+    try:
+        db_cursor = blog_repo.export_documents(cursor=cursor)
+    except ValueError:
+        raise await http_exc_400_bad_request()
+    chunks = stream_ndjson(
+        documents=db_cursor,
+        encode=blog_encoder.encode,
+        chunk_size=settings.EXPORT_CHUNK_SIZE,
+        compression_level=settings.COMPRESSION_GZIP_LEVEL if is_gzipped else None,
+    )
+    return build_ndjson_response(chunks=chunks, filename="blogs", is_gzipped=is_gzipped)
+
+
+@router.get(
+    path="/search",
+    name="blog:blog-search",
+    response_model=BlogSearchResponseSchema,
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_200_OK,
+)
+async def search_blogs(
+    q: str = Query(min_length=1, max_length=settings.BLOG_SEARCH_MAX_QUERY_LENGTH),
+    limit: int = Query(default=settings.PAGINATION_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    cursor: str | None = Query(default=None),
+    blog_repo: BlogCRUDRepository = Depends(get_crud(repo_type=BlogCRUDRepository, collection_name="blogs")),
+) -> BlogSearchResponseSchema:
+    if not q.strip():
+        raise await http_exc_400_bad_request()
+    try:
+        search_results, next_cursor = await blog_repo.search_blogs(query=q, limit=limit, cursor=cursor)
+    except Exception:
+        raise await http_exc_400_bad_request()
+    return BlogSearchResponseSchema(
+        results=[BlogSearchResultSchema(**search_result) for search_result in search_results],  # type: ignore
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
     path="/{blog_id}",
     name="blog:blog-retrieval",
     response_model=BlogResponseSchema,
+    response_model_exclude_unset=True,
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def get_blog(
+    request: Request,
     blog_id: str,
+    fields: list[str] | None = Depends(get_fields(allowed_fields=list(blog_fields))),
     blog_repo: BlogCRUDRepository = Depends(get_crud(repo_type=BlogCRUDRepository, collection_name="blogs")),
-) -> BlogResponseSchema:
+) -> Response:
     try:
-        db_blog = await blog_repo.read_blog_by_id(id=blog_id)
+        db_blog = await blog_repo.read_blog_document_by_id(id=blog_id, fields=fields)
     except Exception:
         raise await http_exc_400_bad_request()
-    return BlogResponseSchema(**db_blog)  # type: ignore
+    etag = compute_etag("blog", ",".join(fields or []), f"{db_blog['_id']}@{document_version(document=db_blog)}")
+    last_modified = document_last_modified(document=db_blog)
+    if is_not_modified(request=request, etag=etag, last_modified=last_modified):
+        return build_not_modified_response(etag=etag, last_modified=last_modified)
+    return TrustedJSONResponse(
+        content=blog_encoder.encode(document=db_blog, fields=fields),
+        status_code=status.HTTP_202_ACCEPTED,
+        headers=build_validator_headers(etag=etag, last_modified=last_modified),
+    )
 
 
 @router.delete(
@@ -82,19 +210,15 @@ async def get_blog(
 )
 async def delete_blog(
     blog_id: str,
-    current_user: UserBaseSchema = Security(get_current_user, scopes=[cookie_scopes_keys[5]]),
+    current_user: UserPrincipal = Security(get_current_user, scopes=[cookie_scopes_keys[5]]),
     blog_repo: BlogCRUDRepository = Depends(get_crud(repo_type=BlogCRUDRepository, collection_name="blogs")),
 ) -> BlogDeletionResponseSchema:
     if not current_user:
         raise await http_exc_400_bad_request()
     try:
-        db_blog = await blog_repo.read_blog_by_id(id=blog_id)
-    except Exception:
-        raise await http_exc_400_bad_request()
-    if db_blog["author_id"] != str(current_user.id):
-        raise await http_exc_401_unauthorized_request()
-    try:
-        is_blog_deleted = await blog_repo.delete_blog_by_id(id=db_blog["id"])  # type: ignore
+        is_blog_deleted = await blog_repo.delete_blog_by_id(id=blog_id, author_id=current_user.id)
     except Exception:
+        if await blog_repo.is_blog_existing(id=blog_id):
+            raise await http_exc_401_unauthorized_request()
         raise await http_exc_400_bad_request()
     return BlogDeletionResponseSchema(is_blog_deleted=is_blog_deleted)
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Response, status
+
+from src.services.metrics.registry import render_metrics
+
+router = APIRouter(tags=["System"])
+
+
+@router.get(
+    path="/metrics",
+    name="system:metrics",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def get_metrics() -> Response:
+    content, media_type = render_metrics()
+    return Response(content=content, headers={"Content-Type": media_type})
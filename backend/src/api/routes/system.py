@@ -0,0 +1,74 @@
+from fastapi import APIRouter, status
+
+from src.repository.database import db_manager
+from src.schema.system import (
+    AdmissionStatisticsSchema,
+    CacheStatisticsSchema,
+    DatabasePoolStatisticsSchema,
+    PasswordHashingStatisticsSchema,
+    StartupReportSchema,
+)
+from src.services.admission.controller import hashing_admission_controller
+from src.services.cache.lru import registered_caches
+from src.services.metrics.startup import startup_report
+from src.services.security.password.service import pwd_hashing_service
+
+router = APIRouter(prefix="/system", tags=["System"])
+
+
+@router.get(
+    path="/database",
+    name="system:database-pool-statistics",
+    response_model=DatabasePoolStatisticsSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_database_pool_statistics() -> DatabasePoolStatisticsSchema:
+    return DatabasePoolStatisticsSchema.parse_obj(db_manager.pool_statistics)
+
+
+@router.get(
+    path="/caches",
+    name="system:cache-statistics",
+    response_model=list[CacheStatisticsSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_cache_statistics() -> list[CacheStatisticsSchema]:
+    return [CacheStatisticsSchema(**cache.statistics) for cache in registered_caches.values()]  # type: ignore
+
+
+@router.get(
+    path="/password-hashing",
+    name="system:password-hashing-statistics",
+    response_model=PasswordHashingStatisticsSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_password_hashing_statistics() -> PasswordHashingStatisticsSchema:
+    return PasswordHashingStatisticsSchema.parse_obj(pwd_hashing_service.statistics)
+
+
+@router.get(
+    path="/admission",
+    name="system:admission-statistics",
+    response_model=AdmissionStatisticsSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_admission_statistics() -> AdmissionStatisticsSchema:
+    return AdmissionStatisticsSchema.parse_obj(hashing_admission_controller.statistics)
+
+
+@router.get(
+    path="/startup",
+    name="system:startup-report",
+    response_model=StartupReportSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_startup_report() -> StartupReportSchema:
+    return StartupReportSchema(
+        import_ms=startup_report.import_ms,
+        import_budget_ms=startup_report.import_budget_ms,
+        startup_ms=startup_report.startup_ms,
+        startup_budget_ms=startup_report.startup_budget_ms,
+        steps_ms=dict(startup_report.step_durations_ms),
+        budget_overruns=startup_report.budget_overruns,
+        loaded_lazy_modules=startup_report.loaded_lazy_modules,
+    )
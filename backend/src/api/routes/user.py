@@ -1,34 +1,75 @@
-from fastapi import APIRouter, Depends, Security, status
+from fastapi import APIRouter, Depends, Query, Security, status
+from fastapi.responses import StreamingResponse
 
 from src.api.dependency.crud import get_crud
+from src.api.dependency.fields import get_fields
 from src.api.dependency.user import get_current_user
+from src.api.ndjson import build_ndjson_response, stream_ndjson
+from src.api.responses import DocumentEncoder, TrustedJSONResponse
+from src.config.manager import settings
 from src.repository.crud.user import UserCRUDRepository
-from src.schema.user import UserBaseSchema, UserDeletionResponseSchema, UserResponseSchema
+from src.repository.serializers.user import user_fields, user_public_fields
+from src.schema.user import UserDeletionResponseSchema, UserResponseSchema, UsersResponseSchema
 from src.services.exceptions.http.exc_400 import http_exc_400_bad_request
 from src.services.exceptions.http.exc_401 import http_exc_401_unauthorized_request
 from src.services.security.auth.oauth2.scopes import cookie_scopes_keys
+from src.services.security.auth.principal import UserPrincipal
 
 router = APIRouter(prefix="/users", tags=["User"])
+user_encoder = DocumentEncoder(
+    schema=UserResponseSchema, field_keys={field: user_fields[field] for field in user_public_fields}
+)
 
 
 @router.get(
     path="/",
     name="user:users",
-    response_model=list[UserResponseSchema],
+    response_model=UsersResponseSchema,
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
 )
 async def get_all_users(
+    limit: int = Query(default=settings.PAGINATION_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    cursor: str | None = Query(default=None),
+    fields: list[str] = Depends(get_fields(allowed_fields=user_public_fields, default_fields=user_public_fields)),
     user_repo: UserCRUDRepository = Depends(get_crud(repo_type=UserCRUDRepository, collection_name="users")),
-) -> list[UserResponseSchema]:
+) -> TrustedJSONResponse:
     try:
-        db_users = await user_repo.read_all()
+        db_users, next_cursor = await user_repo.read_all_documents(limit=limit, cursor=cursor, fields=fields)
     except Exception:
         raise await http_exc_400_bad_request()
-    users = list()
-    for db_user in db_users:
-        user = UserResponseSchema(**db_user)  # type: ignore
-        users.append(user)
-    return users
+    return TrustedJSONResponse(
+        content=user_encoder.encode_page(
+            documents=db_users, next_cursor=next_cursor, items_name="users", fields=fields
+        )
+    )
+
+
+@router.get(
+    path="/export",
+    name="user:users-export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_users(
+    cursor: str | None = Query(default=None),
+    is_gzipped: bool = Query(default=False, alias="gzip"),
+    current_user: UserPrincipal = Security(get_current_user),
+    user_repo: UserCRUDRepository = Depends(get_crud(repo_type=UserCRUDRepository, collection_name="users")),
+) -> StreamingResponse:
+    if not current_user:
+        raise await http_exc_400_bad_request()
+    try:
+        db_cursor = user_repo.export_documents(cursor=cursor)
+    except ValueError:
+        raise await http_exc_400_bad_request()
+    chunks = stream_ndjson(
+        documents=db_cursor,
+        encode=user_encoder.encode,
+        chunk_size=settings.EXPORT_CHUNK_SIZE,
+        compression_level=settings.COMPRESSION_GZIP_LEVEL if is_gzipped else None,
+    )
+    return build_ndjson_response(chunks=chunks, filename="users", is_gzipped=is_gzipped)
 
 
 @router.delete(
@@ -39,17 +80,13 @@ async def get_all_users(
 )
 async def delete_blog(
     user_id: str,
-    current_user: UserBaseSchema = Security(get_current_user, scopes=[cookie_scopes_keys[5]]),
+    current_user: UserPrincipal = Security(get_current_user, scopes=[cookie_scopes_keys[5]]),
     user_repo: UserCRUDRepository = Depends(get_crud(repo_type=UserCRUDRepository, collection_name="users")),
 ) -> UserDeletionResponseSchema:
     if not current_user:
         raise await http_exc_400_bad_request()
     try:
-        db_user = await user_repo.read_user_by_id(id=user_id)
+        is_user_deleted = await user_repo.delete_user_by_id(id=user_id)
     except Exception:
         raise await http_exc_401_unauthorized_request()
-    try:
-        is_user_deleted = await user_repo.delete_user_by_id(id=db_user["id"])  # type: ignore
-    except Exception:
-        raise await http_exc_400_bad_request()
     return UserDeletionResponseSchema(is_user_deleted=is_user_deleted)
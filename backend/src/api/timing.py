@@ -0,0 +1,46 @@
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.metrics.timing import request_timings, RequestTimings
+
+
+class ServerTimingMiddleware:
+    """
+    Open a `RequestTimings` for every HTTP request, which the spans of the repositories, the password hashing, the
+    JWT handling, the email rendering and the response encoding add up to, and send it back as a `Server-Timing`
+    header. With `is_logged` every request also writes its timings as a structured log line.
+
+    The responses under `total_only_path_prefixes` only carry the total, e.g. on the authentication routes, where
+    a `hash` span would otherwise tell apart the logins of existing and unknown accounts.
+    """
+
+    def __init__(self, app: ASGIApp, is_logged: bool, total_only_path_prefixes: tuple[str, ...] = ()) -> None:
+        self.app: ASGIApp = app
+        self.is_logged: bool = is_logged
+        self.total_only_path_prefixes: tuple[str, ...] = total_only_path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        status_code = 500
+        is_total_only = scope["path"].startswith(self.total_only_path_prefixes)
+
+        async def send_timed(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timings.to_header(is_total_only=is_total_only))
+            await send(message)
+
+        context_token = request_timings.set(timings)
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            request_timings.reset(context_token)
+            if self.is_logged:
+                logger.bind(server_timing=timings.statistics).info(
+                    f"Server-Timing --- {scope['method']} {scope['path']} {status_code}: {timings.to_header()}"
+                )
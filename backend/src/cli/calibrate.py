@@ -0,0 +1,34 @@
+"""
+Calibrate the password hashing costs to a latency budget on the current host and print them as settings.
+
+    python -m src.cli.calibrate --target-ms 250
+"""
+
+from argparse import ArgumentParser
+
+from src.config.manager import settings
+from src.services.security.password.calibration import calibrate_argon2, calibrate_bcrypt
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Calibrate the Argon2 and BCrypt costs to a per-hash latency budget.")
+    parser.add_argument("--target-ms", type=float, default=settings.PASSWORD_HASHING_TARGET_MS)
+    parser.add_argument("--memory-cost", type=int, default=settings.ARGON2_MEMORY_COST, help="Argon2 memory in KiB")
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM)
+    parser.add_argument("--samples", type=int, default=3)
+    arguments = parser.parse_args()
+
+    argon2_costs, argon2_latency_ms = calibrate_argon2(
+        target_ms=arguments.target_ms,
+        memory_cost=arguments.memory_cost,
+        parallelism=arguments.parallelism,
+        samples=arguments.samples,
+    )
+    bcrypt_costs, bcrypt_latency_ms = calibrate_bcrypt(target_ms=arguments.target_ms, samples=arguments.samples)
+    print(f"# Argon2: {argon2_latency_ms:.1f} ms per hash, BCrypt: {bcrypt_latency_ms:.1f} ms per hash")
+    for name, value in {**argon2_costs, **bcrypt_costs}.items():
+        print(f"{name}={value}")
+
+
+if __name__ == "__main__":
+    main()
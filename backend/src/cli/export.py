@@ -0,0 +1,130 @@
+"""
+Export the blogs or the public user data as NDJSON, optionally gzip-compressed, in constant memory.
+
+    python -m src.cli.export blogs --output blogs.ndjson.gz
+    python -m src.cli.export users --output users.ndjson --resume
+
+With `--resume` an interrupted export continues after the last complete line of the existing output. Gzip output
+is written as one gzip member per chunk, so that an interrupted export loses at most its last chunk.
+"""
+
+from argparse import ArgumentParser
+from asyncio import run
+from gzip import compress as gzip_compress
+from pathlib import Path
+from zlib import decompressobj, error as ZlibError, MAX_WBITS
+
+from orjson import loads
+
+from src.api.ndjson import stream_ndjson
+from src.api.responses import DocumentEncoder
+from src.api.routes.blog import blog_encoder
+from src.api.routes.user import user_encoder
+from src.config.manager import settings
+from src.repository.crud.blog import BlogCRUDRepository
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.database import db_manager
+from src.repository.pagination import encode_cursor
+
+exporters: dict[str, tuple[type[BlogCRUDRepository] | type[UserCRUDRepository], DocumentEncoder]] = {
+    "blogs": (BlogCRUDRepository, blog_encoder),
+    "users": (UserCRUDRepository, user_encoder),
+}
+
+
+def find_plain_resume_point(path: Path) -> tuple[int, bytes | None]:
+    offset, last_line = 0, None
+    with path.open("rb") as output:
+        for line in output:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            last_line = line
+    return (offset, last_line)
+
+
+def find_gzip_resume_point(path: Path) -> tuple[int, bytes | None]:
+    """
+    Walk the gzip members of an export and return the offset after the last complete member with its last line.
+    """
+    offset, consumed, last_line = 0, 0, None
+    decompressor, member = decompressobj(MAX_WBITS | 16), b""
+    with path.open("rb") as output:
+        while block := output.read(settings.EXPORT_CHUNK_SIZE):
+            while block:
+                try:
+                    member += decompressor.decompress(block)
+                except ZlibError:
+                    return (offset, last_line)
+                if not decompressor.eof:
+                    consumed += len(block)
+                    break
+                consumed += len(block) - len(decompressor.unused_data)
+                block = decompressor.unused_data
+                offset = consumed
+                last_line = member.rstrip(b"\n").rsplit(b"\n", 1)[-1] + b"\n" if member else last_line
+                decompressor, member = decompressobj(MAX_WBITS | 16), b""
+    return (offset, last_line)
+
+
+def build_resume_cursor(line: bytes) -> str:
+    """
+    Rebuild the pagination cursor of an exported line like `paginate` does, from its `createdAt` as it is stored,
+    so that the documents sharing the `createdAt` of the line but not yet exported are not skipped.
+    """
+    document = loads(line)
+    return encode_cursor(created_at=document["createdAt"], id=document["id"])
+
+
+async def export_collection(
+    collection_name: str, output: Path, cursor: str | None, is_gzipped: bool, is_resumed: bool
+) -> int:
+    offset = 0
+    if is_resumed and output.exists():
+        find_resume_point = find_gzip_resume_point if is_gzipped else find_plain_resume_point
+        offset, last_line = find_resume_point(path=output)
+        if last_line is not None:
+            cursor = build_resume_cursor(line=last_line)
+    repo_type, encoder = exporters[collection_name]
+    db_manager.connect()
+    try:
+        db_cursor = repo_type(collection_name=collection_name).export_documents(cursor=cursor)
+        exported_bytes = 0
+        with output.open("r+b" if offset else "wb") as file:
+            file.truncate(offset)
+            file.seek(offset)
+            async for chunk in stream_ndjson(
+                documents=db_cursor, encode=encoder.encode, chunk_size=settings.EXPORT_CHUNK_SIZE
+            ):
+                exported_bytes += len(chunk)
+                file.write(
+                    gzip_compress(chunk, compresslevel=settings.COMPRESSION_GZIP_LEVEL) if is_gzipped else chunk
+                )
+                file.flush()
+    finally:
+        db_manager.disconnect()
+    return exported_bytes
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Export a collection as NDJSON.")
+    parser.add_argument("collection", choices=list(exporters))
+    parser.add_argument("--output", type=Path, required=True, help="A `.gz` suffix gzip-compresses the export")
+    parser.add_argument("--cursor", help="Start after this pagination cursor")
+    parser.add_argument("--resume", action="store_true", help="Continue after the last line of the existing output")
+    arguments = parser.parse_args()
+
+    exported_bytes = run(
+        export_collection(
+            collection_name=arguments.collection,
+            output=arguments.output,
+            cursor=arguments.cursor,
+            is_gzipped=arguments.output.suffix == ".gz",
+            is_resumed=arguments.resume,
+        )
+    )
+    print(f"Exported {exported_bytes} bytes of NDJSON `{arguments.collection}` to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
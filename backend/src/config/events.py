@@ -1,18 +1,82 @@
+from asyncio import create_task, to_thread
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from loguru import logger
 
 from src.repository.events import shutdown_db_event_manager, startup_db_event_manager
+from src.services.email.outbox import outbox_worker
+from src.services.email.templates import email_template_renderer
+from src.services.metrics.registry import mark_worker_stopped
+from src.services.metrics.startup import startup_report
+from src.services.security.password.service import pwd_hashing_service
+
+
+def start_password_hashing_pool() -> None:
+    pwd_hashing_service.start()
+    logger.info(f"Password Hashing Pool --- {pwd_hashing_service.max_workers} Worker Processes Started!")
+
+
+def stop_password_hashing_pool() -> None:
+    logger.info(f"Password Hashing Pool --- {pwd_hashing_service.statistics}")
+    pwd_hashing_service.shutdown()
+    logger.info("Password Hashing Pool --- Successfully Stopped!")
+
+
+async def warm_up_email_templates() -> None:
+    """
+    Compile the email templates in a thread once the application is up, so that neither the startup nor the first
+    registration waits for Jinja to load.
+    """
+    try:
+        await to_thread(email_template_renderer.warm_up)
+    except Exception as err:
+        logger.warning(f"Email Templates --- Warm-Up Failed: {err}")
+    else:
+        logger.info(
+            f"Email Templates --- {len(email_template_renderer.environment.list_templates())} Templates Compiled!"
+        )
+
+
+def start_outbox_worker() -> None:
+    outbox_worker.start()
+    logger.info("Email Outbox Worker --- Successfully Started!")
+
+
+async def stop_outbox_worker() -> None:
+    logger.info(f"Email Outbox Worker --- SMTP {outbox_worker.smtp_pool.statistics}")
+    await outbox_worker.stop()
+    logger.info("Email Outbox Worker --- Successfully Stopped!")
+
+
+def log_startup_report() -> None:
+    logger.info(f"Startup Budget --- {startup_report.statistics}")
+    for budget_overrun in startup_report.budget_overruns:
+        logger.warning(f"Startup Budget --- Exceeded: {budget_overrun}")
+
+
+def stop_metrics() -> None:
+    mark_worker_stopped()
+    logger.info("Metrics --- Worker Samples Successfully Released!")
 
 
 @asynccontextmanager
 async def event_manager(app: FastAPI):
     logger.info(f"Welcome to Pala Blog Application version {app.version} -- Starting . . .")
     await startup_db_event_manager()
+    with startup_report.measure(step="password-hashing-pool"):
+        start_password_hashing_pool()
+    with startup_report.measure(step="email-outbox"):
+        start_outbox_worker()
     logger.info(f"Pala Blog Application version {app.version} -- Application Successfully Started!")
+    log_startup_report()
+    email_templates_warm_up = create_task(warm_up_email_templates())
     yield
+    await email_templates_warm_up
+    stop_password_hashing_pool()
+    await stop_outbox_worker()
     await shutdown_db_event_manager()
+    stop_metrics()
     logger.info(f"Pala Blog Application version {app.version} -- Shutting Down . . .")
     logger.info(
         f"Thank you for using Pala Blog Application version {app.version} -- Application Successfully Shutdown!"
@@ -16,6 +16,7 @@ class AppTestSettings(AppSettings):
     DESCRIPTION: str = f"[Test Settings] API Application {VERSION} with FastAPI, Docker, and MongoDB."
     DEBUG: bool = config("IS_DEBUG", cast=bool)  # type: ignore
     ENVIRONMENT: AppEnvironment = AppEnvironment.TESTING
+    DB_STORAGE_ENGINE: str = config("DB_STORAGE_ENGINE", default="memory", cast=str)  # type: ignore
 
 
 class AppProductionSettings(AppSettings):
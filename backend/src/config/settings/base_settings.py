@@ -1,7 +1,7 @@
 from logging import INFO
 from pathlib import Path
 
-from decouple import config
+from decouple import config, Csv
 from pydantic import BaseConfig, BaseSettings, EmailStr, SecretStr
 
 
@@ -31,8 +31,71 @@ class AppSettings(BaseSettings):
     LOGGERS: tuple[str, str] = ("uvicorn.asgi", "uvicorn.access")
 
     # DB
+    DB_STORAGE_ENGINE: str = config("DB_STORAGE_ENGINE", default="mongodb", cast=str)  # type: ignore
+    DB_BOOTSTRAP_MODE: str = config("DB_BOOTSTRAP_MODE", default="rebuild", cast=str)  # type: ignore
     MONGODB_ATLAS_URI: str = config("MONGODB_ATLAS_URI", cast=str)  # type: ignore
     MONGODB_URI: str = config("MONGODB_URI", cast=str)  # type: ignore
+    MONGODB_MAX_POOL_SIZE: int = config("MONGODB_MAX_POOL_SIZE", default=100, cast=int)  # type: ignore
+    MONGODB_MIN_POOL_SIZE: int = config("MONGODB_MIN_POOL_SIZE", default=10, cast=int)  # type: ignore
+    MONGODB_MAX_CONNECTING: int = config("MONGODB_MAX_CONNECTING", default=2, cast=int)  # type: ignore
+    MONGODB_MAX_IDLE_TIME_MS: int = config("MONGODB_MAX_IDLE_TIME_MS", default=300000, cast=int)  # type: ignore
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = config("MONGODB_WAIT_QUEUE_TIMEOUT_MS", default=5000, cast=int)  # type: ignore
+    MONGODB_CONNECT_TIMEOUT_MS: int = config("MONGODB_CONNECT_TIMEOUT_MS", default=5000, cast=int)  # type: ignore
+    MONGODB_SOCKET_TIMEOUT_MS: int = config("MONGODB_SOCKET_TIMEOUT_MS", default=30000, cast=int)  # type: ignore
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = config("MONGODB_SERVER_SELECTION_TIMEOUT_MS", default=5000, cast=int)  # type: ignore
+    MONGODB_COMPRESSORS: list[str] = config("MONGODB_COMPRESSORS", default="zstd,snappy,zlib", cast=Csv())  # type: ignore
+    IS_INDEX_DRIFT_REPAIRED: bool = config("IS_INDEX_DRIFT_REPAIRED", default=False, cast=bool)  # type: ignore
+
+    # Caching
+    BLOG_CACHE_MAX_SIZE: int = config("BLOG_CACHE_MAX_SIZE", default=1024, cast=int)  # type: ignore
+    BLOG_CACHE_TTL: float = config("BLOG_CACHE_TTL", default=60.0, cast=float)  # type: ignore
+    BLOG_CACHE_NEGATIVE_TTL: float = config("BLOG_CACHE_NEGATIVE_TTL", default=5.0, cast=float)  # type: ignore
+    BLOG_SEARCH_CACHE_MAX_SIZE: int = config("BLOG_SEARCH_CACHE_MAX_SIZE", default=512, cast=int)  # type: ignore
+    BLOG_SEARCH_CACHE_TTL: float = config("BLOG_SEARCH_CACHE_TTL", default=30.0, cast=float)  # type: ignore
+    PRINCIPAL_CACHE_MAX_SIZE: int = config("PRINCIPAL_CACHE_MAX_SIZE", default=4096, cast=int)  # type: ignore
+    PRINCIPAL_CACHE_TTL: float = config("PRINCIPAL_CACHE_TTL", default=30.0, cast=float)  # type: ignore
+    TOKEN_CACHE_MAX_SIZE: int = config("TOKEN_CACHE_MAX_SIZE", default=8192, cast=int)  # type: ignore
+    TOKEN_CACHE_MAX_TTL: float = config("TOKEN_CACHE_MAX_TTL", default=900.0, cast=float)  # type: ignore
+
+    # HTTP Caching
+    BLOG_CACHE_CONTROL: str = config("BLOG_CACHE_CONTROL", default="public, no-cache", cast=str)  # type: ignore
+
+    # Bulk Import
+    BLOG_IMPORT_BATCH_SIZE: int = config("BLOG_IMPORT_BATCH_SIZE", default=1000, cast=int)  # type: ignore
+    BLOG_IMPORT_MAX_LINE_LENGTH: int = config("BLOG_IMPORT_MAX_LINE_LENGTH", default=65536, cast=int)  # type: ignore
+    BLOG_IMPORT_MAX_REPORTED_ERRORS: int = config("BLOG_IMPORT_MAX_REPORTED_ERRORS", default=100, cast=int)  # type: ignore
+
+    # Export
+    EXPORT_BATCH_SIZE: int = config("EXPORT_BATCH_SIZE", default=1000, cast=int)  # type: ignore
+    EXPORT_CHUNK_SIZE: int = config("EXPORT_CHUNK_SIZE", default=65536, cast=int)  # type: ignore
+
+    # Metrics
+    PROMETHEUS_MULTIPROC_DIR: str = config("PROMETHEUS_MULTIPROC_DIR", default="", cast=str)  # type: ignore
+    IS_SERVER_TIMING_ENABLED: bool = config("IS_SERVER_TIMING_ENABLED", default=False, cast=bool)  # type: ignore
+    IS_SERVER_TIMING_LOGGED: bool = config("IS_SERVER_TIMING_LOGGED", default=False, cast=bool)  # type: ignore
+
+    # Startup
+    STARTUP_IMPORT_BUDGET_MS: float = config("STARTUP_IMPORT_BUDGET_MS", default=1500.0, cast=float)  # type: ignore
+    STARTUP_BUDGET_MS: float = config("STARTUP_BUDGET_MS", default=500.0, cast=float)  # type: ignore
+
+    # Compression
+    COMPRESSION_MINIMUM_SIZE: int = config("COMPRESSION_MINIMUM_SIZE", default=1024, cast=int)  # type: ignore
+    COMPRESSION_OFFLOAD_SIZE: int = config("COMPRESSION_OFFLOAD_SIZE", default=262144, cast=int)  # type: ignore
+    COMPRESSION_GZIP_LEVEL: int = config("COMPRESSION_GZIP_LEVEL", default=6, cast=int)  # type: ignore
+    COMPRESSION_BROTLI_QUALITY: int = config("COMPRESSION_BROTLI_QUALITY", default=5, cast=int)  # type: ignore
+    COMPRESSION_CACHE_MAX_SIZE: int = config("COMPRESSION_CACHE_MAX_SIZE", default=512, cast=int)  # type: ignore
+    COMPRESSION_CACHE_TTL: float = config("COMPRESSION_CACHE_TTL", default=300, cast=float)  # type: ignore
+
+    # Pagination
+    PAGINATION_LIMIT: int = config("PAGINATION_LIMIT", default=25, cast=int)  # type: ignore
+    PAGINATION_MAX_LIMIT: int = config("PAGINATION_MAX_LIMIT", default=100, cast=int)  # type: ignore
+
+    # Search
+    BLOG_SEARCH_MAX_QUERY_LENGTH: int = config("BLOG_SEARCH_MAX_QUERY_LENGTH", default=256, cast=int)  # type: ignore
+    BLOG_SEARCH_SNIPPET_LENGTH: int = config("BLOG_SEARCH_SNIPPET_LENGTH", default=200, cast=int)  # type: ignore
+    BLOG_SEARCH_TITLE_WEIGHT: int = config("BLOG_SEARCH_TITLE_WEIGHT", default=10, cast=int)  # type: ignore
+    BLOG_SEARCH_BODY_WEIGHT: int = config("BLOG_SEARCH_BODY_WEIGHT", default=1, cast=int)  # type: ignore
+    BLOG_SEARCH_LANGUAGE: str = config("BLOG_SEARCH_LANGUAGE", default="english", cast=str)  # type: ignore
 
     # Web App Security
     JWT_TOKEN_PREFIX: str = config("JWT_TOKEN_PREFIX", cast=str)  # type: ignore
@@ -52,6 +115,19 @@ class AppSettings(BaseSettings):
     HASHING_SALT: str = config("HASHING_SALT", cast=str)  # type: ignore
     PWD_ALGORITHM_LAYER_1: str = config("PWD_ALGORITHM_LAYER_1", cast=str)  # type: ignore
     PWD_ALGORITHM_LAYER_2: str = config("PWD_ALGORITHM_LAYER_2", cast=str)  # type: ignore
+    ARGON2_TIME_COST: int = config("ARGON2_TIME_COST", default=3, cast=int)  # type: ignore
+    ARGON2_MEMORY_COST: int = config("ARGON2_MEMORY_COST", default=65536, cast=int)  # type: ignore
+    ARGON2_PARALLELISM: int = config("ARGON2_PARALLELISM", default=4, cast=int)  # type: ignore
+    BCRYPT_ROUNDS: int = config("BCRYPT_ROUNDS", default=12, cast=int)  # type: ignore
+    PASSWORD_HASHING_TARGET_MS: float = config("PASSWORD_HASHING_TARGET_MS", default=250.0, cast=float)  # type: ignore
+    PASSWORD_HASHING_WORKERS: int = config("PASSWORD_HASHING_WORKERS", default=2, cast=int)  # type: ignore
+    PASSWORD_HASHING_MAX_QUEUE_SIZE: int = config("PASSWORD_HASHING_MAX_QUEUE_SIZE", default=64, cast=int)  # type: ignore
+    PASSWORD_HASHING_TIMEOUT: float = config("PASSWORD_HASHING_TIMEOUT", default=10.0, cast=float)  # type: ignore
+
+    # Admission Control
+    ADMISSION_MAX_COST: int = config("ADMISSION_MAX_COST", default=4, cast=int)  # type: ignore
+    ADMISSION_QUEUE_TIMEOUT: float = config("ADMISSION_QUEUE_TIMEOUT", default=2.0, cast=float)  # type: ignore
+    ADMISSION_RETRY_AFTER: int = config("ADMISSION_RETRY_AFTER", default=1, cast=int)  # type: ignore
 
     # Authentication, Authorization, & Verification
     MAIL_USERNAME: str = config("MAIL_USERNAME", cast=str)  # type: ignore
@@ -65,6 +141,21 @@ class AppSettings(BaseSettings):
     IS_SSL_TLS: bool = config("IS_SSL_TLS", cast=bool)  # type: ignore
     IS_USE_CREDENTIALS: bool = config("IS_USE_CREDENTIALS", cast=bool)  # type: ignore
     TEMPLATE_DIR = Path().resolve() / Path(config("TEMPLATE_DIR_NAME", cast=str))  # type: ignore
+    IS_EMAIL_TEMPLATE_BYTECODE_CACHED: bool = config("IS_EMAIL_TEMPLATE_BYTECODE_CACHED", default=True, cast=bool)  # type: ignore
+    EMAIL_TEMPLATE_BYTECODE_CACHE_DIR: str = config("EMAIL_TEMPLATE_BYTECODE_CACHE_DIR", default="", cast=str)  # type: ignore
+    IS_EMAIL_TEMPLATE_AUTO_RELOADED: bool = config("IS_EMAIL_TEMPLATE_AUTO_RELOADED", default=False, cast=bool)  # type: ignore
+
+    # Email Outbox
+    SMTP_POOL_SIZE: int = config("SMTP_POOL_SIZE", default=2, cast=int)  # type: ignore
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = config("SMTP_MAX_MESSAGES_PER_CONNECTION", default=100, cast=int)  # type: ignore
+    SMTP_TIMEOUT: float = config("SMTP_TIMEOUT", default=30.0, cast=float)  # type: ignore
+    OUTBOX_BATCH_SIZE: int = config("OUTBOX_BATCH_SIZE", default=20, cast=int)  # type: ignore
+    OUTBOX_POLL_INTERVAL: float = config("OUTBOX_POLL_INTERVAL", default=5.0, cast=float)  # type: ignore
+    OUTBOX_LEASE_SECONDS: float = config("OUTBOX_LEASE_SECONDS", default=120.0, cast=float)  # type: ignore
+    OUTBOX_MAX_ATTEMPTS: int = config("OUTBOX_MAX_ATTEMPTS", default=8, cast=int)  # type: ignore
+    OUTBOX_BACKOFF_BASE: float = config("OUTBOX_BACKOFF_BASE", default=2.0, cast=float)  # type: ignore
+    OUTBOX_BACKOFF_MAX: float = config("OUTBOX_BACKOFF_MAX", default=900.0, cast=float)  # type: ignore
+    OUTBOX_RETENTION_SECONDS: int = config("OUTBOX_RETENTION_SECONDS", default=604800, cast=int)  # type: ignore
 
     class Config(BaseConfig):
         case_sensitive: bool = True
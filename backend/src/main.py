@@ -2,9 +2,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from uvicorn import run
 
+from src.api.compression import compressed_response_cache, CompressionMiddleware
 from src.api.endpoints import router as api_router
+from src.api.metrics import MetricsMiddleware
+from src.api.routes.metrics import router as metrics_router
+from src.api.timing import ServerTimingMiddleware
 from src.config.events import event_manager
 from src.config.manager import settings
+from src.services.metrics.startup import startup_report
 
 
 def initialize_application() -> FastAPI:
@@ -16,11 +21,26 @@ def initialize_application() -> FastAPI:
         allow_methods=settings.METHODS,
         allow_headers=settings.HEADERS,
     )
+    if settings.IS_SERVER_TIMING_ENABLED:
+        app.add_middleware(
+            middleware_class=ServerTimingMiddleware,
+            is_logged=settings.IS_SERVER_TIMING_LOGGED,
+            total_only_path_prefixes=(f"{settings.API_PREFIX}/auth",),
+        )
+    app.add_middleware(
+        middleware_class=CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+        cache=compressed_response_cache,
+    )
+    app.add_middleware(middleware_class=MetricsMiddleware)
     app.include_router(router=api_router, prefix=settings.API_PREFIX)
+    app.include_router(router=metrics_router)
     return app
 
 
 app: FastAPI = initialize_application()
+startup_report.mark_imported()
 
 if __name__ == "__main__":
     run(
@@ -1 +1 @@
-collection_names: list[str] = ["users", "posts"]
+collection_names: list[str] = ["users", "blogs", "outbox"]
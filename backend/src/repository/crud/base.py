@@ -1,8 +1,21 @@
+from inspect import iscoroutinefunction
+from typing import Any
+
 from pymongo.collection import Collection
 
 from src.repository.database import db_manager
+from src.services.metrics.timing import timed
 
 
 class BaseCRUDRepository:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Time every public coroutine of a repository as a `db` span of the request, see `timed_span`.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and iscoroutinefunction(attribute):
+                setattr(cls, name, timed(name="db")(attribute))
+
     def __init__(self, collection_name) -> None:
         self.collection: Collection = db_manager.get_collection(collection_name=collection_name)
@@ -1,11 +1,29 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import AsyncIterator, TYPE_CHECKING
 
 from bson import ObjectId
 from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
 
+from src.config.manager import settings
 from src.repository.crud.base import BaseCRUDRepository
-from src.repository.serializers.blog import serialize_blog
+from src.repository.pagination import build_keyset_filter, keyset_sort, paginate
+from src.repository.projections import build_projection
+from src.repository.search import (
+    build_highlight_pattern,
+    build_search_pipeline,
+    build_snippet,
+    encode_search_cursor,
+    extract_query_terms,
+)
+from src.repository.serializers.blog import blog_fields, blog_search_fields, serialize_blog
 from src.schema.blog import BlogBaseSchema
+from src.services.cache.blog import blog_cache, blog_search_cache
+from src.services.cache.lru import cache_miss
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorCursor
 
 
 class BlogCRUDRepository(BaseCRUDRepository):
@@ -15,29 +33,164 @@ class BlogCRUDRepository(BaseCRUDRepository):
     async def create_blog(self, blog_data: dict[str, str]) -> dict[str, str | datetime | ObjectId | None]:
         jsonified_blog_data = jsonable_encoder(obj=BlogBaseSchema(**blog_data))  # type: ignore
         registered_blog = await self.collection.insert_one(jsonified_blog_data)  # type: ignore
+        blog_cache.invalidate(key=registered_blog.inserted_id)
+        blog_search_cache.clear()
         db_blog = await self.collection.find_one({"_id": registered_blog.inserted_id})  # type: ignore
         return serialize_blog(blog=db_blog)
 
-    async def read_all(self) -> list[dict[str, str | datetime | ObjectId | None]]:
-        db_blogs = await self.collection.find({"$query": {}, "$orderby": {"createdAt": -1}}).to_list(25)  # type: ignore
+    async def import_blogs(
+        self, rows: AsyncIterator[tuple[int, dict | str]], author_name: str, author_id: str
+    ) -> tuple[int, int, list[tuple[int, str]]]:
+        """
+        Validate the rows of a bulk import one by one and write them in unordered `insert_many` batches of
+        `BLOG_IMPORT_BATCH_SIZE`, so that a failing row neither stops the import nor its batch. A row is either a
+        blog or the reason why it could not be decoded. Return the inserted count, the failed count and the first
+        `BLOG_IMPORT_MAX_REPORTED_ERRORS` failures by line number.
+        """
+        inserted_count, failed_count = 0, 0
+        errors: list[tuple[int, str]] = list()
+
+        def report_failure(line_number: int, detail: str) -> None:
+            nonlocal failed_count
+            failed_count += 1
+            if len(errors) < settings.BLOG_IMPORT_MAX_REPORTED_ERRORS:
+                errors.append((line_number, detail))
+
+        async def insert_batch(line_numbers: list[int], documents: list[dict]) -> None:
+            nonlocal inserted_count
+            try:
+                inserted_blogs = await self.collection.insert_many(documents, ordered=False)  # type: ignore
+                inserted_count += len(inserted_blogs.inserted_ids)
+            except BulkWriteError as bulk_write_error:
+                inserted_count += bulk_write_error.details["nInserted"]
+                for write_error in bulk_write_error.details["writeErrors"]:
+                    index = write_error["index"]
+                    if write_error["code"] == 11000:
+                        detail = f"Blog with ID `{documents[index]['_id']}` already exists!"
+                    else:
+                        detail = write_error["errmsg"]
+                    report_failure(line_number=line_numbers[index], detail=detail)
+            for document in documents:
+                blog_cache.invalidate(key=document["_id"])
+
+        line_numbers, documents = list(), list()
+        async for line_number, row in rows:
+            if isinstance(row, str):
+                report_failure(line_number=line_number, detail=row)
+                continue
+            try:
+                blog = BlogBaseSchema(**{**row, "authorName": author_name, "authorId": author_id})
+            except ValidationError as validation_error:
+                detail = "; ".join(
+                    f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in validation_error.errors()
+                )
+                report_failure(line_number=line_number, detail=detail)
+                continue
+            for field in ("created_at", "updated_at"):
+                date_time = getattr(blog, field)
+                if date_time is not None and date_time.tzinfo is not None:
+                    setattr(blog, field, date_time.astimezone(timezone.utc).replace(tzinfo=None))
+            line_numbers.append(line_number)
+            documents.append(jsonable_encoder(obj=blog))
+            if len(documents) >= settings.BLOG_IMPORT_BATCH_SIZE:
+                await insert_batch(line_numbers=line_numbers, documents=documents)
+                line_numbers, documents = list(), list()
+        if documents:
+            await insert_batch(line_numbers=line_numbers, documents=documents)
+        if inserted_count:
+            blog_search_cache.clear()
+        return (inserted_count, failed_count, errors)
+
+    async def read_all_documents(
+        self, limit: int, cursor: str | None = None, fields: list[str] | None = None
+    ) -> tuple[list[dict], str | None]:
+        projection = build_projection(fields=fields, field_keys=blog_fields, required_keys=("createdAt",))
+        db_cursor = self.collection.find(build_keyset_filter(cursor=cursor), projection)  # type: ignore
+        db_blogs = await db_cursor.sort(keyset_sort).limit(limit + 1).to_list(length=limit + 1)  # type: ignore
+        return paginate(documents=db_blogs, limit=limit)
+
+    def export_documents(self, cursor: str | None = None) -> "AsyncIOMotorCursor":
+        """
+        Iterate every blog past the cursor position in the pagination order, fetching `EXPORT_BATCH_SIZE`
+        documents per round trip, so that a full export holds a single batch in memory at a time.
+        """
+        db_cursor = self.collection.find(build_keyset_filter(cursor=cursor))  # type: ignore
+        return db_cursor.sort(keyset_sort).batch_size(settings.EXPORT_BATCH_SIZE)  # type: ignore
+
+    async def read_all(
+        self, limit: int, cursor: str | None = None, fields: list[str] | None = None
+    ) -> tuple[list[dict[str, str | datetime | ObjectId | None]], str | None]:
+        db_blogs, next_cursor = await self.read_all_documents(limit=limit, cursor=cursor, fields=fields)
         jsonified_blogs = list()
         for blog in db_blogs:
-            jsonified_blogs.append(serialize_blog(blog=blog))
-        return jsonified_blogs
+            jsonified_blogs.append(serialize_blog(blog=blog, fields=fields))
+        return (jsonified_blogs, next_cursor)
 
-    async def read_blog_by_id(self, id: str) -> dict[str, str | datetime | ObjectId | None]:
-        db_blog = await self.collection.find_one({"_id": id})  # type: ignore
-        print(db_blog)
-        if not db_blog:
-            raise Exception(f"Blog with ID `{id}` is not found!")
-        return serialize_blog(blog=db_blog)
+    async def search_blogs(
+        self, query: str, limit: int, cursor: str | None = None
+    ) -> tuple[list[dict[str, str | float | datetime | ObjectId | None]], str | None]:
+        """
+        Rank the blogs matching `query` on the weighted `title_body_text` index and return them with a
+        highlighted snippet instead of the body. Pages of hot queries are served from a short-lived cache that
+        every blog write clears.
+        """
+        cache_key = (" ".join(query.lower().split()), cursor, limit)
+        search_page = blog_search_cache.get(key=cache_key)
+        if search_page is not cache_miss:
+            return search_page
+        projection = {blog_fields[field]: 1 for field in (*blog_search_fields, "body")}
+        db_cursor = self.collection.aggregate(  # type: ignore
+            build_search_pipeline(query=query, cursor=cursor, limit=limit, projection=projection)
+        )
+        db_blogs = await db_cursor.to_list(length=limit + 1)  # type: ignore
+        next_cursor = None
+        if len(db_blogs) > limit:
+            db_blogs = db_blogs[:limit]
+            next_cursor = encode_search_cursor(score=db_blogs[-1]["score"], id=str(db_blogs[-1]["_id"]))
+        highlight_pattern = build_highlight_pattern(terms=extract_query_terms(query=query))
+        search_results = list()
+        for db_blog in db_blogs:
+            search_result: dict[str, str | float | datetime | ObjectId | None] = dict(
+                serialize_blog(blog=db_blog, fields=blog_search_fields)
+            )
+            search_result["score"] = db_blog["score"]
+            search_result["snippet"] = build_snippet(
+                text=db_blog.get("body", ""),
+                highlight_pattern=highlight_pattern,
+                width=settings.BLOG_SEARCH_SNIPPET_LENGTH,
+            )
+            search_results.append(search_result)
+        search_page = (search_results, next_cursor)
+        blog_search_cache.set(key=cache_key, value=search_page)
+        return search_page
 
-    async def delete_blog_by_id(self, id: str) -> bool:
-        db_blog = await self.collection.find_one({"_id": jsonable_encoder(obj=id)})  # type: ignore
+    async def read_blog_document_by_id(self, id: str, fields: list[str] | None = None) -> dict:
+        db_blog = blog_cache.get(key=id)
+        if db_blog is cache_miss:
+            projection = None if blog_cache.is_enabled else build_projection(fields=fields, field_keys=blog_fields)
+            db_blog = await self.collection.find_one({"_id": id}, projection)  # type: ignore
+            if projection is None:
+                blog_cache.set(key=id, value=db_blog)
         if not db_blog:
             raise Exception(f"Blog with ID `{id}` is not found!")
+        return db_blog
+
+    async def read_blog_by_id(
+        self, id: str, fields: list[str] | None = None
+    ) -> dict[str, str | datetime | ObjectId | None]:
+        db_blog = await self.read_blog_document_by_id(id=id, fields=fields)
+        return serialize_blog(blog=db_blog, fields=fields)
 
-        deleted_blog = await self.collection.delete_one({"_id": db_blog["_id"]})  # type: ignore
+    async def delete_blog_by_id(self, id: str, author_id: str | None = None) -> bool:
+        ownership_filter = {"_id": jsonable_encoder(obj=id)}
+        if author_id is not None:
+            ownership_filter["authorId"] = author_id
+        deleted_blog = await self.collection.find_one_and_delete(ownership_filter)  # type: ignore
+        blog_cache.invalidate(key=ownership_filter["_id"])
         if not deleted_blog:
-            raise Exception(f"Blog deletion failed!")
+            raise Exception(f"Blog with ID `{id}` is not found or not owned by author `{author_id}`!")
+        blog_search_cache.clear()
         return True
+
+    async def is_blog_existing(self, id: str) -> bool:
+        return bool(await self.collection.count_documents({"_id": id}, limit=1))  # type: ignore
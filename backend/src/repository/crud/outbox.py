@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from pydantic import EmailStr
+from pymongo import ASCENDING, ReturnDocument
+
+from src.repository.crud.base import BaseCRUDRepository
+from src.schema.outbox import OutboxMessageSchema, OutboxStatus
+
+
+class OutboxCRUDRepository(BaseCRUDRepository):
+    """
+    Emails are written to the `outbox` collection next to the data that caused them and delivered later by the
+    outbox worker. Messages are stored with native dates (unlike the API documents), so that `sentAt` can carry
+    the TTL index that purges delivered messages.
+    """
+
+    def __init__(self, collection_name) -> None:
+        super().__init__(collection_name)
+
+    async def enqueue(self, recipients: list[EmailStr], subject: str, body: str) -> str:
+        message = OutboxMessageSchema(recipients=recipients, subject=subject, body=body)
+        await self.collection.insert_one(message.dict(by_alias=True))  # type: ignore
+        return message.id
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> list[dict]:
+        """
+        Lease up to `limit` due messages one `find_one_and_update` at a time, so that several workers can drain
+        the outbox concurrently without sending a message twice. Messages whose lease ran out, i.e. whose worker
+        died mid-delivery, are due again.
+        """
+        now = datetime.utcnow()
+        due_filter = {
+            "$or": [
+                {"status": OutboxStatus.PENDING.value, "nextAttemptAt": {"$lte": now}},
+                {"status": OutboxStatus.SENDING.value, "lockedUntil": {"$lte": now}},
+            ]
+        }
+        claimed_messages = list()
+        for _ in range(limit):
+            message = await self.collection.find_one_and_update(
+                due_filter,  # type: ignore
+                {
+                    "$set": {
+                        "status": OutboxStatus.SENDING.value,
+                        "lockedUntil": now + timedelta(seconds=lease_seconds),
+                    }
+                },
+                sort=[("nextAttemptAt", ASCENDING)],
+                return_document=ReturnDocument.AFTER,
+            )  # type: ignore
+            if not message:
+                break
+            claimed_messages.append(message)
+        return claimed_messages
+
+    async def mark_sent(self, message: dict) -> None:
+        await self.collection.update_one(
+            {"_id": message["_id"], "lockedUntil": message["lockedUntil"]},  # type: ignore
+            {
+                "$set": {"status": OutboxStatus.SENT.value, "sentAt": datetime.utcnow(), "lockedUntil": None},
+                "$inc": {"attempts": 1},
+            },
+        )  # type: ignore
+
+    async def mark_failed(self, message: dict, error: str, next_attempt_at: datetime | None) -> None:
+        """
+        Reschedule the message at `next_attempt_at`, or give up on it for good if there is none.
+        """
+        status = OutboxStatus.FAILED.value if next_attempt_at is None else OutboxStatus.PENDING.value
+        await self.collection.update_one(
+            {"_id": message["_id"], "lockedUntil": message["lockedUntil"]},  # type: ignore
+            {
+                "$set": {
+                    "status": status,
+                    "lastError": error,
+                    "nextAttemptAt": next_attempt_at or message["nextAttemptAt"],
+                    "lockedUntil": None,
+                },
+                "$inc": {"attempts": 1},
+            },
+        )  # type: ignore
@@ -1,13 +1,22 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from bson import ObjectId
 from fastapi.encoders import jsonable_encoder
 from pydantic import EmailStr
+from pymongo import ReturnDocument
 
+from src.config.manager import settings
 from src.repository.crud.base import BaseCRUDRepository
-from src.repository.serializers.user import serialize_user
+from src.repository.pagination import build_keyset_filter, keyset_sort, paginate
+from src.repository.projections import build_projection
+from src.repository.serializers.user import serialize_user, user_fields, user_public_fields
 from src.schema.user import UserBaseSchema
-from src.services.security.password.manager import pwd_manager
+from src.services.cache.principal import principal_cache
+from src.services.security.password.service import pwd_hashing_service
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorCursor
 
 
 class UserCRUDRepository(BaseCRUDRepository):
@@ -17,7 +26,9 @@ class UserCRUDRepository(BaseCRUDRepository):
     async def create(
         self, user_data: dict[str, str | EmailStr]
     ) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
-        hashed_salt, hashed_password = pwd_manager.generate_double_layered_password(password=user_data["password"])
+        hashed_salt, hashed_password = await pwd_hashing_service.generate_double_layered_password(
+            password=user_data["password"]
+        )
         new_user = jsonable_encoder(
             obj=UserBaseSchema(
                 username=user_data["username"],
@@ -31,46 +42,71 @@ class UserCRUDRepository(BaseCRUDRepository):
         db_user = await self.collection.find_one({"_id": registered_user.inserted_id})  # type: ignore
         return serialize_user(user=db_user)
 
-    async def read_all(self) -> list[dict[str, str | EmailStr | datetime | ObjectId | None]]:
-        db_users = await self.collection.find({"$query": {}, "$orderby": {"createdAt": -1}}).to_list(25)  # type: ignore
-        print(db_users)
+    async def read_all_documents(
+        self, limit: int, cursor: str | None = None, fields: list[str] | None = None
+    ) -> tuple[list[dict], str | None]:
+        projection = build_projection(fields=fields, field_keys=user_fields, required_keys=("createdAt",))
+        db_cursor = self.collection.find(build_keyset_filter(cursor=cursor), projection)  # type: ignore
+        db_users = await db_cursor.sort(keyset_sort).limit(limit + 1).to_list(length=limit + 1)  # type: ignore
+        return paginate(documents=db_users, limit=limit)
+
+    def export_documents(self, cursor: str | None = None) -> "AsyncIOMotorCursor":
+        """
+        Iterate the public fields of every user past the cursor position in the pagination order, fetching
+        `EXPORT_BATCH_SIZE` documents per round trip.
+        """
+        projection = build_projection(fields=user_public_fields, field_keys=user_fields)
+        db_cursor = self.collection.find(build_keyset_filter(cursor=cursor), projection)  # type: ignore
+        return db_cursor.sort(keyset_sort).batch_size(settings.EXPORT_BATCH_SIZE)  # type: ignore
+
+    async def read_all(
+        self, limit: int, cursor: str | None = None, fields: list[str] | None = None
+    ) -> tuple[list[dict[str, str | EmailStr | datetime | ObjectId | None]], str | None]:
+        db_users, next_cursor = await self.read_all_documents(limit=limit, cursor=cursor, fields=fields)
         jsonified_users = list()
         for user in db_users:
-            jsonified_users.append(serialize_user(user))
-        print(jsonified_users)
-        return jsonified_users
+            jsonified_users.append(serialize_user(user, fields=fields))
+        return (jsonified_users, next_cursor)
 
     async def is_username_taken(self, username: str) -> bool:
-        username = await self.collection.find_one({"username": username})  # type: ignore
+        username = await self.collection.find_one({"username": username}, {"_id": 1})  # type: ignore
         if not username:
             return False
         return True
 
     async def is_email_taken(self, email: str) -> bool:
-        email = await self.collection.find_one({"email": email})  # type: ignore
+        email = await self.collection.find_one({"email": email}, {"_id": 1})  # type: ignore
         if not email:
             return False
         return True
 
     async def is_password_verified(self, hashed_salt: str, password: str, hashed_password: str) -> bool:
-        return pwd_manager.is_hashed_password_verified(hashed_salt=hashed_salt, password=password, hashed_password=hashed_password)  # type: ignore
+        return await pwd_hashing_service.is_hashed_password_verified(
+            hashed_salt=hashed_salt, password=password, hashed_password=hashed_password
+        )
 
     async def is_password_matched(self, password: str, repeated_password: str) -> bool:
         if password != repeated_password:  # type: ignore
             return False
         return True
 
-    async def read_user_by_id(self, id: str) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
-        db_user = await self.collection.find_one({"_id": id})  # type: ignore
+    async def read_user_by_id(
+        self, id: str, fields: list[str] | None = None
+    ) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
+        projection = build_projection(fields=fields, field_keys=user_fields)
+        db_user = await self.collection.find_one({"_id": id}, projection)  # type: ignore
         if not db_user:
             raise Exception(f"User with ID `{id}` doesn't exist!")
-        return serialize_user(user=db_user)
+        return serialize_user(user=db_user, fields=fields)
 
-    async def read_user_by_username(self, username: str) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
-        db_user = await self.collection.find_one({"username": username})  # type: ignore
+    async def read_user_by_username(
+        self, username: str, fields: list[str] | None = None
+    ) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
+        projection = build_projection(fields=fields, field_keys=user_fields)
+        db_user = await self.collection.find_one({"username": username}, projection)  # type: ignore
         if not db_user:
             raise Exception(f"User with username `{username}` doesn't exist!")
-        return serialize_user(user=db_user)
+        return serialize_user(user=db_user, fields=fields)
 
     async def read_user_in_login(
         self, user_data: dict[str, str]
@@ -78,62 +114,65 @@ class UserCRUDRepository(BaseCRUDRepository):
         db_user = await self.collection.find_one({"username": user_data["username"]})  # type: ignore
         if not db_user:
             raise Exception(f"User with username `{user_data['username']}` is not found!")
-        is_correct_password = await self.is_password_verified(
+        is_correct_password, updated_hashes = await pwd_hashing_service.verify_and_update_password(
             hashed_salt=db_user["hashedSalt"],  # type: ignore
             password=user_data["password"],  # type: ignore
             hashed_password=db_user["hashedPassword"],  # type: ignore
         )
         if not is_correct_password:
             raise Exception("Incorrect Password!")
-        update_user = await self.collection.update_one(
-            {"_id": db_user["_id"]},  # type: ignore
-            {"$set": {"isLoggedIn": True, "updatedAt": datetime.utcnow()}},
+        login_update = {"isLoggedIn": True, "updatedAt": datetime.utcnow()}
+        if updated_hashes:
+            login_update["hashedSalt"], login_update["hashedPassword"] = updated_hashes
+        logged_in_user = await self.collection.find_one_and_update(
+            {"_id": db_user["_id"], "hashedPassword": db_user["hashedPassword"]},  # type: ignore
+            {"$set": login_update},
+            return_document=ReturnDocument.AFTER,
         )  # type: ignore
-        logged_in_user = await self.collection.find_one(update_user.upserted_id)  # type: ignore
+        if not logged_in_user:
+            raise Exception(f"User with username `{user_data['username']}` changed during login!")
+        principal_cache.invalidate(key=logged_in_user["username"])
         return serialize_user(user=logged_in_user)
 
     async def update_user_with_otp_details(
         self, otp_data: dict[str, str | bool]
     ) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
-        db_user = await self.collection.find_one({"_id": otp_data["userId"]})  # type: ignore
-        if not db_user:
-            raise Exception(f"User with id `{otp_data['userId']}` is not found!")
-        otp_data.pop("userId")
-        update_user = await self.collection.update_one(
-            {"_id": db_user["_id"]}, {"$set": otp_data}  # type: ignore
+        user_id = otp_data.pop("userId")
+        updated_user = await self.collection.find_one_and_update(
+            {"_id": user_id}, {"$set": otp_data}, return_document=ReturnDocument.AFTER  # type: ignore
         )  # type: ignore
-        updated_user = await self.collection.find_one(update_user.upserted_id)  # type: ignore
+        if not updated_user:
+            raise Exception(f"User with id `{user_id}` is not found!")
+        principal_cache.invalidate(key=updated_user["username"])
         return serialize_user(user=updated_user)  # type: ignore
 
     async def read_user_in_email_verification(
         self, verification_code: str | None
     ) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
-        db_user = await self.collection.find_one({"emailVerificationCode": verification_code})  # type: ignore
-        if not db_user:
-            raise Exception(f"User with email verification code `{verification_code}` is not found!")
-        update_user = await self.collection.update_one(
-            {"_id": db_user["_id"]},  # type: ignore
+        verified_user = await self.collection.find_one_and_update(
+            {"emailVerificationCode": verification_code, "isVerified": False},  # type: ignore
             {"$set": {"isVerified": True, "updatedAt": datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
         )  # type: ignore
-        logged_in_user = await self.collection.find_one(update_user.upserted_id)  # type: ignore
-        return serialize_user(user=logged_in_user)  # type: ignore
+        if not verified_user:
+            raise Exception(f"User with email verification code `{verification_code}` is not found!")
+        principal_cache.invalidate(key=verified_user["username"])
+        return serialize_user(user=verified_user)  # type: ignore
 
     async def update_user_before_logout(self, id: str) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
-        db_user = await self.collection.find_one({"_id": id})  # type: ignore
-        if not db_user:
-            raise Exception(f"User with id `{id}` is not found!")
-        update_user = await self.collection.update_one(
-            {"_id": db_user["_id"]}, {"$set": {"isLoggedIn": False, "isOtpVerified": False}}  # type: ignore
+        updated_user = await self.collection.find_one_and_update(
+            {"_id": id},  # type: ignore
+            {"$set": {"isLoggedIn": False, "isOtpVerified": False}},
+            return_document=ReturnDocument.AFTER,
         )  # type: ignore
-        updated_user = await self.collection.find_one(update_user.upserted_id)  # type: ignore
+        if not updated_user:
+            raise Exception(f"User with id `{id}` is not found!")
+        principal_cache.invalidate(key=updated_user["username"])
         return serialize_user(user=updated_user)  # type: ignore
 
     async def delete_user_by_id(self, id: str) -> bool:
-        db_user = await self.collection.find_one({"_id": jsonable_encoder(obj=id)})  # type: ignore
-        if not db_user:
-            raise Exception(f"User with ID `{id}` is not found!")
-
-        deleted_user = await self.collection.delete_one({"_id": db_user["_id"]})  # type: ignore
+        deleted_user = await self.collection.find_one_and_delete({"_id": jsonable_encoder(obj=id)})  # type: ignore
         if not deleted_user:
-            raise Exception(f"User deletion failed!")
+            raise Exception(f"User with ID `{id}` is not found!")
+        principal_cache.invalidate(key=deleted_user["username"])
         return True
@@ -1,28 +1,122 @@
+from asyncio import gather
+from enum import Enum
+from importlib import import_module
+
 from loguru import logger
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import CollectionInvalid
+from pymongo.errors import CollectionInvalid, OperationFailure
 from pymongo.mongo_client import MongoClient
 
 from src.config.manager import settings
+from src.repository.indexes import index_signature, IndexReconciliationReport
+from src.repository.memory.client import MemoryClient
+from src.repository.monitoring import PoolStatisticsListener
+
+
+class StorageEngine(str, Enum):
+    MONGODB = "mongodb"
+    MEMORY = "memory"
+
+
+class BootstrapMode(str, Enum):
+    REBUILD = "rebuild"
+    VERIFY = "verify"
+
+
+compression_support_modules: dict[str, str] = {"zstd": "zstandard", "snappy": "snappy"}
+
+
+def get_available_compressors(compressors: list[str]) -> list[str]:
+    """
+    Keep only the wire compressors whose optional driver dependency (`zstandard`, `python-snappy`) is installed.
+    """
+    available_compressors = list()
+    for compressor in compressors:
+        if compressor in compression_support_modules:
+            try:
+                import_module(name=compression_support_modules[compressor])
+            except ImportError:
+                continue
+        available_compressors.append(compressor)
+    return available_compressors
 
 
 class DBManager:
     def __init__(self, is_atlas: bool = False) -> None:
         self.is_atlas: bool = is_atlas
+        self.storage_engine: StorageEngine = StorageEngine(settings.DB_STORAGE_ENGINE)
+        self.bootstrap_mode: BootstrapMode = BootstrapMode(settings.DB_BOOTSTRAP_MODE)
         self.name: str = "blogcluster1"
         self.uri: str = settings.MONGODB_ATLAS_URI if is_atlas else settings.MONGODB_URI
-        self.client: MongoClient = self.__connect_client()
-        self.db: Database = self.__create_db()
+        self.pool_listener: PoolStatisticsListener = PoolStatisticsListener()
+        self.client: MongoClient | None = None
+        self.db: Database | None = None
 
     def __connect_client(self) -> MongoClient:
-        return AsyncIOMotorClient(self.uri)
+        if self.storage_engine == StorageEngine.MEMORY:
+            return MemoryClient()  # type: ignore
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        return AsyncIOMotorClient(
+            self.uri,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxConnecting=settings.MONGODB_MAX_CONNECTING,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            connectTimeoutMS=settings.MONGODB_CONNECT_TIMEOUT_MS,
+            socketTimeoutMS=settings.MONGODB_SOCKET_TIMEOUT_MS,
+            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            compressors=get_available_compressors(compressors=settings.MONGODB_COMPRESSORS) or None,
+            event_listeners=[self.pool_listener],
+        )
 
     def __create_db(self) -> Database:
         if not self.is_atlas:
-            return self.client.test
-        return self.client[self.name]
+            return self.client.test  # type: ignore
+        return self.client[self.name]  # type: ignore
+
+    @property
+    def is_connected(self) -> bool:
+        return self.client is not None
+
+    def connect(self) -> None:
+        """
+        Create the Motor client of the current worker process. It must run inside the application lifespan, i.e.
+        after uvicorn has forked its workers, so that no worker inherits the sockets or threads of another. With the
+        `memory` storage engine the client is an empty in-memory database instead, e.g. for tests and benchmarks.
+        """
+        if self.is_connected:
+            return
+        self.pool_listener.reset()
+        self.client = self.__connect_client()
+        self.db = self.__create_db()
+
+    async def warm_up(self) -> None:
+        """
+        Ping the server once per `minPoolSize` connection concurrently, so that the pool is already open when the
+        first burst of requests arrives instead of every request dialling its own connection.
+        """
+        await gather(
+            *(self.client.admin.command("ping") for _ in range(max(1, settings.MONGODB_MIN_POOL_SIZE)))  # type: ignore
+        )
+
+    def disconnect(self) -> None:
+        if not self.is_connected:
+            return
+        self.client.close()  # type: ignore
+        self.client = None
+        self.db = None
+
+    @property
+    def pool_statistics(self) -> dict[str, int | float]:
+        return {
+            "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+            "min_pool_size": settings.MONGODB_MIN_POOL_SIZE,
+            **self.pool_listener.statistics,
+        }
 
     async def create_collections(self, collection_names: list[str]) -> None:
         for collection_name in collection_names:
@@ -32,10 +126,59 @@ class DBManager:
                 logger.info(f"Collection with the name `{collection_name}` already exists!")
                 pass
 
+    async def find_missing_collections(self, collection_names: list[str]) -> list[str]:
+        existing_collection_names = set(await self.db.list_collection_names())  # type: ignore
+        return [
+            collection_name for collection_name in collection_names if collection_name not in existing_collection_names
+        ]
+
+    async def reconcile_indexes(
+        self, collection_name: str, indexes: list[IndexModel], is_drift_repaired: bool = False
+    ) -> IndexReconciliationReport:
+        report = IndexReconciliationReport(collection_name=collection_name)
+        collection = self.db[collection_name]  # type: ignore
+        existing_indexes = {
+            existing_index["name"]: existing_index
+            async for existing_index in collection.list_indexes()  # type: ignore
+            if existing_index["name"] != "_id_"
+        }
+        existing_signatures = {name: index_signature(existing) for name, existing in existing_indexes.items()}
+        missing_indexes: list[IndexModel] = list()
+        for declared_index in indexes:
+            name = declared_index.document["name"]
+            signature = index_signature(declared_index.document)
+            if name in existing_signatures:
+                if existing_signatures.pop(name) == signature:
+                    report.unchanged.append(name)
+                elif is_drift_repaired:
+                    await collection.drop_index(name)  # type: ignore
+                    missing_indexes.append(declared_index)
+                    report.rebuilt.append(name)
+                else:
+                    report.drifted[name] = f"declared {signature}, found {index_signature(existing_indexes[name])}"
+                continue
+            same_keys = [other for other, (keys, _) in existing_signatures.items() if keys == signature[0]]
+            if same_keys:
+                report.drifted[name] = f"declared keys already indexed as `{same_keys[0]}`"
+                existing_signatures.pop(same_keys[0])
+                continue
+            missing_indexes.append(declared_index)
+        for declared_index in missing_indexes:
+            name = declared_index.document["name"]
+            try:
+                await collection.create_indexes(indexes=[declared_index])  # type: ignore
+            except OperationFailure as err:
+                report.failed[name] = str(err)
+            else:
+                if name not in report.rebuilt:
+                    report.created.append(name)
+        report.unmanaged.extend(existing_signatures.keys())
+        return report
+
     async def drop_collections(self, collection_names: list[str]) -> None:
         if not self.is_atlas:
             for collection_name in collection_names:
-                if self.db[collection_name] is not None:
+                if self.db[collection_name] is not None:  # type: ignore
                     try:
                         await self.db.drop_collection(name_or_collection=collection_name)  # type: ignore
                     except Exception as err:
@@ -44,6 +187,8 @@ class DBManager:
         raise Exception("Dropping collections in Atlas is forbidden. Continue without dropping collections.")
 
     def get_collection(self, collection_name: str) -> Collection:
+        if not self.is_connected:
+            raise Exception("The MongoDB client is not connected! Collections are available inside the lifespan.")
         return self.db[collection_name]  # type: ignore
 
     async def drop_db(self) -> None:
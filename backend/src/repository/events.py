@@ -1,7 +1,12 @@
+from asyncio import gather
+
 from loguru import logger
 
+from src.config.manager import settings
 from src.repository.collections import collection_names
-from src.repository.database import db_manager
+from src.repository.database import BootstrapMode, db_manager
+from src.repository.indexes import collection_indexes
+from src.services.metrics.startup import startup_report
 
 
 async def drop_collections() -> None:
@@ -28,6 +33,54 @@ async def create_collections() -> None:
             logger.info(f"  • Collection {idx + 1}: {collection_names[idx]}")
 
 
+async def verify_collections() -> None:
+    """
+    Create only the collections that do not exist yet, in a single round trip when all of them do, so that a
+    restarted worker or a new replica keeps the data and boots without rebuilding the database.
+    """
+    logger.info("Database Collections --- Verifying . . .")
+    try:
+        missing_collection_names = await db_manager.find_missing_collections(collection_names=collection_names)
+        await db_manager.create_collections(collection_names=missing_collection_names)
+    except Exception as err:
+        logger.warning(f"Database Collections --- Verification Failed: {err}")
+    else:
+        logger.info(
+            f"Database Collections --- {len(collection_names) - len(missing_collection_names)} verified,"
+            f" {len(missing_collection_names)} created: {missing_collection_names}"
+        )
+
+
+async def reconcile_indexes() -> None:
+    logger.info("Database Indexes --- Reconciling . . .")
+    reports = await gather(
+        *(
+            db_manager.reconcile_indexes(
+                collection_name=collection_name, indexes=indexes, is_drift_repaired=settings.IS_INDEX_DRIFT_REPAIRED
+            )
+            for collection_name, indexes in collection_indexes.items()
+        ),
+        return_exceptions=True,
+    )
+    for collection_name, report in zip(collection_indexes, reports):
+        if isinstance(report, BaseException):
+            if not isinstance(report, Exception):
+                raise report
+            logger.warning(f"Database Indexes --- `{collection_name}` could not be reconciled: {report}")
+            continue
+        logger.info(
+            f"  • Collection `{collection_name}`: {len(report.created)} created, {len(report.rebuilt)} rebuilt,"
+            f" {len(report.unchanged)} unchanged"
+        )
+        for name, drift in report.drifted.items():
+            logger.warning(f"  • Index `{collection_name}.{name}` has drifted from its declaration: {drift}")
+        for name in report.unmanaged:
+            logger.warning(f"  • Index `{collection_name}.{name}` is not declared in the index registry")
+        for name, failure in report.failed.items():
+            logger.error(f"  • Index `{collection_name}.{name}` failed to build: {failure}")
+    logger.info("Database Indexes --- Successfully Reconciled!")
+
+
 async def drop_db() -> None:
     logger.info(f"Local MongoDB Database --- Deleting . . .")
     try:
@@ -38,10 +91,20 @@ async def drop_db() -> None:
     logger.info(f"Local MongoDB Database `{db_manager.name}` --- Successfully Deleted!")
 
 
-async def startup_db_event_manager() -> None:
-    logger.info("Connection to Asynchronous MongoDB Client via Motor --- Establishing . . .\n")
-    logger.info(f"MongoDB Client --- {db_manager.client}\n")
-    logger.info("Connection to Asynchronous MongoDB Client via Motor --- Successfully Established!")
+async def warm_up_connection_pool() -> None:
+    logger.info(f"MongoDB Connection Pool --- Warming Up {settings.MONGODB_MIN_POOL_SIZE} Connections . . .")
+    try:
+        await db_manager.warm_up()
+    except Exception as err:
+        logger.warning(f"MongoDB Connection Pool --- Warm-Up Failed: {err}")
+    else:
+        logger.info(f"MongoDB Connection Pool --- {db_manager.pool_statistics}")
+
+
+async def bootstrap_db() -> None:
+    if db_manager.bootstrap_mode == BootstrapMode.VERIFY:
+        await verify_collections()
+        return
     if db_manager.is_atlas:
         logger.info(f"MongoDB Atlas Database --- Accessing . . .\n")
         logger.info(f"MongoDB Atlas Database --- {db_manager.db}\n")
@@ -54,6 +117,22 @@ async def startup_db_event_manager() -> None:
     await create_collections()
 
 
+async def startup_db_event_manager() -> None:
+    logger.info("Connection to Asynchronous MongoDB Client via Motor --- Establishing . . .\n")
+    with startup_report.measure(step="database-connection"):
+        db_manager.connect()
+        logger.info(f"MongoDB Client --- {db_manager.client}\n")
+        await warm_up_connection_pool()
+    logger.info("Connection to Asynchronous MongoDB Client via Motor --- Successfully Established!")
+    with startup_report.measure(step="database-bootstrap"):
+        await bootstrap_db()
+    with startup_report.measure(step="database-indexes"):
+        await reconcile_indexes()
+
+
 async def shutdown_db_event_manager() -> None:
-    if not db_manager.is_atlas:
+    if not db_manager.is_atlas and db_manager.bootstrap_mode == BootstrapMode.REBUILD:
         await drop_db()
+    logger.info(f"MongoDB Connection Pool --- {db_manager.pool_statistics}")
+    db_manager.disconnect()
+    logger.info("Connection to Asynchronous MongoDB Client via Motor --- Successfully Closed!")
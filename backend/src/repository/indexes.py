@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from pymongo import ASCENDING, DESCENDING, IndexModel, TEXT
+
+from src.config.manager import settings
+from src.repository.pagination import keyset_sort
+
+comparable_index_options: tuple[str, ...] = (
+    "unique",
+    "sparse",
+    "partialFilterExpression",
+    "expireAfterSeconds",
+    "weights",
+    "default_language",
+    "collation",
+)
+
+
+def index(keys: Sequence[tuple[str, int | str]], name: str, **options) -> IndexModel:
+    """
+    Declare an index that is built in the background, so that startup never blocks on a collection lock.
+    """
+    return IndexModel(keys=keys, name=name, background=True, **options)
+
+
+collection_indexes: dict[str, list[IndexModel]] = {
+    "users": [
+        index(keys=[("username", ASCENDING)], name="username_unique", unique=True),
+        index(keys=[("email", ASCENDING)], name="email_unique", unique=True),
+        index(
+            keys=[("emailVerificationCode", ASCENDING)],
+            name="emailVerificationCode_unverified",
+            partialFilterExpression={"isVerified": False},
+        ),
+        index(keys=keyset_sort, name="createdAt_id_keyset"),
+    ],
+    "blogs": [
+        index(keys=keyset_sort, name="createdAt_id_keyset"),
+        index(keys=[("authorId", ASCENDING), ("createdAt", DESCENDING)], name="authorId_createdAt"),
+        index(
+            keys=[("title", TEXT), ("body", TEXT)],
+            name="title_body_text",
+            weights={"title": settings.BLOG_SEARCH_TITLE_WEIGHT, "body": settings.BLOG_SEARCH_BODY_WEIGHT},
+            default_language=settings.BLOG_SEARCH_LANGUAGE,
+        ),
+    ],
+    "outbox": [
+        index(keys=[("status", ASCENDING), ("nextAttemptAt", ASCENDING)], name="status_nextAttemptAt"),
+        index(keys=[("status", ASCENDING), ("lockedUntil", ASCENDING)], name="status_lockedUntil"),
+        index(keys=[("sentAt", ASCENDING)], name="sentAt_ttl", expireAfterSeconds=settings.OUTBOX_RETENTION_SECONDS),
+    ],
+}
+
+
+def index_signature(index_document: dict) -> tuple[list[tuple[str, int | str]], dict]:
+    """
+    Reduce either an `IndexModel.document` or a `list_indexes()` entry to its comparable key and options.
+    """
+    keys = [
+        (key, direction if isinstance(direction, str) else int(direction))
+        for key, direction in index_document["key"].items()
+        if key not in ("_fts", "_ftsx") and direction != TEXT
+    ]
+    if "weights" in index_document:
+        keys.append(("$text", TEXT))
+    options = {
+        option: index_document[option]
+        for option in comparable_index_options
+        if option in index_document and not (option in ("unique", "sparse") and not index_document[option])
+    }
+    return (keys, options)
+
+
+@dataclass
+class IndexReconciliationReport:
+    collection_name: str
+    created: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    rebuilt: list[str] = field(default_factory=list)
+    drifted: dict[str, str] = field(default_factory=dict)
+    unmanaged: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.drifted or self.unmanaged or self.failed)
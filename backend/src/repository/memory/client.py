@@ -0,0 +1,69 @@
+from pymongo.errors import CollectionInvalid, OperationFailure
+
+from src.repository.memory.collection import MemoryCollection
+
+
+class MemoryDatabase:
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.collections: dict[str, MemoryCollection] = dict()
+
+    def __getitem__(self, collection_name: str) -> MemoryCollection:
+        """
+        Create a collection on first access, like MongoDB does on the first write.
+        """
+        if collection_name not in self.collections:
+            self.collections[collection_name] = MemoryCollection(database_name=self.name, name=collection_name)
+        return self.collections[collection_name]
+
+    def __getattr__(self, collection_name: str) -> MemoryCollection:
+        if collection_name.startswith("_"):
+            raise AttributeError(collection_name)
+        return self[collection_name]
+
+    def __repr__(self) -> str:
+        return f"MemoryDatabase(name={self.name!r}, collections={list(self.collections)})"
+
+    async def create_collection(self, name: str) -> MemoryCollection:
+        if name in self.collections:
+            raise CollectionInvalid(f"collection {name} already exists")
+        return self[name]
+
+    async def drop_collection(self, name_or_collection: str | MemoryCollection) -> None:
+        self.collections.pop(getattr(name_or_collection, "name", name_or_collection), None)  # type: ignore
+
+    async def list_collection_names(self) -> list[str]:
+        return list(self.collections)
+
+    async def command(self, command: str) -> dict:
+        if command != "ping":
+            raise OperationFailure(f"no such command: '{command}'", code=59)
+        return {"ok": 1.0}
+
+
+class MemoryClient:
+    """
+    An in-memory stand-in for `AsyncIOMotorClient`, whose databases live and die with the worker process.
+    """
+
+    def __init__(self) -> None:
+        self.databases: dict[str, MemoryDatabase] = dict()
+
+    def __getitem__(self, database_name: str) -> MemoryDatabase:
+        if database_name not in self.databases:
+            self.databases[database_name] = MemoryDatabase(name=database_name)
+        return self.databases[database_name]
+
+    def __getattr__(self, database_name: str) -> MemoryDatabase:
+        if database_name.startswith("_"):
+            raise AttributeError(database_name)
+        return self[database_name]
+
+    def __repr__(self) -> str:
+        return f"MemoryClient(databases={list(self.databases)})"
+
+    async def drop_database(self, name_or_database: str | MemoryDatabase) -> None:
+        self.databases.pop(getattr(name_or_database, "name", name_or_database), None)  # type: ignore
+
+    def close(self) -> None:
+        self.databases.clear()
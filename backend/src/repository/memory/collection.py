@@ -0,0 +1,393 @@
+from copy import deepcopy
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+from bson import ObjectId
+from pymongo import IndexModel, ReturnDocument, TEXT
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.results import DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+from src.repository.memory.index import OrderedIndex, TextIndex, TextQuery
+from src.repository.memory.query import (
+    apply_update,
+    find_key_range,
+    is_operator_condition,
+    match_document,
+    project_document,
+    sort_documents,
+)
+
+
+def normalize_sort(
+    key_or_list: str | list[tuple[str, int]] | None, direction: int | None = None
+) -> list[tuple[str, int]]:
+    if key_or_list is None:
+        return list()
+    if isinstance(key_or_list, str):
+        return [(key_or_list, direction or 1)]
+    return [(field, int(field_direction)) for field, field_direction in key_or_list]
+
+
+class MemoryCursor:
+    """
+    The chainable `find()` cursor of a `MemoryCollection`. The documents are selected when the cursor is first read
+    and then copied one by one, so that iterating a whole collection never holds a second copy of it.
+    """
+
+    def __init__(self, collection: "MemoryCollection", query: dict, projection: dict | None) -> None:
+        self.collection: MemoryCollection = collection
+        self.query: dict = query
+        self.projection: dict | None = projection
+        self.sort_keys: list[tuple[str, int]] = list()
+        self.skip_count: int = 0
+        self.limit_count: int = 0
+        self.documents: Iterator[dict] | None = None
+
+    def sort(self, key_or_list: str | list[tuple[str, int]], direction: int | None = None) -> "MemoryCursor":
+        self.sort_keys = normalize_sort(key_or_list=key_or_list, direction=direction)
+        return self
+
+    def skip(self, skip: int) -> "MemoryCursor":
+        self.skip_count = skip
+        return self
+
+    def limit(self, limit: int) -> "MemoryCursor":
+        self.limit_count = abs(limit)
+        return self
+
+    def batch_size(self, batch_size: int) -> "MemoryCursor":
+        return self
+
+    def __select(self) -> Iterator[dict]:
+        if self.documents is None:
+            selected_documents = self.collection.select(
+                query=self.query, sort=self.sort_keys, skip=self.skip_count, limit=self.limit_count
+            )
+            self.documents = (project_document(document, self.projection) for document in selected_documents)
+        return self.documents
+
+    async def to_list(self, length: int | None = None) -> list[dict]:
+        return list(islice(self.__select(), length))
+
+    def __aiter__(self) -> "MemoryCursor":
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self.__select())
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class MemoryCommandCursor:
+    """
+    The cursor of `aggregate()` and `list_indexes()`, whose documents are produced when it is first read.
+    """
+
+    def __init__(self, produce: Callable[[], Iterable[dict]]) -> None:
+        self.produce: Callable[[], Iterable[dict]] = produce
+        self.documents: Iterator[dict] | None = None
+
+    def __select(self) -> Iterator[dict]:
+        if self.documents is None:
+            self.documents = iter(self.produce())
+        return self.documents
+
+    async def to_list(self, length: int | None = None) -> list[dict]:
+        return list(islice(self.__select(), length))
+
+    def __aiter__(self) -> "MemoryCommandCursor":
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self.__select())
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class MemoryCollection:
+    """
+    An in-memory stand-in for the Motor collection API the repositories use. Every operation runs to completion
+    without yielding to the event loop, so single-document operations such as `find_one_and_update` are atomic like
+    in MongoDB. TTL indexes are kept but never expire documents.
+    """
+
+    def __init__(self, database_name: str, name: str) -> None:
+        self.name: str = name
+        self.full_name: str = f"{database_name}.{name}"
+        self.documents: dict[Any, dict] = dict()
+        self.indexes: dict[str, OrderedIndex | TextIndex] = {"_id_": OrderedIndex({"key": {"_id": 1}, "name": "_id_"})}
+
+    @property
+    def ordered_indexes(self) -> list[OrderedIndex]:
+        return [index for index in self.indexes.values() if isinstance(index, OrderedIndex)]
+
+    @property
+    def text_index(self) -> TextIndex:
+        for index in self.indexes.values():
+            if isinstance(index, TextIndex):
+                return index
+        raise OperationFailure("text index required for $text query", code=27)
+
+    def plan(self, query: dict, sort: list[tuple[str, int]]) -> tuple[Iterable[dict], bool]:
+        """
+        Pick the candidate documents of a query and whether they are already in the sort order: the document of an
+        `_id` equality, a scan of the index that serves the sort, a scan of the index whose leading key the query
+        bounds most tightly, or else the whole collection.
+        """
+        id_condition = query.get("_id", None)
+        if id_condition is not None and not is_operator_condition(id_condition):
+            try:
+                document = self.documents.get(id_condition)
+            except TypeError:
+                document = None
+            return ([] if document is None else [document], True)
+        if sort:
+            for index in self.ordered_indexes:
+                direction = index.find_direction(sort=sort)
+                if direction is not None:
+                    key_range = find_key_range(query=query, field=index.leading_field)
+                    return (self.fetch(ids=index.scan(key_range=key_range, direction=direction)), True)
+        bounded_indexes = list()
+        for index in self.ordered_indexes:
+            lower, upper = find_key_range(query=query, field=index.leading_field)
+            if index.is_complete and (lower is not None or upper is not None):
+                bounded_indexes.append((lower is None or upper is None or lower != upper, index, (lower, upper)))
+        if bounded_indexes:
+            _, index, key_range = min(bounded_indexes, key=lambda bounded_index: bounded_index[0])
+            return (self.fetch(ids=index.scan(key_range=key_range)), False)
+        return (self.documents.values(), False)
+
+    def fetch(self, ids: Iterable[Any]) -> Iterator[dict]:
+        for id in ids:
+            yield self.documents[id]
+
+    def select(self, query: dict, sort: list[tuple[str, int]], skip: int = 0, limit: int = 0) -> list[dict]:
+        candidates, is_sorted = self.plan(query=query, sort=sort)
+        documents: Iterable[dict] = (document for document in candidates if match_document(document, query))
+        if sort and not is_sorted:
+            documents = sort_documents(documents=list(documents), sort=sort)
+        return list(islice(documents, skip, skip + limit if limit else None))
+
+    def find_first(self, query: dict | None, sort: list[tuple[str, int]] | None = None) -> dict | None:
+        documents = self.select(query=query or dict(), sort=normalize_sort(key_or_list=sort), limit=1)
+        return documents[0] if documents else None
+
+    def store(self, document: dict) -> None:
+        if document["_id"] in self.documents:
+            raise DuplicateKeyError(
+                f"E11000 duplicate key error collection: {self.full_name} index: _id_ dup key: {{ _id: {document['_id']!r} }}",
+                code=11000,
+                details={"keyPattern": {"_id": 1}, "keyValue": {"_id": document["_id"]}},
+            )
+        for index in self.indexes.values():
+            index.check_unique(document=document)
+        self.documents[document["_id"]] = document
+        for index in self.indexes.values():
+            index.insert(document=document)
+
+    def unstore(self, document: dict) -> None:
+        for index in self.indexes.values():
+            index.remove(document=document)
+        del self.documents[document["_id"]]
+
+    def update_document(self, document: dict, update: dict) -> None:
+        updated_document = deepcopy(document)
+        apply_update(document=updated_document, update=update)
+        self.unstore(document=document)
+        try:
+            self.store(document=updated_document)
+        except DuplicateKeyError:
+            self.store(document=document)
+            raise
+
+    async def insert_one(self, document: dict) -> InsertOneResult:
+        document.setdefault("_id", ObjectId())
+        self.store(document=deepcopy(document))
+        return InsertOneResult(inserted_id=document["_id"], acknowledged=True)
+
+    async def insert_many(self, documents: Iterable[dict], ordered: bool = True) -> InsertManyResult:
+        inserted_ids, write_errors = list(), list()
+        for position, document in enumerate(documents):
+            document.setdefault("_id", ObjectId())
+            try:
+                self.store(document=deepcopy(document))
+            except DuplicateKeyError as duplicate_key_error:
+                write_errors.append(
+                    {"index": position, "code": 11000, "errmsg": str(duplicate_key_error), "op": document}
+                )
+                if ordered:
+                    break
+                continue
+            inserted_ids.append(document["_id"])
+        if write_errors:
+            raise BulkWriteError(
+                {
+                    "writeErrors": write_errors,
+                    "writeConcernErrors": list(),
+                    "nInserted": len(inserted_ids),
+                    "nUpserted": 0,
+                    "nMatched": 0,
+                    "nModified": 0,
+                    "nRemoved": 0,
+                    "upserted": list(),
+                }
+            )
+        return InsertManyResult(inserted_ids=inserted_ids, acknowledged=True)
+
+    def find(self, filter: dict | None = None, projection: dict | None = None) -> MemoryCursor:
+        return MemoryCursor(collection=self, query=filter or dict(), projection=projection)
+
+    async def find_one(
+        self, filter: dict | None = None, projection: dict | None = None, sort: list[tuple[str, int]] | None = None
+    ) -> dict | None:
+        document = self.find_first(query=filter, sort=sort)
+        return None if document is None else project_document(document, projection)
+
+    async def find_one_and_update(
+        self,
+        filter: dict,
+        update: dict,
+        projection: dict | None = None,
+        sort: list[tuple[str, int]] | None = None,
+        return_document: bool = ReturnDocument.BEFORE,
+    ) -> dict | None:
+        document = self.find_first(query=filter, sort=sort)
+        if document is None:
+            return None
+        original_document = project_document(document, projection)
+        self.update_document(document=document, update=update)
+        if return_document == ReturnDocument.AFTER:
+            return project_document(self.documents[document["_id"]], projection)
+        return original_document
+
+    async def find_one_and_delete(
+        self, filter: dict, projection: dict | None = None, sort: list[tuple[str, int]] | None = None
+    ) -> dict | None:
+        document = self.find_first(query=filter, sort=sort)
+        if document is None:
+            return None
+        self.unstore(document=document)
+        return project_document(document, projection)
+
+    async def update_one(self, filter: dict, update: dict) -> UpdateResult:
+        document = self.find_first(query=filter)
+        if document is not None:
+            self.update_document(document=document, update=update)
+        matched_count = int(document is not None)
+        return UpdateResult({"n": matched_count, "nModified": matched_count, "ok": 1.0}, acknowledged=True)
+
+    async def update_many(self, filter: dict, update: dict) -> UpdateResult:
+        documents = self.select(query=filter, sort=list())
+        for document in documents:
+            self.update_document(document=document, update=update)
+        return UpdateResult({"n": len(documents), "nModified": len(documents), "ok": 1.0}, acknowledged=True)
+
+    async def delete_one(self, filter: dict) -> DeleteResult:
+        document = self.find_first(query=filter)
+        if document is not None:
+            self.unstore(document=document)
+        return DeleteResult({"n": int(document is not None), "ok": 1.0}, acknowledged=True)
+
+    async def delete_many(self, filter: dict) -> DeleteResult:
+        documents = self.select(query=filter, sort=list())
+        for document in documents:
+            self.unstore(document=document)
+        return DeleteResult({"n": len(documents), "ok": 1.0}, acknowledged=True)
+
+    async def count_documents(self, filter: dict, skip: int = 0, limit: int = 0) -> int:
+        return len(self.select(query=filter, sort=list(), skip=skip, limit=limit))
+
+    def aggregate(self, pipeline: list[dict]) -> MemoryCommandCursor:
+        return MemoryCommandCursor(produce=lambda: self.run_pipeline(pipeline=pipeline))
+
+    def run_pipeline(self, pipeline: list[dict]) -> list[dict]:
+        """
+        Run the `$match`, `$project`, `$sort`, `$skip` and `$limit` stages, where a `$text` match must come first and
+        its score is available to a `$project` as `{"$meta": "textScore"}`.
+        """
+        documents: list[tuple[dict, float | None]] = list()
+        for position, stage in enumerate(pipeline):
+            (operator, specification), *_ = stage.items()
+            if position == 0:
+                query = specification if operator == "$match" else dict()
+                text_condition = query.get("$text")
+                if text_condition is not None:
+                    text_query = TextQuery(search=text_condition["$search"])
+                    query = {key: condition for key, condition in query.items() if key != "$text"}
+                    for document in self.select(query=query, sort=list()):
+                        score = self.text_index.score(document=document, query=text_query)
+                        if score is not None:
+                            documents.append((document, score))
+                else:
+                    documents = [(document, None) for document in self.select(query=query, sort=list())]
+                if operator == "$match":
+                    continue
+            if operator == "$match":
+                if "$text" in specification:
+                    raise OperationFailure("$match with $text is only allowed as the first pipeline stage", code=17313)
+                documents = [
+                    (document, score) for document, score in documents if match_document(document, specification)
+                ]
+            elif operator == "$project":
+                fields = {key: value for key, value in specification.items() if not isinstance(value, dict)}
+                computed_fields = {key: value for key, value in specification.items() if isinstance(value, dict)}
+                projected_documents = list()
+                for document, score in documents:
+                    projected_document = project_document(document, fields or {"_id": 1})
+                    for key, expression in computed_fields.items():
+                        if expression != {"$meta": "textScore"}:
+                            raise OperationFailure(f"Unsupported projection expression for `{key}`: {expression}")
+                        projected_document[key] = score
+                    projected_documents.append((projected_document, score))
+                documents = projected_documents
+            elif operator == "$sort":
+                sorted_documents = sort_documents(
+                    documents=[document for document, _ in documents], sort=list(specification.items())
+                )
+                scores = {id(document): score for document, score in documents}
+                documents = [(document, scores[id(document)]) for document in sorted_documents]
+            elif operator == "$skip":
+                documents = documents[specification:]
+            elif operator == "$limit":
+                documents = documents[:specification]
+            else:
+                raise OperationFailure(f"Unrecognized pipeline stage name: '{operator}'", code=40324)
+        return [deepcopy(document) for document, _ in documents]
+
+    def list_indexes(self) -> MemoryCommandCursor:
+        return MemoryCommandCursor(
+            produce=lambda: [{"v": 2, **deepcopy(index.specification)} for index in self.indexes.values()]
+        )
+
+    async def create_indexes(self, indexes: list[IndexModel]) -> list[str]:
+        names = list()
+        for index_model in indexes:
+            specification = {key: value for key, value in index_model.document.items() if key != "background"}
+            name = specification["name"]
+            if name in self.indexes:
+                if {"v": 2, **self.indexes[name].specification} != {"v": 2, **specification}:
+                    raise OperationFailure(
+                        f"An existing index has the same name as the requested index: {name}", code=86
+                    )
+                names.append(name)
+                continue
+            is_text_index = TEXT in specification["key"].values()
+            if is_text_index and any(isinstance(index, TextIndex) for index in self.indexes.values()):
+                raise OperationFailure("Only one text index is allowed per collection", code=85)
+            index = TextIndex(specification) if is_text_index else OrderedIndex(specification)
+            for document in self.documents.values():
+                index.check_unique(document=document)
+                index.insert(document=document)
+            self.indexes[name] = index
+            names.append(name)
+        return names
+
+    async def drop_index(self, index_or_name: str) -> None:
+        if index_or_name == "_id_" or index_or_name not in self.indexes:
+            raise OperationFailure(f"index not found with name [{index_or_name}]", code=27)
+        del self.indexes[index_or_name]
+
+    async def drop_indexes(self) -> None:
+        self.indexes = {"_id_": self.indexes["_id_"]}
@@ -0,0 +1,220 @@
+from bisect import bisect_left, insort
+from re import compile as compile_regex, Pattern
+from typing import Any, Iterator
+
+from pymongo import TEXT
+from pymongo.errors import DuplicateKeyError
+
+from src.repository.memory.query import get_field, match_document, missing, sort_key
+from src.repository.search import search_term_pattern, stem_term
+
+word_pattern: Pattern = compile_regex(r"\w+")
+
+
+class Descending:
+    """
+    Invert the order of a sort key inside an index entry, so that every index is a single ascending sorted list
+    whatever the directions of its keys.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: tuple) -> None:
+        self.key: tuple = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Descending) and self.key == other.key
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Descending):
+            return NotImplemented
+        return other.key < self.key
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Descending):
+            return NotImplemented
+        return self.key < other.key
+
+
+class Unbounded:
+    """
+    Compare greater than any index key, to bisect past every entry that starts with a given key prefix.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        return other is self
+
+    def __lt__(self, other: object) -> bool:
+        return False
+
+    def __gt__(self, other: object) -> bool:
+        return other is not self
+
+
+unbounded = Unbounded()
+
+
+class OrderedIndex:
+    """
+    Keep the `(keys..., _id)` entries of the indexed documents in a sorted list, so that an equality or range on the
+    leading key is a bisection and a sort on the index keys, in either direction, is a scan. Like in MongoDB, a
+    partial index only holds the documents matching its filter, a sparse index only those with an indexed field.
+    Unlike MongoDB, an array is indexed as a whole instead of element by element.
+    """
+
+    def __init__(self, specification: dict) -> None:
+        self.specification: dict = specification
+        self.name: str = specification["name"]
+        self.keys: list[tuple[str, int]] = list(specification["key"].items())
+        self.is_unique: bool = bool(specification.get("unique"))
+        self.is_sparse: bool = bool(specification.get("sparse"))
+        self.partial_filter: dict | None = specification.get("partialFilterExpression")
+        self.entries: list[tuple] = list()
+
+    @property
+    def leading_field(self) -> str:
+        return self.keys[0][0]
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.is_sparse and self.partial_filter is None
+
+    def build_entry(self, document: dict) -> tuple | None:
+        if self.partial_filter is not None and not match_document(document=document, query=self.partial_filter):
+            return None
+        values = [get_field(document=document, path=field) for field, _ in self.keys]
+        if self.is_sparse and all(value is missing for value in values):
+            return None
+        keys = (
+            sort_key(value) if direction > 0 else Descending(sort_key(value))
+            for value, (_, direction) in zip(values, self.keys)
+        )
+        return (*keys, sort_key(document["_id"]))
+
+    def check_unique(self, document: dict) -> None:
+        if not self.is_unique or (entry := self.build_entry(document=document)) is None:
+            return
+        position = bisect_left(self.entries, entry[:-1])
+        if position < len(self.entries) and self.entries[position][:-1] == entry[:-1]:
+            if self.entries[position][-1] != entry[-1]:
+                key_value = {field: get_field(document=document, path=field) for field, _ in self.keys}
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error index: {self.name} dup key: {key_value}",
+                    code=11000,
+                    details={"keyPattern": dict(self.keys), "keyValue": key_value},
+                )
+
+    def insert(self, document: dict) -> None:
+        if (entry := self.build_entry(document=document)) is not None:
+            insort(self.entries, entry)
+
+    def remove(self, document: dict) -> None:
+        if (entry := self.build_entry(document=document)) is None:
+            return
+        position = bisect_left(self.entries, entry)
+        if position < len(self.entries) and self.entries[position] == entry:
+            del self.entries[position]
+
+    def find_direction(self, sort: list[tuple[str, int]]) -> int | None:
+        """
+        Return `1` when the index order is the sort order, `-1` when it is the reverse order, and `None` when the
+        index cannot serve the sort.
+        """
+        if len(sort) > len(self.keys) or not self.is_complete:
+            return None
+        if all(
+            sort_field == field and sort_direction == direction
+            for (sort_field, sort_direction), (field, direction) in zip(sort, self.keys)
+        ):
+            return 1
+        if all(
+            sort_field == field and sort_direction == -direction
+            for (sort_field, sort_direction), (field, direction) in zip(sort, self.keys)
+        ):
+            return -1
+        return None
+
+    def scan(self, key_range: tuple[tuple | None, tuple | None], direction: int = 1) -> Iterator[Any]:
+        """
+        Yield the `_id` of every entry whose leading key lies in the inclusive `(lower, upper)` sort key range.
+        """
+        lower, upper = key_range
+        start_key: tuple | Descending | None = lower
+        stop_key: tuple | Descending | None = upper
+        if self.keys[0][1] < 0:
+            start_key = None if upper is None else Descending(upper)
+            stop_key = None if lower is None else Descending(lower)
+        start = 0 if start_key is None else bisect_left(self.entries, (start_key,))
+        stop = len(self.entries) if stop_key is None else bisect_left(self.entries, (stop_key, unbounded))
+        positions = range(start, stop) if direction > 0 else range(stop - 1, start - 1, -1)
+        for position in positions:
+            yield self.entries[position][-1][1]
+
+
+class TextQuery:
+    """
+    Parse a `$text` search string: words are matched on their stems, phrases are all required, and words or phrases
+    prefixed with `-` exclude a document.
+    """
+
+    def __init__(self, search: str) -> None:
+        self.terms: set[str] = set()
+        self.phrases: list[str] = list()
+        self.negated_terms: set[str] = set()
+        self.negated_phrases: list[str] = list()
+        for token in search_term_pattern.findall(search):
+            is_negated = token.startswith("-")
+            token = token.removeprefix("-")
+            if token.startswith('"'):
+                phrase = token.strip('"').strip().lower()
+                if phrase:
+                    (self.negated_phrases if is_negated else self.phrases).append(phrase)
+                if is_negated:
+                    continue
+            for word in word_pattern.findall(token.lower()):
+                (self.negated_terms if is_negated else self.terms).add(stem_term(term=word))
+
+
+class TextIndex:
+    """
+    Serve `$text` queries by scanning the indexed fields of every document. The score approximates the weighted
+    text score of MongoDB: every query term found in a field adds the field weight, scaled by the term frequency.
+    """
+
+    def __init__(self, specification: dict) -> None:
+        self.specification: dict = specification
+        self.name: str = specification["name"]
+        self.weights: dict[str, int] = {
+            **{field: 1 for field, direction in specification["key"].items() if direction == TEXT},
+            **specification.get("weights", dict()),
+        }
+
+    def score(self, document: dict, query: TextQuery) -> float | None:
+        texts = dict()
+        for field in self.weights:
+            value = get_field(document=document, path=field)
+            texts[field] = " ".join(value) if isinstance(value, list) else value if isinstance(value, str) else ""
+        full_text = " ".join(texts.values()).lower()
+        if any(phrase not in full_text for phrase in query.phrases):
+            return None
+        if any(phrase in full_text for phrase in query.negated_phrases):
+            return None
+        score = 0.0
+        for field, text in texts.items():
+            stems = [stem_term(term=word) for word in word_pattern.findall(text.lower())]
+            if query.negated_terms.intersection(stems):
+                return None
+            for term in query.terms:
+                frequency = stems.count(term)
+                if frequency:
+                    score += self.weights[field] * (0.5 + 0.5 * frequency / len(stems))
+        return score if score or query.phrases else None
+
+    def insert(self, document: dict) -> None:
+        pass
+
+    def remove(self, document: dict) -> None:
+        pass
+
+    def check_unique(self, document: dict) -> None:
+        pass
@@ -0,0 +1,231 @@
+from copy import deepcopy
+from datetime import datetime
+from operator import ge, gt, le, lt
+from typing import Any, Callable
+
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+missing: Any = object()
+comparison_operators: dict[str, Callable[[Any, Any], bool]] = {"$lt": lt, "$lte": le, "$gt": gt, "$gte": ge}
+
+
+def sort_key(value: Any) -> tuple:
+    """
+    Order values of different types like BSON does, i.e. null and missing values first, then numbers, strings,
+    objects, arrays, binary data, ObjectIds, booleans and dates, so that mixed types never fail to compare.
+    """
+    if value is None or value is missing:
+        return (1, 0)
+    if isinstance(value, bool):
+        return (8, value)
+    if isinstance(value, (int, float)):
+        return (2, value)
+    if isinstance(value, str):
+        return (3, value)
+    if isinstance(value, dict):
+        return (4, tuple((key, sort_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (5, tuple(sort_key(item) for item in value))
+    if isinstance(value, bytes):
+        return (6, value)
+    if isinstance(value, ObjectId):
+        return (7, value)
+    if isinstance(value, datetime):
+        return (9, value)
+    return (10, str(value))
+
+
+def get_field(document: dict, path: str) -> Any:
+    value: Any = document
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return missing
+        value = value[key]
+    return value
+
+
+def set_field(document: dict, path: str, value: Any) -> None:
+    *parents, key = path.split(".")
+    for parent in parents:
+        document = document.setdefault(parent, dict())
+    document[key] = value
+
+
+def unset_field(document: dict, path: str) -> None:
+    *parents, key = path.split(".")
+    for parent in parents:
+        document = document.get(parent, dict())
+    document.pop(key, None)
+
+
+def is_operator_condition(condition: Any) -> bool:
+    return isinstance(condition, dict) and bool(condition) and all(key.startswith("$") for key in condition)
+
+
+def is_equal(value: Any, expected: Any) -> bool:
+    """
+    Match a value like a MongoDB equality does: `None` also matches a missing field and an array matches when one
+    of its elements does.
+    """
+    if value is missing:
+        return expected is None
+    if isinstance(value, list) and not isinstance(expected, list):
+        return any(is_equal(value=item, expected=expected) for item in value)
+    return sort_key(value) == sort_key(expected)
+
+
+def compare(value: Any, operator: str, operand: Any) -> bool:
+    """
+    Compare values of the same BSON type only, e.g. `{"$lt": "2023"}` never matches a number or a missing field.
+    """
+    if isinstance(value, list):
+        return any(compare(value=item, operator=operator, operand=operand) for item in value)
+    value_key, operand_key = sort_key(None if value is missing else value), sort_key(operand)
+    return value_key[0] == operand_key[0] and comparison_operators[operator](value_key, operand_key)
+
+
+def match_condition(value: Any, condition: Any) -> bool:
+    if not is_operator_condition(condition):
+        return is_equal(value=value, expected=condition)
+    for operator, operand in condition.items():
+        if operator == "$eq":
+            is_matched = is_equal(value=value, expected=operand)
+        elif operator == "$ne":
+            is_matched = not is_equal(value=value, expected=operand)
+        elif operator in comparison_operators:
+            is_matched = compare(value=value, operator=operator, operand=operand)
+        elif operator == "$in":
+            is_matched = any(is_equal(value=value, expected=expected) for expected in operand)
+        elif operator == "$nin":
+            is_matched = not any(is_equal(value=value, expected=expected) for expected in operand)
+        elif operator == "$exists":
+            is_matched = (value is not missing) == bool(operand)
+        elif operator == "$not":
+            is_matched = not match_condition(value=value, condition=operand)
+        else:
+            raise OperationFailure(f"unknown operator: {operator}", code=2)
+        if not is_matched:
+            return False
+    return True
+
+
+def match_document(document: dict, query: dict) -> bool:
+    for key, condition in query.items():
+        if key == "$or":
+            is_matched = any(match_document(document=document, query=branch) for branch in condition)
+        elif key == "$and":
+            is_matched = all(match_document(document=document, query=branch) for branch in condition)
+        elif key == "$nor":
+            is_matched = not any(match_document(document=document, query=branch) for branch in condition)
+        elif key.startswith("$"):
+            raise OperationFailure(f"unknown top level operator: {key}", code=2)
+        else:
+            is_matched = match_condition(value=get_field(document=document, path=key), condition=condition)
+        if not is_matched:
+            return False
+    return True
+
+
+def find_key_range(query: dict, field: str) -> tuple[tuple | None, tuple | None]:
+    """
+    Derive the inclusive `(lower, upper)` sort key range, `None` meaning unbounded, that every document matching
+    the query must have on `field`. The range may be wider than the matches, e.g. for `$lt`, but never narrower, so
+    an index scan over it only needs the query to discard the extra documents.
+    """
+    ranges: list[tuple[tuple | None, tuple | None]] = list()
+    if field in query:
+        ranges.append(find_condition_range(condition=query[field]))
+    for branch in query.get("$and", list()):
+        ranges.append(find_key_range(query=branch, field=field))
+    if query.get("$or"):
+        branch_ranges = [find_key_range(query=branch, field=field) for branch in query["$or"]]
+        lowers, uppers = [lower for lower, _ in branch_ranges], [upper for _, upper in branch_ranges]
+        ranges.append(
+            (
+                None if None in lowers else min(lowers),  # type: ignore
+                None if None in uppers else max(uppers),  # type: ignore
+            )
+        )
+    lower, upper = None, None
+    for range_lower, range_upper in ranges:
+        if range_lower is not None and (lower is None or range_lower > lower):
+            lower = range_lower
+        if range_upper is not None and (upper is None or range_upper < upper):
+            upper = range_upper
+    return (lower, upper)
+
+
+def find_condition_range(condition: Any) -> tuple[tuple | None, tuple | None]:
+    if isinstance(condition, list):
+        return (None, None)
+    if not is_operator_condition(condition):
+        return (sort_key(condition), sort_key(condition))
+    lower, upper = None, None
+    for operator, operand in condition.items():
+        if operator == "$eq" and not isinstance(operand, list):
+            lower = upper = sort_key(operand)
+        elif operator in ("$lt", "$lte") and (upper is None or sort_key(operand) < upper):
+            upper = sort_key(operand)
+        elif operator in ("$gt", "$gte") and (lower is None or sort_key(operand) > lower):
+            lower = sort_key(operand)
+        elif operator == "$in" and operand and not any(isinstance(expected, list) for expected in operand):
+            lower, upper = min(map(sort_key, operand)), max(map(sort_key, operand))
+    return (lower, upper)
+
+
+def project_document(document: dict, projection: dict | None) -> dict:
+    """
+    Copy a document with only the included, or without the excluded, top-level fields of a projection. The `_id`
+    is included unless it is excluded explicitly.
+    """
+    if not projection:
+        return deepcopy(document)
+    is_inclusive = any(value for key, value in projection.items() if key != "_id")
+    is_id_included = bool(projection.get("_id", True))
+    if is_inclusive:
+        projected_document = {
+            key: deepcopy(value) for key, value in document.items() if key != "_id" and projection.get(key)
+        }
+        if is_id_included and "_id" in document:
+            projected_document = {"_id": document["_id"], **projected_document}
+        return projected_document
+    return {
+        key: deepcopy(value)
+        for key, value in document.items()
+        if projection.get(key, 1) and (key != "_id" or is_id_included)
+    }
+
+
+def apply_update(document: dict, update: dict) -> None:
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            if path == "_id" or path.startswith("_id."):
+                raise OperationFailure("Performing an update on the path '_id' would modify the immutable field '_id'")
+            if operator == "$set":
+                set_field(document=document, path=path, value=deepcopy(value))
+            elif operator == "$unset":
+                unset_field(document=document, path=path)
+            elif operator == "$inc":
+                current_value = get_field(document=document, path=path)
+                set_field(
+                    document=document, path=path, value=(0 if current_value is missing else current_value) + value
+                )
+            elif operator == "$push":
+                current_value = get_field(document=document, path=path)
+                set_field(
+                    document=document,
+                    path=path,
+                    value=[*(list() if current_value is missing else current_value), deepcopy(value)],
+                )
+            else:
+                raise OperationFailure(f"Unknown modifier: {operator}", code=9)
+
+
+def sort_documents(documents: list[dict], sort: list[tuple[str, int]]) -> list[dict]:
+    """
+    Sort by the least significant key first, relying on the stability of `list.sort` for the more significant ones.
+    """
+    for field, direction in reversed(sort):
+        documents.sort(key=lambda document: sort_key(get_field(document=document, path=field)), reverse=direction < 0)
+    return documents
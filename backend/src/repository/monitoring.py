@@ -0,0 +1,85 @@
+from threading import Lock
+
+from pymongo import monitoring
+
+
+class PoolStatisticsListener(monitoring.ConnectionPoolListener):
+    """
+    Count connection pool events of the per-worker Motor client, so that pool sizing can be tuned from data.
+    The driver calls the listener from its own threads, hence the lock.
+    """
+
+    def __init__(self) -> None:
+        self.lock: Lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.connections_created: int = 0
+            self.connections_closed: int = 0
+            self.connections_checked_out: int = 0
+            self.checkouts: int = 0
+            self.checkout_failures: int = 0
+            self.checkout_wait_seconds: float = 0.0
+            self.max_checkout_wait_seconds: float = 0.0
+            self.pool_clears: int = 0
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self.lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self.lock:
+            self.connections_created += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self.lock:
+            self.connections_closed += 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self.lock:
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        duration = getattr(event, "duration", None) or 0.0
+        with self.lock:
+            self.connections_checked_out += 1
+            self.checkouts += 1
+            self.checkout_wait_seconds += duration
+            self.max_checkout_wait_seconds = max(self.max_checkout_wait_seconds, duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self.lock:
+            self.connections_checked_out -= 1
+
+    @property
+    def statistics(self) -> dict[str, int | float]:
+        with self.lock:
+            return {
+                "open_connections": self.connections_created - self.connections_closed,
+                "connections_in_use": self.connections_checked_out,
+                "connections_created": self.connections_created,
+                "connections_closed": self.connections_closed,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "average_checkout_wait_ms": (
+                    self.checkout_wait_seconds / self.checkouts * 1000 if self.checkouts else 0.0
+                ),
+                "max_checkout_wait_ms": self.max_checkout_wait_seconds * 1000,
+                "pool_clears": self.pool_clears,
+            }
@@ -0,0 +1,69 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from json import dumps, JSONDecodeError, loads
+
+from pymongo import DESCENDING
+
+keyset_sort: list[tuple[str, int]] = [("createdAt", DESCENDING), ("_id", DESCENDING)]
+
+
+def encode_position(position: list) -> str:
+    """
+    Encode the sort key values of the last document of a page into an opaque cursor.
+    """
+    return urlsafe_b64encode(dumps(position, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_position(cursor: str, types: tuple[type | tuple[type, ...], ...]) -> list:
+    """
+    Decode an opaque cursor back into its sort key values, checking them against the expected `types`.
+    """
+    try:
+        position = loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (BinasciiError, JSONDecodeError, TypeError, ValueError, UnicodeDecodeError) as decode_error:
+        raise ValueError(f"Invalid cursor `{cursor}`!") from decode_error
+    if (
+        not isinstance(position, list)
+        or len(position) != len(types)
+        or not all(
+            isinstance(value, value_type) and not isinstance(value, bool) for value, value_type in zip(position, types)
+        )
+    ):
+        raise ValueError(f"Invalid cursor `{cursor}`!")
+    return position
+
+
+def encode_cursor(created_at: str, id: str) -> str:
+    """
+    Encode the `(createdAt, _id)` position of the last document of a page into an opaque cursor.
+    """
+    return encode_position(position=[created_at, id])
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Decode an opaque cursor back into its `(createdAt, _id)` position.
+    """
+    created_at, id = decode_position(cursor=cursor, types=(str, str))
+    return (created_at, id)
+
+
+def build_keyset_filter(cursor: str | None) -> dict:
+    """
+    Build the filter that seeks past the cursor position, so that every page is an index range scan
+    on `(createdAt, _id)` instead of a skip over all the previous pages.
+    """
+    if not cursor:
+        return {}
+    created_at, id = decode_cursor(cursor=cursor)
+    return {"$or": [{"createdAt": {"$lt": created_at}}, {"createdAt": created_at, "_id": {"$lt": id}}]}
+
+
+def paginate(documents: list[dict], limit: int) -> tuple[list[dict], str | None]:
+    """
+    Split documents fetched with `limit + 1` into the page and the cursor to the next page.
+    """
+    if len(documents) <= limit:
+        return (documents, None)
+    page = documents[:limit]
+    return (page, encode_cursor(created_at=page[-1]["createdAt"], id=str(page[-1]["_id"])))
@@ -0,0 +1,13 @@
+def build_projection(
+    fields: list[str] | None, field_keys: dict[str, str], required_keys: tuple[str, ...] = ()
+) -> dict[str, int] | None:
+    """
+    Translate the requested API fields into a MongoDB projection on their document keys, so that unrequested
+    fields are never read, sent over the wire, or decoded. `None` keeps the whole document.
+    """
+    if fields is None:
+        return None
+    projection = {field_keys[field]: 1 for field in fields}
+    for required_key in required_keys:
+        projection[required_key] = 1
+    return projection
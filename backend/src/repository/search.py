@@ -0,0 +1,87 @@
+from html import escape
+from re import compile as compile_regex, escape as re_escape, IGNORECASE, Pattern
+
+from src.repository.pagination import decode_position, encode_position
+
+search_term_pattern: Pattern = compile_regex(r'-?"[^"]*"|\S+')
+stemmed_suffixes: tuple[str, ...] = ("ing", "es", "ed", "s")
+
+
+def extract_query_terms(query: str) -> list[str]:
+    """
+    Split a `$text` search string into the terms worth highlighting: phrases are kept whole and negated terms,
+    which never appear in a match, are dropped.
+    """
+    terms = list()
+    for term in search_term_pattern.findall(query):
+        if term.startswith("-"):
+            continue
+        term = term.strip('"').strip()
+        if term:
+            terms.append(term)
+    return terms
+
+
+def stem_term(term: str) -> str:
+    stem = term.lower()
+    for suffix in stemmed_suffixes:
+        if stem.endswith(suffix) and len(stem) - len(suffix) >= 3:
+            return stem[: -len(suffix)]
+    return stem
+
+
+def build_highlight_pattern(terms: list[str]) -> Pattern | None:
+    """
+    Match the query terms and their inflections, e.g. `credits` also highlights `credit`, roughly like the
+    stemming of the text index does.
+    """
+    stems = [re_escape(escape(stem_term(term=term))) for term in terms]
+    if not stems:
+        return None
+    return compile_regex(r"\b(" + "|".join(sorted(set(stems), key=len, reverse=True)) + r")\w*", IGNORECASE)
+
+
+def build_snippet(text: str, highlight_pattern: Pattern | None, width: int) -> str:
+    """
+    Cut a window of about `width` characters around the first match out of the text, HTML-escape it and wrap the
+    matched terms in `<mark>` tags.
+    """
+    snippet = escape(text)
+    start = 0
+    match = highlight_pattern.search(snippet) if highlight_pattern else None
+    if match:
+        start = max(0, match.start() - width // 3)
+        while start > 0 and not snippet[start - 1].isspace():
+            start -= 1
+    end = min(len(snippet), start + width)
+    while end < len(snippet) and not snippet[end].isspace():
+        end += 1
+    window = snippet[start:end]
+    if highlight_pattern:
+        window = highlight_pattern.sub(lambda term: f"<mark>{term.group(0)}</mark>", window)
+    return ("…" if start > 0 else "") + window + ("…" if end < len(snippet) else "")
+
+
+def encode_search_cursor(score: float, id: str) -> str:
+    return encode_position(position=[score, id])
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, str]:
+    score, id = decode_position(cursor=cursor, types=((int, float), str))
+    return (float(score), id)
+
+
+def build_search_pipeline(query: str, cursor: str | None, limit: int, projection: dict[str, int]) -> list[dict]:
+    """
+    Rank the `$text` matches by relevance and seek past the `(score, _id)` position of the cursor, fetching one
+    document more than the page to know whether there is a next page.
+    """
+    pipeline: list[dict] = [
+        {"$match": {"$text": {"$search": query}}},
+        {"$project": {**projection, "score": {"$meta": "textScore"}}},
+    ]
+    if cursor:
+        score, id = decode_search_cursor(cursor=cursor)
+        pipeline.append({"$match": {"$or": [{"score": {"$lt": score}}, {"score": score, "_id": {"$lt": id}}]}})
+    pipeline.extend([{"$sort": {"score": -1, "_id": -1}}, {"$limit": limit + 1}])
+    return pipeline
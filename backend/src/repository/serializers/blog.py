@@ -2,14 +2,22 @@ from datetime import datetime
 
 from bson import ObjectId
 
+blog_fields: dict[str, str] = {
+    "id": "_id",
+    "title": "title",
+    "body": "body",
+    "author_name": "authorName",
+    "author_id": "authorId",
+    "created_at": "createdAt",
+    "updated_at": "updatedAt",
+}
 
-def serialize_blog(blog: dict) -> dict[str, str | datetime | ObjectId | None]:
+blog_search_fields: list[str] = ["id", "title", "author_name", "author_id", "created_at", "updated_at"]
+
+
+def serialize_blog(blog: dict, fields: list[str] | None = None) -> dict[str, str | datetime | ObjectId | None]:
     return {
-        "id": str(blog["_id"]),
-        "title": blog["title"],
-        "body": blog["body"],
-        "author_name": blog["authorName"],
-        "author_id": blog["authorId"],
-        "created_at": blog["createdAt"],
-        "updated_at": blog["updatedAt"],
+        field: str(blog[key]) if field == "id" else blog[key]
+        for field, key in blog_fields.items()
+        if key in blog and (fields is None or field in fields)
     }
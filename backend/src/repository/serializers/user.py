@@ -3,21 +3,31 @@ from datetime import datetime
 from bson import ObjectId
 from pydantic import EmailStr
 
+user_fields: dict[str, str] = {
+    "id": "_id",
+    "username": "username",
+    "email": "email",
+    "hashed_password": "hashedPassword",
+    "hashed_salt": "hashedSalt",
+    "email_verification_code": "emailVerificationCode",
+    "is_otp_enabled": "isOtpEnabled",
+    "is_otp_verified": "isOtpVerified",
+    "otp_base32": "otpBase32",
+    "otp_auth_url": "otpAuthUrl",
+    "is_verified": "isVerified",
+    "is_logged_in": "isLoggedIn",
+    "created_at": "createdAt",
+    "updated_at": "updatedAt",
+}
+user_secret_fields: tuple[str, ...] = ("hashed_password", "hashed_salt", "email_verification_code", "otp_base32")
+user_public_fields: list[str] = [field for field in user_fields if field not in user_secret_fields]
 
-def serialize_user(user: dict) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
+
+def serialize_user(
+    user: dict, fields: list[str] | None = None
+) -> dict[str, str | EmailStr | datetime | ObjectId | None]:
     return {
-        "id": str(user["_id"]),
-        "username": user["username"],
-        "email": user["email"],
-        "hashed_password": user["hashedPassword"],
-        "hashed_salt": user["hashedSalt"],
-        "email_verification_code": user["emailVerificationCode"],
-        "is_otp_enabled": user["isOtpEnabled"],
-        "is_otp_verified": user["isOtpVerified"],
-        "otp_base32": user["otpBase32"],
-        "otp_auth_url": user["otpAuthUrl"],
-        "is_verified": user["isVerified"],
-        "is_logged_in": user["isLoggedIn"],
-        "created_at": user["createdAt"],
-        "updated_at": user["updatedAt"],
+        field: str(user[key]) if field == "id" else user[key]
+        for field, key in user_fields.items()
+        if key in user and (fields is None or field in fields)
     }
@@ -44,13 +44,34 @@ class BlogCreateSchema(BaseSchema):
 
 
 class BlogResponseSchema(BaseSchema):
-    id: PyObjectId
-    title: constr(min_length=1, max_length=128)  # type: ignore
-    body: constr(min_length=1, max_length=4096)  # type: ignore
-    author_name: str
-    author_id: str
-    created_at: datetime
-    updated_at: datetime | None
+    id: PyObjectId | None = None
+    title: constr(min_length=1, max_length=128) | None = None  # type: ignore
+    body: constr(min_length=1, max_length=4096) | None = None  # type: ignore
+    author_name: str | None = None
+    author_id: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class BlogSearchResultSchema(BlogResponseSchema):
+    score: float
+    snippet: str
+
+
+class BlogSearchResponseSchema(BaseSchema):
+    results: list[BlogSearchResultSchema]
+    next_cursor: str | None
+
+
+class BlogImportErrorSchema(BaseSchema):
+    line: int
+    detail: str
+
+
+class BlogImportResponseSchema(BaseSchema):
+    inserted_count: int
+    failed_count: int
+    errors: list[BlogImportErrorSchema]
 
 
 class BlogDeletionResponseSchema(BaseSchema):
@@ -59,3 +80,4 @@ class BlogDeletionResponseSchema(BaseSchema):
 
 class BlogsResponseSchema(BaseSchema):
     blogs: list[BlogResponseSchema]
+    next_cursor: str | None
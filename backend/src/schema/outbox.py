@@ -0,0 +1,31 @@
+from datetime import datetime
+from enum import Enum
+
+from bson import ObjectId
+from pydantic import EmailStr, Field
+
+from src.schema.base import BaseSchema
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class OutboxMessageSchema(BaseSchema):
+    id: str = Field(default_factory=lambda: str(ObjectId()), alias="_id")
+    recipients: list[EmailStr] = Field(...)
+    subject: str = Field(...)
+    body: str = Field(...)
+    status: OutboxStatus = Field(default=OutboxStatus.PENDING)
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+    locked_until: datetime | None = Field(default=None)
+    last_error: str | None = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: datetime | None = Field(default=None)
+
+    class Config:
+        use_enum_values: bool = True
@@ -0,0 +1,64 @@
+from src.schema.base import BaseSchema
+
+
+class DatabasePoolStatisticsSchema(BaseSchema):
+    max_pool_size: int
+    min_pool_size: int
+    open_connections: int
+    connections_in_use: int
+    connections_created: int
+    connections_closed: int
+    checkouts: int
+    checkout_failures: int
+    average_checkout_wait_ms: float
+    max_checkout_wait_ms: float
+    pool_clears: int
+
+
+class CacheStatisticsSchema(BaseSchema):
+    name: str
+    size: int
+    max_size: int
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+
+
+class PasswordHashingStatisticsSchema(BaseSchema):
+    is_process_pool: bool
+    max_workers: int
+    max_queue_size: int
+    in_flight: int
+    completed: int
+    rejected: int
+    timeouts: int
+    failures: int
+    average_queue_wait_ms: float
+    max_queue_wait_ms: float
+    average_hashing_ms: float
+
+
+class AdmissionStatisticsSchema(BaseSchema):
+    name: str
+    max_cost: int
+    in_flight_cost: int
+    queue_length: int
+    max_queue_length: int
+    admitted: int
+    queued: int
+    shed: int
+    average_queue_wait_ms: float
+
+
+class StartupReportSchema(BaseSchema):
+    import_ms: float | None
+    import_budget_ms: float
+    startup_ms: float
+    startup_budget_ms: float
+    steps_ms: dict[str, float]
+    budget_overruns: list[str]
+    loaded_lazy_modules: list[str]
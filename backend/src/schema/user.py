@@ -86,20 +86,25 @@ class UserLogoutResponseSchema(BaseSchema):
 
 
 class UserResponseSchema(BaseSchema):
-    id: PyObjectId
-    username: constr(strip_whitespace=True, min_length=3, to_lower=True)  # type: ignore
-    email: EmailStr
-    hashed_password: str
-    hashed_salt: str
-    email_verification_code: str | None
-    is_otp_enabled: bool
-    is_otp_verified: bool
-    otp_base32: str | None
-    otp_auth_url: str | None
-    is_verified: bool
-    is_logged_in: bool
-    created_at: datetime
-    updated_at: datetime | None
+    id: PyObjectId | None = None
+    username: constr(strip_whitespace=True, min_length=3, to_lower=True) | None = None  # type: ignore
+    email: EmailStr | None = None
+    hashed_password: str | None = None
+    hashed_salt: str | None = None
+    email_verification_code: str | None = None
+    is_otp_enabled: bool | None = None
+    is_otp_verified: bool | None = None
+    otp_base32: str | None = None
+    otp_auth_url: str | None = None
+    is_verified: bool | None = None
+    is_logged_in: bool | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class UsersResponseSchema(BaseSchema):
+    users: list[UserResponseSchema]
+    next_cursor: str | None
 
 
 class UserDeletionResponseSchema(BaseSchema):
@@ -0,0 +1,93 @@
+from asyncio import Future, get_running_loop, TimeoutError as AsyncioTimeoutError, wait_for
+from collections import deque
+
+from src.config.manager import settings
+from src.services.exceptions.custom import RequestAdmissionRejected
+
+
+class AdmissionController:
+    """
+    Cap the CPU cost of the expensive requests in flight in this worker, e.g. one unit per password hash, so that
+    a burst of logins or registrations cannot take every core away from the cheap reads. A request whose cost
+    does not fit waits in a FIFO queue for at most `queue_timeout` seconds and is then shed. The controller is
+    meant for a single event loop and is therefore not locked.
+    """
+
+    def __init__(self, name: str, max_cost: int, queue_timeout: float, retry_after: int) -> None:
+        self.name: str = name
+        self.max_cost: int = max_cost
+        self.queue_timeout: float = queue_timeout
+        self.retry_after: int = retry_after
+        self.in_flight_cost: int = 0
+        self.waiters: deque[tuple[int, Future]] = deque()
+        self.admitted: int = 0
+        self.queued: int = 0
+        self.shed: int = 0
+        self.max_queue_length: int = 0
+        self.queue_wait_seconds: float = 0.0
+
+    def __admit_waiters(self) -> None:
+        while self.waiters and self.in_flight_cost + self.waiters[0][0] <= self.max_cost:
+            cost, waiter = self.waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight_cost += cost
+            waiter.set_result(None)
+
+    async def acquire(self, cost: int) -> None:
+        cost = min(cost, self.max_cost)
+        if not self.waiters and self.in_flight_cost + cost <= self.max_cost:
+            self.in_flight_cost += cost
+            self.admitted += 1
+            return
+        loop = get_running_loop()
+        queued_at = loop.time()
+        entry = (cost, loop.create_future())
+        self.waiters.append(entry)
+        self.queued += 1
+        self.max_queue_length = max(self.max_queue_length, len(self.waiters))
+        try:
+            await wait_for(entry[1], timeout=self.queue_timeout)
+        except AsyncioTimeoutError:
+            self.shed += 1
+            raise RequestAdmissionRejected(f"`{self.name}` shed a request after {self.queue_timeout} seconds!")
+        except BaseException:
+            if entry[1].done() and not entry[1].cancelled():
+                self.release(cost=cost)
+            raise
+        finally:
+            if entry in self.waiters:
+                self.waiters.remove(entry)
+                self.__admit_waiters()
+            self.queue_wait_seconds += loop.time() - queued_at
+        self.admitted += 1
+
+    def release(self, cost: int) -> None:
+        self.in_flight_cost -= min(cost, self.max_cost)
+        self.__admit_waiters()
+
+    @property
+    def statistics(self) -> dict[str, str | int | float]:
+        return {
+            "name": self.name,
+            "max_cost": self.max_cost,
+            "in_flight_cost": self.in_flight_cost,
+            "queue_length": len(self.waiters),
+            "max_queue_length": self.max_queue_length,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "average_queue_wait_ms": self.queue_wait_seconds / self.queued * 1000 if self.queued else 0.0,
+        }
+
+
+def get_hashing_admission_controller() -> AdmissionController:
+    return AdmissionController(
+        name="password-hashing",
+        max_cost=settings.ADMISSION_MAX_COST,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+    )
+
+
+hashing_admission_controller = get_hashing_admission_controller()
@@ -0,0 +1,25 @@
+from src.config.manager import settings
+from src.services.cache.lru import TTLLRUCache
+
+
+def get_blog_cache() -> TTLLRUCache:
+    return TTLLRUCache(
+        name="blogs",
+        max_size=settings.BLOG_CACHE_MAX_SIZE,
+        ttl=settings.BLOG_CACHE_TTL,
+        negative_ttl=settings.BLOG_CACHE_NEGATIVE_TTL,
+        is_registered=True,
+    )
+
+
+def get_blog_search_cache() -> TTLLRUCache:
+    return TTLLRUCache(
+        name="blog-searches",
+        max_size=settings.BLOG_SEARCH_CACHE_MAX_SIZE,
+        ttl=settings.BLOG_SEARCH_CACHE_TTL,
+        is_registered=True,
+    )
+
+
+blog_cache = get_blog_cache()
+blog_search_cache = get_blog_search_cache()
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+cache_miss: object = object()
+
+
+class TTLLRUCache:
+    """
+    A bounded, in-process LRU cache whose entries expire after a per-entry TTL.
+
+    A `None` value is a negative entry, i.e. the key is known not to exist, and it uses the shorter
+    `negative_ttl`. `get()` returns `cache_miss` when the key is absent or expired. A `max_size` of 0 disables
+    the cache. The cache is meant for a single event loop and is therefore not locked. Only the caches created
+    with `is_registered` are listed in `registered_caches`, i.e. reported on `/api/system/caches`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: float,
+        negative_ttl: float | None = None,
+        clock: Callable[[], float] = monotonic,
+        is_registered: bool = False,
+    ) -> None:
+        self.name: str = name
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self.negative_ttl: float = ttl if negative_ttl is None else negative_ttl
+        self.clock: Callable[[], float] = clock
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits: int = 0
+        self.negative_hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.invalidations: int = 0
+        if is_registered:
+            registered_caches[name] = self
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return cache_miss
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return cache_miss
+        self.entries.move_to_end(key)
+        if value is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if not self.is_enabled:
+            return
+        if ttl is None:
+            ttl = self.negative_ttl if value is None else self.ttl
+        if ttl <= 0:
+            return
+        self.entries[key] = (self.clock() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def set_missing(self, key: Hashable) -> None:
+        self.set(key=key, value=None)
+
+    def invalidate(self, key: Hashable) -> None:
+        if self.entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self.entries)
+        self.entries.clear()
+
+    @property
+    def statistics(self) -> dict[str, str | int | float]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+        }
+
+
+registered_caches: dict[str, TTLLRUCache] = dict()
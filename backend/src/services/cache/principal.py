@@ -0,0 +1,14 @@
+from src.config.manager import settings
+from src.services.cache.lru import TTLLRUCache
+
+
+def get_principal_cache() -> TTLLRUCache:
+    return TTLLRUCache(
+        name="principals",
+        max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+        ttl=settings.PRINCIPAL_CACHE_TTL,
+        is_registered=True,
+    )
+
+
+principal_cache = get_principal_cache()
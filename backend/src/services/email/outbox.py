@@ -0,0 +1,121 @@
+from asyncio import CancelledError, create_task, Event, Task, TimeoutError as AsyncioTimeoutError, wait_for
+from datetime import datetime, timedelta
+from random import uniform
+
+from loguru import logger
+
+from src.config.manager import settings
+from src.repository.crud.outbox import OutboxCRUDRepository
+from src.services.email.smtp import build_email_message, get_smtp_connection_pool, SMTPConnectionPool
+
+
+class OutboxWorker:
+    """
+    Drain the `outbox` collection in the background of every application worker: lease a batch of due messages,
+    deliver it over the pooled SMTP connections and reschedule the failures with an exponential, jittered backoff.
+    `notify()` wakes the worker up right after a message was enqueued, otherwise it polls every `poll_interval`.
+    """
+
+    def __init__(
+        self,
+        smtp_pool: SMTPConnectionPool,
+        batch_size: int,
+        poll_interval: float,
+        lease_seconds: float,
+        max_attempts: int,
+        backoff_base: float,
+        backoff_max: float,
+    ) -> None:
+        self.smtp_pool: SMTPConnectionPool = smtp_pool
+        self.batch_size: int = batch_size
+        self.poll_interval: float = poll_interval
+        self.lease_seconds: float = lease_seconds
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.wake_up: Event = Event()
+        self.task: Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def notify(self) -> None:
+        self.wake_up.set()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self.wake_up = Event()
+        self.task = create_task(self.__run())
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except CancelledError:
+                pass
+            self.task = None
+        await self.smtp_pool.close()
+
+    def next_attempt_at(self, attempts: int) -> datetime | None:
+        if attempts >= self.max_attempts:
+            return None
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        return datetime.utcnow() + timedelta(seconds=uniform(backoff / 2, backoff))
+
+    async def drain_once(self) -> int:
+        outbox_repo = OutboxCRUDRepository(collection_name="outbox")
+        messages = await outbox_repo.claim_batch(limit=self.batch_size, lease_seconds=self.lease_seconds)
+        errors = await self.smtp_pool.send_messages(
+            messages=[
+                build_email_message(
+                    sender=settings.MAIL_FROM,
+                    sender_name=settings.MAIL_FROM_USERNAME,
+                    recipients=message["recipients"],
+                    subject=message["subject"],
+                    body=message["body"],
+                )
+                for message in messages
+            ]
+        )
+        for message, error in zip(messages, errors):
+            if error is None:
+                await outbox_repo.mark_sent(message=message)
+                continue
+            next_attempt_at = self.next_attempt_at(attempts=message["attempts"] + 1)
+            if next_attempt_at is None:
+                logger.error(f"Outbox --- Giving up on message `{message['_id']}`: {error}")
+            await outbox_repo.mark_failed(message=message, error=str(error), next_attempt_at=next_attempt_at)
+        return len(messages)
+
+    async def __run(self) -> None:
+        while True:
+            try:
+                drained_messages = await self.drain_once()
+            except Exception as err:
+                logger.warning(f"Outbox --- Draining failed: {err}")
+                drained_messages = 0
+            if drained_messages == self.batch_size:
+                continue
+            try:
+                await wait_for(self.wake_up.wait(), timeout=self.poll_interval)
+            except AsyncioTimeoutError:
+                pass
+            self.wake_up.clear()
+
+
+def get_outbox_worker() -> OutboxWorker:
+    return OutboxWorker(
+        smtp_pool=get_smtp_connection_pool(),
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval=settings.OUTBOX_POLL_INTERVAL,
+        lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+        backoff_base=settings.OUTBOX_BACKOFF_BASE,
+        backoff_max=settings.OUTBOX_BACKOFF_MAX,
+    )
+
+
+outbox_worker = get_outbox_worker()
@@ -0,0 +1,156 @@
+from asyncio import gather
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import TYPE_CHECKING
+
+from src.config.manager import settings
+
+if TYPE_CHECKING:
+    from aiosmtplib import SMTP
+
+
+def build_email_message(sender: str, sender_name: str, recipients: list[str], subject: str, body: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = formataddr((sender_name, sender))
+    message["To"] = ", ".join(recipients)
+    message["Subject"] = subject
+    message.set_content(body, subtype="html")
+    return message
+
+
+class SMTPConnectionPool:
+    """
+    Keep up to `size` SMTP connections open and send every batch over them, many messages per connection, instead
+    of paying a TCP, TLS and AUTH handshake per email. A connection is recycled after
+    `max_messages_per_connection` messages and redialled once if the server dropped it while idle. `aiosmtplib` is
+    only imported once the first connection is dialled.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        use_tls: bool,
+        start_tls: bool,
+        size: int,
+        max_messages_per_connection: int,
+        timeout: float,
+    ) -> None:
+        self.hostname: str = hostname
+        self.port: int = port
+        self.username: str | None = username
+        self.password: str | None = password
+        self.use_tls: bool = use_tls
+        self.start_tls: bool = start_tls
+        self.size: int = size
+        self.max_messages_per_connection: int = max_messages_per_connection
+        self.timeout: float = timeout
+        self.clients: list["SMTP | None"] = [None] * size
+        self.client_message_counts: list[int] = [0] * size
+        self.connections_opened: int = 0
+        self.messages_sent: int = 0
+        self.messages_failed: int = 0
+
+    def __is_connected(self, slot: int) -> bool:
+        client = self.clients[slot]
+        return client is not None and client.is_connected
+
+    async def __disconnect(self, slot: int) -> None:
+        from aiosmtplib import SMTPException
+
+        client, self.clients[slot] = self.clients[slot], None
+        if client is None or not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except SMTPException:
+            client.close()
+
+    async def __acquire(self, slot: int) -> "SMTP":
+        from aiosmtplib import SMTP
+
+        if self.__is_connected(slot) and self.client_message_counts[slot] < self.max_messages_per_connection:
+            return self.clients[slot]  # type: ignore
+        await self.__disconnect(slot)
+        client = SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self.clients[slot] = client
+        self.client_message_counts[slot] = 0
+        self.connections_opened += 1
+        return client
+
+    async def __send_over_connection(self, slot: int, messages: list[EmailMessage]) -> list[Exception | None]:
+        from aiosmtplib import SMTPException, SMTPServerDisconnected
+
+        errors: list[Exception | None] = list()
+        for message in messages:
+            try:
+                try:
+                    await (await self.__acquire(slot)).send_message(message)
+                except SMTPServerDisconnected:
+                    await self.__disconnect(slot)
+                    await (await self.__acquire(slot)).send_message(message)
+            except (SMTPException, OSError) as err:
+                self.messages_failed += 1
+                errors.append(err)
+                if not self.__is_connected(slot):
+                    self.messages_failed += len(messages) - len(errors)
+                    errors.extend([err] * (len(messages) - len(errors)))
+                    break
+            else:
+                self.client_message_counts[slot] += 1
+                self.messages_sent += 1
+                errors.append(None)
+        return errors
+
+    async def send_messages(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        """
+        Spread the messages over the connections and return the delivery error of every message, in order, or
+        None for those that were accepted by the server.
+        """
+        if not messages:
+            return list()
+        slots = min(self.size, len(messages))
+        slot_errors = await gather(
+            *(self.__send_over_connection(slot=slot, messages=messages[slot::slots]) for slot in range(slots))
+        )
+        errors: list[Exception | None] = [None] * len(messages)
+        for slot, slot_error in enumerate(slot_errors):
+            errors[slot::slots] = slot_error
+        return errors
+
+    async def close(self) -> None:
+        await gather(*(self.__disconnect(slot) for slot in range(self.size)))
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        return {
+            "open_connections": sum(self.__is_connected(slot) for slot in range(self.size)),
+            "connections_opened": self.connections_opened,
+            "messages_sent": self.messages_sent,
+            "messages_failed": self.messages_failed,
+        }
+
+
+def get_smtp_connection_pool() -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname=settings.MAIL_SERVER,
+        port=settings.MAIL_PORT,
+        username=settings.MAIL_USERNAME if settings.IS_USE_CREDENTIALS else None,
+        password=settings.MAIL_PASSWORD if settings.IS_USE_CREDENTIALS else None,
+        use_tls=settings.IS_SSL_TLS,
+        start_tls=settings.IS_STARTTLS,
+        size=settings.SMTP_POOL_SIZE,
+        max_messages_per_connection=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+        timeout=settings.SMTP_TIMEOUT,
+    )
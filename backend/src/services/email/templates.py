@@ -0,0 +1,96 @@
+from asyncio import to_thread
+from functools import cached_property
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+from markupsafe import Markup
+
+from src.config.manager import settings
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+static_fragments: dict[str, str] = {"styles": "_styles.html"}
+
+
+class EmailTemplateRenderer:
+    """
+    Render the email templates from one shared Jinja environment, so that every template is parsed and compiled
+    once per process instead of once per email. Compiled templates are also kept in a bytecode cache on disk,
+    which spares the other workers and the next restart the compilation. Fragments without variables, such as the
+    styles, are rendered once and exposed to the templates as globals. Jinja is only imported once the first
+    template is needed, so that a worker boots without it. A `bytecode_cache_dir` of `None` disables the bytecode
+    cache and an empty one keeps it in the system temporary directory.
+    """
+
+    def __init__(self, template_dir: Path, bytecode_cache_dir: str | None, is_auto_reloaded: bool) -> None:
+        self.template_dir: Path = template_dir
+        self.bytecode_cache_dir: str | None = bytecode_cache_dir
+        self.is_auto_reloaded: bool = is_auto_reloaded
+        self.is_warmed_up: bool = False
+
+    @cached_property
+    def environment(self) -> "Environment":
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+        return Environment(
+            loader=FileSystemLoader(searchpath=self.template_dir),
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=(
+                None
+                if self.bytecode_cache_dir is None
+                else FileSystemBytecodeCache(directory=self.bytecode_cache_dir or None)
+            ),
+            auto_reload=self.is_auto_reloaded,
+        )
+
+    def warm_up(self) -> None:
+        """
+        Pre-render the static fragments and compile every template, so that the first email pays no disk I/O.
+        """
+        for name, template_name in static_fragments.items():
+            self.environment.globals[name] = Markup(self.environment.get_template(name=template_name).render())
+        for template_name in self.environment.list_templates(extensions=["html"]):
+            self.environment.get_template(name=template_name)
+        self.is_warmed_up = True
+
+    def render(self, template_name: str, **context: Any) -> str:
+        if not self.is_warmed_up:
+            self.warm_up()
+        return self.environment.get_template(name=f"{template_name}.html").render(**context)
+
+    def render_batch(self, template_name: str, contexts: list[dict[str, Any]]) -> list[str]:
+        if not self.is_warmed_up:
+            self.warm_up()
+        template = self.environment.get_template(name=f"{template_name}.html")
+        return [template.render(**context) for context in contexts]
+
+    async def render_async(self, template_name: str, **context: Any) -> str:
+        return (await self.render_batch_async(template_name=template_name, contexts=[context]))[0]
+
+    async def render_batch_async(
+        self, template_name: str, contexts: list[dict[str, Any]], chunk_size: int = 500
+    ) -> list[str]:
+        """
+        Render personalised emails in chunks on a worker thread, so that a bulk send of thousands of messages
+        does not hold the event loop for the whole batch.
+        """
+        rendered_emails: list[str] = list()
+        for start in range(0, len(contexts), chunk_size):
+            rendered_emails.extend(
+                await to_thread(self.render_batch, template_name, contexts[start : start + chunk_size])
+            )
+        return rendered_emails
+
+
+def get_email_template_renderer() -> EmailTemplateRenderer:
+    return EmailTemplateRenderer(
+        template_dir=settings.TEMPLATE_DIR,
+        bytecode_cache_dir=(
+            settings.EMAIL_TEMPLATE_BYTECODE_CACHE_DIR if settings.IS_EMAIL_TEMPLATE_BYTECODE_CACHED else None
+        ),
+        is_auto_reloaded=settings.IS_EMAIL_TEMPLATE_AUTO_RELOADED,
+    )
+
+
+email_template_renderer = get_email_template_renderer()
@@ -26,3 +26,15 @@ class PasswordDoesNotMatch(Exception):
     """
     Throw an error if Account password doesn't match.
     """
+
+
+class PasswordHashingUnavailable(Exception):
+    """
+    Throw an exception when the password hashing pool is saturated, timed out, or crashed.
+    """
+
+
+class RequestAdmissionRejected(Exception):
+    """
+    Throw an exception when an expensive request waited longer than the admission queue timeout.
+    """
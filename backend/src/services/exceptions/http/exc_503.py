@@ -0,0 +1,12 @@
+from fastapi import status
+from fastapi.exceptions import HTTPException
+
+from src.services.messages.exceptions.http.exc_details import http_503_service_unavailable_details
+
+
+async def http_exc_503_service_unavailable_request(retry_after: int = 1) -> Exception:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=http_503_service_unavailable_details(),
+        headers={"Retry-After": str(retry_after)},
+    )
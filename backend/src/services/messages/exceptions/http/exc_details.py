@@ -44,3 +44,7 @@ def http_404_email_details(email: str) -> str:
 
 def http_404_name_details(name: str) -> str:
     return f"Either the entity with name {name} doesn't exist or has been deleted!"
+
+
+def http_503_service_unavailable_details() -> str:
+    return "The service is busy! Please try again shortly."
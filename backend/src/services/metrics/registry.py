@@ -0,0 +1,87 @@
+from os import environ, getpid
+
+from prometheus_client import (
+    CollectorRegistry,
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    generate_latest,
+    Histogram,
+    multiprocess,
+    REGISTRY,
+    values,
+)
+
+from src.config.manager import settings
+
+size_buckets: tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+hashing_buckets: tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+token_buckets: tuple[float, ...] = (0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+
+
+def enable_multiprocess_mode(directory: str) -> None:
+    """
+    Let every uvicorn worker write its samples into memory-mapped files in `directory`, which `/metrics` then
+    aggregates, so that a scrape reports the whole server whichever worker answers it. The directory must be
+    emptied before the server starts.
+    """
+    environ.setdefault("PROMETHEUS_MULTIPROC_DIR", directory)
+    values.ValueClass = values.get_value_class()
+
+
+def is_multiprocess_mode() -> bool:
+    return bool(environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if not is_multiprocess_mode():
+        return (generate_latest(REGISTRY), CONTENT_TYPE_LATEST)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return (generate_latest(registry), CONTENT_TYPE_LATEST)
+
+
+def mark_worker_stopped() -> None:
+    if is_multiprocess_mode():
+        multiprocess.mark_process_dead(getpid())
+
+
+if settings.PROMETHEUS_MULTIPROC_DIR:
+    enable_multiprocess_mode(directory=settings.PROMETHEUS_MULTIPROC_DIR)
+
+http_requests = Counter(
+    "http_requests_total", "HTTP requests by route and status code.", ["method", "route", "status_code"]
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ["method", "route"]
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress", "HTTP requests in flight by route.", ["method", "route"], multiprocess_mode="livesum"
+)
+http_request_size = Histogram(
+    "http_request_size_bytes", "HTTP request body size by route.", ["method", "route"], buckets=size_buckets
+)
+http_response_size = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size on the wire by route.",
+    ["method", "route"],
+    buckets=size_buckets,
+)
+password_hashing_duration = Histogram(
+    "password_hashing_duration_seconds",
+    "Time spent in a `PasswordManager` operation inside the hashing pool.",
+    ["operation"],
+    buckets=hashing_buckets,
+)
+password_hashing_queue_wait = Histogram(
+    "password_hashing_queue_wait_seconds",
+    "Time a `PasswordManager` operation waited for a hashing pool worker.",
+    ["operation"],
+    buckets=hashing_buckets,
+)
+token_verification_duration = Histogram(
+    "token_verification_duration_seconds",
+    "Time spent verifying a JWT in `TokenManager`, by result.",
+    ["result"],
+    buckets=token_buckets,
+)
@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from sys import modules
+from time import perf_counter
+from typing import Iterator
+
+from src import import_started_at
+from src.config.manager import settings
+
+lazily_imported_modules: tuple[str, ...] = ("motor", "passlib", "jinja2", "aiosmtplib")
+
+
+class StartupReport:
+    """
+    Record how long the application took to import and how long every startup step took, and hold both totals
+    against their budgets, so that a slow boot shows up in the logs of every worker start instead of in the
+    readiness probes of an autoscaler.
+    """
+
+    def __init__(self, started_at: float, import_budget_ms: float, startup_budget_ms: float) -> None:
+        self.started_at: float = started_at
+        self.import_budget_ms: float = import_budget_ms
+        self.startup_budget_ms: float = startup_budget_ms
+        self.import_ms: float | None = None
+        self.step_durations_ms: dict[str, float] = dict()
+
+    def mark_imported(self) -> None:
+        if self.import_ms is None:
+            self.import_ms = (perf_counter() - self.started_at) * 1000
+
+    @contextmanager
+    def measure(self, step: str) -> Iterator[None]:
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.step_durations_ms[step] = (perf_counter() - started_at) * 1000
+
+    @property
+    def startup_ms(self) -> float:
+        return sum(self.step_durations_ms.values())
+
+    @property
+    def budget_overruns(self) -> list[str]:
+        overruns = list()
+        if self.import_ms is not None and self.import_ms > self.import_budget_ms:
+            overruns.append(f"import took {self.import_ms:.0f} ms of a {self.import_budget_ms:.0f} ms budget")
+        if self.startup_ms > self.startup_budget_ms:
+            slowest_step = max(self.step_durations_ms, key=self.step_durations_ms.__getitem__)
+            overruns.append(
+                f"startup took {self.startup_ms:.0f} ms of a {self.startup_budget_ms:.0f} ms budget, of which"
+                f" `{slowest_step}` {self.step_durations_ms[slowest_step]:.0f} ms"
+            )
+        return overruns
+
+    @property
+    def loaded_lazy_modules(self) -> list[str]:
+        return [name for name in lazily_imported_modules if name in modules]
+
+    @property
+    def statistics(self) -> dict[str, float | dict[str, float] | list[str] | None]:
+        return {
+            "import_ms": self.import_ms,
+            "import_budget_ms": self.import_budget_ms,
+            "startup_ms": self.startup_ms,
+            "startup_budget_ms": self.startup_budget_ms,
+            "steps_ms": dict(self.step_durations_ms),
+            "budget_overruns": self.budget_overruns,
+            "loaded_lazy_modules": self.loaded_lazy_modules,
+        }
+
+
+def get_startup_report() -> StartupReport:
+    return StartupReport(
+        started_at=import_started_at,
+        import_budget_ms=settings.STARTUP_IMPORT_BUDGET_MS,
+        startup_budget_ms=settings.STARTUP_BUDGET_MS,
+    )
+
+
+startup_report = get_startup_report()
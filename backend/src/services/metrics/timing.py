@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestTimings:
+    """
+    Accumulate the time a request spends in each named span. Spans may nest, and a span only counts its own
+    time, e.g. the password hashing inside a repository call is not counted again as database time.
+    """
+
+    def __init__(self) -> None:
+        self.started_at: float = perf_counter()
+        self.durations: dict[str, float] = dict()
+        self.counts: dict[str, int] = dict()
+
+    def add(self, name: str, duration: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    @property
+    def statistics(self) -> dict[str, float]:
+        total_ms = (perf_counter() - self.started_at) * 1000
+        return {**{name: duration * 1000 for name, duration in self.durations.items()}, "total": total_ms}
+
+    def to_header(self, is_total_only: bool = False) -> str:
+        """
+        Render the spans as a `Server-Timing` header value, e.g. `db;dur=1.2;desc="x2", total;dur=3.4`.
+        """
+        metrics = [
+            f'{name};dur={duration * 1000:.2f};desc="x{self.counts[name]}"'
+            for name, duration in self.durations.items()
+            if not is_total_only
+        ]
+        metrics.append(f"total;dur={(perf_counter() - self.started_at) * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+nested_span_durations: ContextVar[list[float] | None] = ContextVar("nested_span_durations", default=None)
+
+
+@contextmanager
+def timed_span(name: str) -> Iterator[None]:
+    """
+    Time a span of the current request. The time of the spans nested in it is accumulated in a cell of its own
+    task context, so that the spans of tasks running concurrently inside it, e.g. with `gather`, each add their
+    time to it instead of to one another. The own time of a span is never negative, even when its concurrent
+    nested spans add up to more than it lasted.
+    """
+    timings = request_timings.get()
+    if timings is None:
+        yield
+        return
+    parent_nested_durations = nested_span_durations.get()
+    nested_durations = [0.0]
+    context_token = nested_span_durations.set(nested_durations)
+    started_at = perf_counter()
+    try:
+        yield
+    finally:
+        duration = perf_counter() - started_at
+        nested_span_durations.reset(context_token)
+        timings.add(name=name, duration=max(0.0, duration - nested_durations[0]))
+        if parent_nested_durations is not None:
+            parent_nested_durations[0] += duration
+
+
+def timed(name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    def decorator(function: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with timed_span(name=name):
+                return await function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
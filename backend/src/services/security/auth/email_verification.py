@@ -1,8 +1,10 @@
-from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pydantic import EmailStr
 
 from src.config.manager import settings
+from src.repository.crud.outbox import OutboxCRUDRepository
+from src.services.email.outbox import outbox_worker
+from src.services.email.templates import email_template_renderer
+from src.services.metrics.timing import timed
 
 
 class EmailService:
@@ -13,31 +15,24 @@ class EmailService:
         self.url = url
         pass
 
-    async def send_email(self, subject: str, template_name: str):
-        conf = ConnectionConfig(
-            MAIL_USERNAME=settings.MAIL_USERNAME,
-            MAIL_PASSWORD=settings.MAIL_PASSWORD,
-            MAIL_FROM=self.sender,
-            MAIL_FROM_NAME=settings.MAIL_FROM_USERNAME,
-            MAIL_PORT=settings.MAIL_PORT,
-            MAIL_SERVER=settings.MAIL_SERVER,
-            MAIL_STARTTLS=settings.IS_STARTTLS,
-            MAIL_SSL_TLS=settings.IS_SSL_TLS,
-            USE_CREDENTIALS=settings.IS_USE_CREDENTIALS,
-            MAIL_DEBUG=1,
-            TEMPLATE_FOLDER=settings.TEMPLATE_DIR,
+    def render_email(self, subject: str, template_name: str) -> str:
+        return email_template_renderer.render(
+            template_name=template_name, url=self.url, username=self.username, subject=subject
         )
 
-        env = Environment(
-            loader=FileSystemLoader(searchpath=settings.TEMPLATE_DIR), autoescape=select_autoescape(["html", "xml"])
+    @timed(name="email")
+    async def send_email(self, outbox_repo: OutboxCRUDRepository, subject: str, template_name: str):
+        """
+        Write the rendered email to the outbox and wake up the outbox worker, which delivers it in the background.
+        """
+        await outbox_repo.enqueue(
+            recipients=self.emails,
+            subject=subject,
+            body=self.render_email(subject=subject, template_name=template_name),
         )
-        template = env.get_template(name=f"{template_name}.html")
-        html = template.render(url=self.url, username=self.username, subject=subject)
+        outbox_worker.notify()
 
-        await FastMail(conf).send_message(
-            message=MessageSchema(subject=subject, recipients=self.emails, body=html, subtype=MessageType.html),
-            template_name=f"{template_name}.html",
+    async def send_account_verification(self, outbox_repo: OutboxCRUDRepository):
+        await self.send_email(
+            outbox_repo=outbox_repo, subject="Pala Blog - Email Confirmation", template_name="verification"
         )
-
-    async def send_account_verification(self):
-        await self.send_email(subject="Pala Blog - Email Confirmation", template_name="verification")
@@ -1,4 +1,6 @@
 from datetime import datetime, timedelta
+from hashlib import sha256
+from time import perf_counter, time
 
 import pytz  # type: ignore
 from fastapi import status
@@ -8,12 +10,17 @@ from pydantic import ValidationError
 
 from src.config.manager import settings
 from src.schema.token import TokenDataSchema, TokenDetailSchema, TokenRetrievedSchema
+from src.services.cache.lru import cache_miss, TTLLRUCache
+from src.services.metrics.registry import token_verification_duration
+from src.services.metrics.timing import timed_span
 from src.services.security.auth.oauth2.scopes import cookie_scopes
 
 
 class TokenManager:
     def __init__(self) -> None:
-        pass
+        self.verified_tokens: TTLLRUCache = TTLLRUCache(
+            name="tokens", max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_MAX_TTL, is_registered=True
+        )
 
     def __generate_token(self, *, token_data: dict[str, str], expiry_delta: timedelta | None = None) -> str:
         to_encode = token_data.copy()
@@ -32,14 +39,41 @@ class TokenManager:
         if not username:
             raise Exception(f"Invalid username!")
 
-        return self.__generate_token(
-            token_data=TokenDetailSchema(username=username).dict(),
-            expiry_delta=timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRES_IN if not is_refresh else settings.REFRESH_TOKEN_EXPIRES_IN
-            ),
-        )
+        with timed_span(name="jwt"):
+            return self.__generate_token(
+                token_data=TokenDetailSchema(username=username).dict(),
+                expiry_delta=timedelta(
+                    minutes=settings.ACCESS_TOKEN_EXPIRES_IN if not is_refresh else settings.REFRESH_TOKEN_EXPIRES_IN
+                ),
+            )
 
     def retrieve_token_details(self, token: str) -> dict:
+        """
+        Return the claims of a verified token. Tokens that were already verified are served from a bounded cache
+        keyed by their SHA-256 digest until they expire, so repeat callers skip the HMAC verification. The returned
+        claims are shared between callers and must not be mutated.
+        """
+        started_at = perf_counter()
+        token_digest = sha256(token.encode()).digest()
+        token_details = self.verified_tokens.get(key=token_digest)
+        if token_details is not cache_miss:
+            token_verification_duration.labels(result="cached").observe(perf_counter() - started_at)
+            return token_details
+        try:
+            with timed_span(name="jwt"):
+                token_details = self.__verify_token(token=token)
+        except Exception:
+            token_verification_duration.labels(result="rejected").observe(perf_counter() - started_at)
+            raise
+        token_verification_duration.labels(result="verified").observe(perf_counter() - started_at)
+        self.verified_tokens.set(
+            key=token_digest,
+            value=token_details,
+            ttl=min(token_details["exp"].timestamp() - time(), settings.TOKEN_CACHE_MAX_TTL),
+        )
+        return token_details
+
+    def __verify_token(self, token: str) -> dict:
         try:
             token_data = jose_jwt.decode(
                 token=token, key=settings.JWT_SECRET_KEY.get_secret_value(), algorithms=[settings.JWT_ALGORITHM]
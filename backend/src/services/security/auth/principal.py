@@ -0,0 +1,34 @@
+from dataclasses import dataclass, fields as dataclass_fields
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class UserPrincipal:
+    """
+    An immutable snapshot of the public fields of the authenticated user. It is built from trusted repository
+    data without model validation and cached between requests, so it never carries password or OTP secrets.
+    """
+
+    id: str
+    username: str
+    email: str
+    is_otp_enabled: bool
+    is_otp_verified: bool
+    otp_auth_url: str | None
+    is_verified: bool
+    is_logged_in: bool
+    created_at: datetime | str
+    updated_at: datetime | str | None
+
+    @classmethod
+    def from_user(cls, user: dict) -> "UserPrincipal":
+        field_values: dict[str, Any] = {field.name: user.get(field.name) for field in dataclass_fields(cls)}
+        return cls(**field_values)
+
+    def dict(self, include: set[str] | None = None) -> dict:
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclass_fields(self)
+            if include is None or field.name in include
+        }
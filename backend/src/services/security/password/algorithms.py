@@ -1,9 +1,21 @@
 from abc import ABCMeta, abstractmethod
-
-from passlib.context import CryptContext as PasslibCryptContext
+from typing import Any, TYPE_CHECKING
 
 from src.config.manager import settings
 
+if TYPE_CHECKING:
+    from passlib.context import CryptContext as PasslibCryptContext
+
+
+def build_crypt_context(**context_settings: Any) -> "PasslibCryptContext":
+    """
+    Import passlib only when the first hashing function is built, see `get_hashing_function`, so that a worker
+    boots without it and only the processes that hash passwords ever load it.
+    """
+    from passlib.context import CryptContext as PasslibCryptContext
+
+    return PasslibCryptContext(**context_settings)
+
 
 class HashingAlgorithm(metaclass=ABCMeta):
     @abstractmethod
@@ -18,11 +30,29 @@ class HashingAlgorithm(metaclass=ABCMeta):
         Returns True the string is hashed with the chosen algorithm.
         """
 
+    @abstractmethod
+    def needs_update(self, hashed_secret: str) -> bool:
+        """
+        Returns True if the hash was made with other parameters than the configured ones.
+        """
+
 
 class Argon2Algorithm(HashingAlgorithm):
-    def __init__(self):
-        self.algorithm: PasslibCryptContext = PasslibCryptContext(
-            schemes=[settings.ARGON2_HASHING_ALGORITHM], deprecated="auto"
+    def __init__(
+        self,
+        time_cost: int = settings.ARGON2_TIME_COST,
+        memory_cost: int = settings.ARGON2_MEMORY_COST,
+        parallelism: int = settings.ARGON2_PARALLELISM,
+    ):
+        scheme = settings.ARGON2_HASHING_ALGORITHM
+        self.algorithm: "PasslibCryptContext" = build_crypt_context(
+            schemes=[scheme],
+            deprecated="auto",
+            **{
+                f"{scheme}__rounds": time_cost,
+                f"{scheme}__memory_cost": memory_cost,
+                f"{scheme}__parallelism": parallelism,
+            },
         )
 
     def generate_hash(self, salt: str, secret: str | None) -> str:
@@ -33,14 +63,18 @@ class Argon2Algorithm(HashingAlgorithm):
     def is_hash_verified(self, secret: str, hashed_secret: str) -> bool:
         return self.algorithm.verify(secret=secret, hash=hashed_secret)
 
+    def needs_update(self, hashed_secret: str) -> bool:
+        return self.algorithm.needs_update(hash=hashed_secret)
+
     def __str__(self) -> str:
         return "Argon 2"
 
 
 class BCryptAlgorithm(HashingAlgorithm):
-    def __init__(self):
-        self.algorithm: PasslibCryptContext = PasslibCryptContext(
-            schemes=[settings.BCRYPT_HASHING_ALGORITHM], deprecated="auto"
+    def __init__(self, rounds: int = settings.BCRYPT_ROUNDS):
+        scheme = settings.BCRYPT_HASHING_ALGORITHM
+        self.algorithm: "PasslibCryptContext" = build_crypt_context(
+            schemes=[scheme], deprecated="auto", **{f"{scheme}__rounds": rounds}
         )
 
     def generate_hash(self, salt: str, secret: str | None) -> str:
@@ -51,13 +85,16 @@ class BCryptAlgorithm(HashingAlgorithm):
     def is_hash_verified(self, secret: str, hashed_secret: str) -> bool:
         return self.algorithm.verify(secret=secret, hash=hashed_secret)
 
+    def needs_update(self, hashed_secret: str) -> bool:
+        return self.algorithm.needs_update(hash=hashed_secret)
+
     def __str__(self) -> str:
         return "BCrypt"
 
 
 class SHA256Algorithm(HashingAlgorithm):
     def __init__(self):
-        self.algorithm: PasslibCryptContext = PasslibCryptContext(
+        self.algorithm: "PasslibCryptContext" = build_crypt_context(
             schemes=[settings.SHA256_HASHING_ALGORITHM], deprecated="auto"
         )
 
@@ -69,13 +106,16 @@ class SHA256Algorithm(HashingAlgorithm):
     def is_hash_verified(self, secret: str, hashed_secret: str) -> bool:
         return self.algorithm.verify(secret=secret, hash=hashed_secret)
 
+    def needs_update(self, hashed_secret: str) -> bool:
+        return self.algorithm.needs_update(hash=hashed_secret)
+
     def __str__(self) -> str:
         return "SHA 256"
 
 
 class SHA512Algorithm(HashingAlgorithm):
     def __init__(self):
-        self.algorithm: PasslibCryptContext = PasslibCryptContext(
+        self.algorithm: "PasslibCryptContext" = build_crypt_context(
             schemes=[settings.SHA512_HASHING_ALGORITHM], deprecated="auto"
         )
 
@@ -87,5 +127,8 @@ class SHA512Algorithm(HashingAlgorithm):
     def is_hash_verified(self, secret: str, hashed_secret: str) -> bool:
         return self.algorithm.verify(secret=secret, hash=hashed_secret)
 
+    def needs_update(self, hashed_secret: str) -> bool:
+        return self.algorithm.needs_update(hash=hashed_secret)
+
     def __str__(self) -> str:
         return "SHA 512"
@@ -0,0 +1,69 @@
+from statistics import median
+from time import perf_counter
+
+from src.config.manager import settings
+from src.services.security.password.algorithms import Argon2Algorithm, BCryptAlgorithm, HashingAlgorithm
+
+calibration_secret: str = "calibration-password"
+
+
+def measure_hashing_ms(algorithm: HashingAlgorithm, samples: int = 3) -> float:
+    """
+    Return the median wall time of hashing one password with the given algorithm on this host.
+    """
+    durations = list()
+    for _ in range(samples):
+        started_at = perf_counter()
+        algorithm.generate_hash(salt=settings.HASHING_SALT, secret=calibration_secret)
+        durations.append((perf_counter() - started_at) * 1000)
+    return median(durations)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int = 3, max_rounds: int = 20) -> tuple[dict[str, int], float]:
+    """
+    Pick the highest BCrypt work factor whose hashing latency stays within `target_ms`. Every extra round doubles
+    the cost, so the search stops at the first round that would overshoot.
+    """
+    rounds = 4
+    latency_ms = measure_hashing_ms(algorithm=BCryptAlgorithm(rounds=rounds), samples=samples)
+    while rounds < max_rounds:
+        next_latency_ms = measure_hashing_ms(algorithm=BCryptAlgorithm(rounds=rounds + 1), samples=samples)
+        if next_latency_ms > target_ms:
+            break
+        rounds, latency_ms = rounds + 1, next_latency_ms
+    return ({"BCRYPT_ROUNDS": rounds}, latency_ms)
+
+
+def calibrate_argon2(
+    target_ms: float,
+    memory_cost: int = settings.ARGON2_MEMORY_COST,
+    parallelism: int = settings.ARGON2_PARALLELISM,
+    samples: int = 3,
+    max_time_cost: int = 32,
+) -> tuple[dict[str, int], float]:
+    """
+    Pick the highest Argon2 time cost whose hashing latency stays within `target_ms` at the given memory cost.
+    If a single pass is already too slow, the memory cost is halved until it fits, but never below the minimum
+    of 8 KiB per lane.
+    """
+
+    def measure(time_cost: int, memory_cost: int) -> float:
+        return measure_hashing_ms(
+            algorithm=Argon2Algorithm(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism),
+            samples=samples,
+        )
+
+    time_cost = 1
+    latency_ms = measure(time_cost=time_cost, memory_cost=memory_cost)
+    while latency_ms > target_ms and memory_cost // 2 >= 8 * parallelism:
+        memory_cost //= 2
+        latency_ms = measure(time_cost=time_cost, memory_cost=memory_cost)
+    while time_cost < max_time_cost:
+        next_latency_ms = measure(time_cost=time_cost + 1, memory_cost=memory_cost)
+        if next_latency_ms > target_ms:
+            break
+        time_cost, latency_ms = time_cost + 1, next_latency_ms
+    return (
+        {"ARGON2_TIME_COST": time_cost, "ARGON2_MEMORY_COST": memory_cost, "ARGON2_PARALLELISM": parallelism},
+        latency_ms,
+    )
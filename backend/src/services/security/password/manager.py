@@ -5,22 +5,47 @@ from src.services.security.password.hashing import get_hashing_function
 
 
 class PasswordManager:
-    @staticmethod
-    def generate_double_layered_password(password: str) -> tuple[str, str]:
-        hashed_salt = get_hashing_function(algorithm=settings.PWD_ALGORITHM_LAYER_1).generate_hash(
+    def __init__(
+        self,
+        layer_1_algorithm: str = settings.PWD_ALGORITHM_LAYER_1,
+        layer_2_algorithm: str = settings.PWD_ALGORITHM_LAYER_2,
+    ) -> None:
+        self.layer_1_algorithm: str = layer_1_algorithm
+        self.layer_2_algorithm: str = layer_2_algorithm
+
+    def generate_double_layered_password(self, password: str) -> tuple[str, str]:
+        hashed_salt = get_hashing_function(algorithm=self.layer_1_algorithm).generate_hash(
             salt=settings.HASHING_SALT, secret=None
         )
-        hashed_password = get_hashing_function(algorithm=settings.PWD_ALGORITHM_LAYER_2).generate_hash(
+        hashed_password = get_hashing_function(algorithm=self.layer_2_algorithm).generate_hash(
             salt=hashed_salt, secret=password
         )
         return (hashed_salt, hashed_password)
 
-    @staticmethod
-    def is_hashed_password_verified(hashed_salt: str, password: str, hashed_password: str) -> bool:
-        return get_hashing_function(algorithm=settings.PWD_ALGORITHM_LAYER_2).is_hash_verified(
+    def is_hashed_password_verified(self, hashed_salt: str, password: str, hashed_password: str) -> bool:
+        return get_hashing_function(algorithm=self.layer_2_algorithm).is_hash_verified(
             secret=hashed_salt + password, hashed_secret=hashed_password
         )
 
+    def verify_and_update_password(
+        self, hashed_salt: str, password: str, hashed_password: str
+    ) -> tuple[bool, tuple[str, str] | None]:
+        """
+        Verify the password and, if either layer was hashed with other costs than the configured ones, rehash it
+        while the plain password is at hand. Returns whether the password matched and the new `(hashed_salt,
+        hashed_password)` pair, or None if the stored hashes are up to date.
+        """
+        if not self.is_hashed_password_verified(
+            hashed_salt=hashed_salt, password=password, hashed_password=hashed_password
+        ):
+            return (False, None)
+        if not (
+            get_hashing_function(algorithm=self.layer_1_algorithm).needs_update(hashed_secret=hashed_salt)
+            or get_hashing_function(algorithm=self.layer_2_algorithm).needs_update(hashed_secret=hashed_password)
+        ):
+            return (True, None)
+        return (True, self.generate_double_layered_password(password=password))
+
 
 @lru_cache()
 def get_password_manager() -> PasswordManager:
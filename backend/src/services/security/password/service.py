@@ -0,0 +1,161 @@
+from asyncio import (
+    ensure_future,
+    Future,
+    get_running_loop,
+    shield,
+    TimeoutError as AsyncioTimeoutError,
+    to_thread,
+    wait_for,
+)
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from time import time
+from typing import Any, Callable
+
+from loguru import logger
+
+from src.config.manager import settings
+from src.services.exceptions.custom import PasswordHashingUnavailable
+from src.services.metrics.registry import password_hashing_duration, password_hashing_queue_wait
+from src.services.metrics.timing import timed_span
+from src.services.security.password.manager import pwd_manager
+
+
+def run_timed(function: Callable[..., Any], kwargs: dict[str, Any]) -> tuple[float, float, Any]:
+    """
+    Run a hashing function inside a worker and report when it started and how long it took, so that the caller
+    can tell the time spent waiting in the queue apart from the time spent hashing.
+    """
+    started_at = time()
+    result = function(**kwargs)
+    return (started_at, time() - started_at, result)
+
+
+class PasswordHashingService:
+    """
+    Run the `PasswordManager` hashing off the event loop in a dedicated process pool, so that a burst of logins
+    or registrations never blocks the other requests of the worker. At most `max_queue_size` calls are in flight;
+    further calls are rejected at once instead of queueing without bound. A call stays in flight until its job
+    leaves the executor, even when the caller gave up on it after `timeout`, since the job keeps running. Until
+    `start()` is called, e.g. in scripts and tests, the calls run in the default thread pool instead.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int, timeout: float) -> None:
+        self.max_workers: int = max_workers
+        self.max_queue_size: int = max_queue_size
+        self.timeout: float = timeout
+        self.executor: ProcessPoolExecutor | None = None
+        self.in_flight: int = 0
+        self.completed: int = 0
+        self.rejected: int = 0
+        self.timeouts: int = 0
+        self.failures: int = 0
+        self.queue_wait_seconds: float = 0.0
+        self.max_queue_wait_seconds: float = 0.0
+        self.hashing_seconds: float = 0.0
+
+    @property
+    def is_started(self) -> bool:
+        return self.executor is not None
+
+    def start(self) -> None:
+        if self.is_started or self.max_workers <= 0:
+            return
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=get_context("spawn"))
+
+    def shutdown(self) -> None:
+        if not self.is_started:
+            return
+        self.executor.shutdown(wait=True, cancel_futures=True)  # type: ignore
+        self.executor = None
+
+    def __release(self, job: Future) -> None:
+        """
+        Free the queue slot of a job once it has left the executor, and consume the outcome of a job whose caller
+        has timed out, so that it is not reported as never retrieved.
+        """
+        self.in_flight -= 1
+        if not job.cancelled():
+            job.exception()
+
+    async def __run(self, function: Callable[..., Any], **kwargs: Any) -> Any:
+        if self.in_flight >= self.max_queue_size:
+            self.rejected += 1
+            raise PasswordHashingUnavailable(f"Password hashing queue is full ({self.max_queue_size} calls)!")
+        submitted_at = time()
+        job: Future[tuple[float, float, Any]]
+        try:
+            if self.is_started:
+                job = get_running_loop().run_in_executor(self.executor, run_timed, function, kwargs)
+            else:
+                job = ensure_future(to_thread(run_timed, function, kwargs))
+            self.in_flight += 1
+            job.add_done_callback(self.__release)
+            with timed_span(name="hash"):
+                started_at, duration, result = await wait_for(shield(job), timeout=self.timeout)
+        except AsyncioTimeoutError:
+            self.timeouts += 1
+            raise PasswordHashingUnavailable(f"Password hashing timed out after {self.timeout} seconds!")
+        except BrokenProcessPool as err:
+            self.failures += 1
+            logger.error(f"Password Hashing Pool --- Broken, restarting: {err}")
+            self.executor = None
+            self.start()
+            raise PasswordHashingUnavailable("Password hashing pool crashed!") from err
+        queue_wait = max(0.0, started_at - submitted_at)
+        self.completed += 1
+        self.queue_wait_seconds += queue_wait
+        self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, queue_wait)
+        self.hashing_seconds += duration
+        password_hashing_duration.labels(operation=function.__name__).observe(duration)
+        password_hashing_queue_wait.labels(operation=function.__name__).observe(queue_wait)
+        return result
+
+    async def generate_double_layered_password(self, password: str) -> tuple[str, str]:
+        return await self.__run(pwd_manager.generate_double_layered_password, password=password)
+
+    async def is_hashed_password_verified(self, hashed_salt: str, password: str, hashed_password: str) -> bool:
+        return await self.__run(
+            pwd_manager.is_hashed_password_verified,
+            hashed_salt=hashed_salt,
+            password=password,
+            hashed_password=hashed_password,
+        )
+
+    async def verify_and_update_password(
+        self, hashed_salt: str, password: str, hashed_password: str
+    ) -> tuple[bool, tuple[str, str] | None]:
+        return await self.__run(
+            pwd_manager.verify_and_update_password,
+            hashed_salt=hashed_salt,
+            password=password,
+            hashed_password=hashed_password,
+        )
+
+    @property
+    def statistics(self) -> dict[str, int | float | bool]:
+        return {
+            "is_process_pool": self.is_started,
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "average_queue_wait_ms": self.queue_wait_seconds / self.completed * 1000 if self.completed else 0.0,
+            "max_queue_wait_ms": self.max_queue_wait_seconds * 1000,
+            "average_hashing_ms": self.hashing_seconds / self.completed * 1000 if self.completed else 0.0,
+        }
+
+
+def get_password_hashing_service() -> PasswordHashingService:
+    return PasswordHashingService(
+        max_workers=settings.PASSWORD_HASHING_WORKERS,
+        max_queue_size=settings.PASSWORD_HASHING_MAX_QUEUE_SIZE,
+        timeout=settings.PASSWORD_HASHING_TIMEOUT,
+    )
+
+
+pwd_hashing_service = get_password_hashing_service()
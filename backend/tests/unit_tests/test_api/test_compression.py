@@ -0,0 +1,35 @@
+from gzip import decompress
+
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+
+from src.api.compression import CompressionMiddleware, select_encoding
+from src.services.cache.lru import TTLLRUCache
+
+
+def test_select_encoding_honours_quality_values():
+    assert select_encoding(accept_encoding="gzip, deflate") == "gzip"
+    assert select_encoding(accept_encoding="br;q=0, *;q=0.5") == "gzip"
+    assert select_encoding(accept_encoding="gzip;q=0") is None
+    assert select_encoding(accept_encoding="") is None
+
+
+async def test_compression_middleware_serves_cached_compressed_bodies():
+    body = b'{"blogs": []}' * 200
+    app = Starlette(
+        routes=[Route("/", lambda request: Response(body, media_type="application/json", headers={"ETag": '"v1"'}))]
+    )
+    cache = TTLLRUCache(name="test-compressed-responses", max_size=8, ttl=60)
+    client = AsyncClient(
+        transport=ASGITransport(app=CompressionMiddleware(app=app, minimum_size=1024, offload_size=4096, cache=cache)),
+        base_url="http://testserver",
+    )
+    for _ in range(2):
+        response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert response.content == body
+    assert cache.hits == 1
+    assert decompress(cache.get(key=('"v1"', "gzip"))) == body
@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from src.api.conditional import compute_etag, document_last_modified, is_not_modified
+
+
+def build_request(headers: dict[str, str]) -> Request:
+    return Request(
+        scope={
+            "type": "http",
+            "method": "GET",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        }
+    )
+
+
+def test_is_not_modified_prefers_if_none_match_over_if_modified_since():
+    etag = compute_etag("blog", "", "641a3679c14b677b622db74d@2023-03-19T14:47:27.468396")
+    last_modified = document_last_modified(document={"createdAt": "2023-03-19T14:47:27.468396"})
+    assert last_modified == datetime(2023, 3, 19, 14, 47, 27, tzinfo=timezone.utc)
+    since = "Sun, 19 Mar 2023 14:47:27 GMT"
+
+    assert is_not_modified(
+        request=build_request({"If-None-Match": f'"other", W/{etag}'}), etag=etag, last_modified=None
+    )
+    assert is_not_modified(request=build_request({"If-Modified-Since": since}), etag=etag, last_modified=last_modified)
+    assert not is_not_modified(
+        request=build_request({"If-None-Match": '"other"', "If-Modified-Since": since}),
+        etag=etag,
+        last_modified=last_modified,
+    )
+    assert not is_not_modified(
+        request=build_request({"If-Modified-Since": "not a date"}), etag=etag, last_modified=last_modified
+    )
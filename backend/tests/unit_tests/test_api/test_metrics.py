@@ -0,0 +1,24 @@
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.api.metrics import MetricsMiddleware
+from src.services.metrics.registry import http_requests
+
+
+async def test_metrics_middleware_labels_requests_with_the_route_template():
+    app = Starlette(
+        routes=[Route("/metrics-test/{item_id}", lambda request: PlainTextResponse(request.path_params["item_id"]))],
+        middleware=[Middleware(MetricsMiddleware)],
+    )
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
+    for item_id in ("a", "b"):
+        await client.get(f"/metrics-test/{item_id}")
+    await client.get("/not-routed")
+
+    route_requests = http_requests.labels(method="GET", route="/metrics-test/{item_id}", status_code="200")
+    unmatched_requests = http_requests.labels(method="GET", route="unmatched", status_code="404")
+    assert route_requests._value.get() == 2
+    assert unmatched_requests._value.get() >= 1
@@ -0,0 +1,37 @@
+from gzip import decompress
+
+from src.api.ndjson import iterate_ndjson_rows, stream_ndjson
+
+
+async def iterate_chunks(body: bytes, chunk_size: int):
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
+
+
+async def test_iterate_ndjson_rows_reports_bad_lines_and_keeps_going():
+    body = b'{"title": "a"}\n\nnot json\n[1]\n{"title": "' + b"x" * 64 + b'"}\n{"title": "b"}'
+    rows = [
+        row async for row in iterate_ndjson_rows(chunks=iterate_chunks(body=body, chunk_size=5), max_line_length=32)
+    ]
+    assert rows == [
+        (1, {"title": "a"}),
+        (3, "Line is not valid JSON!"),
+        (4, "Line is not a JSON object!"),
+        (5, "Line is longer than 32 bytes!"),
+        (6, {"title": "b"}),
+    ]
+
+
+async def test_stream_ndjson_yields_a_single_gzip_stream_in_chunks():
+    async def iterate_documents():
+        for index in range(100):
+            yield {"index": index}
+
+    chunks = [
+        chunk
+        async for chunk in stream_ndjson(
+            documents=iterate_documents(), encode=lambda document: document, chunk_size=256, compression_level=6
+        )
+    ]
+    assert len(chunks) > 1
+    assert decompress(b"".join(chunks)).splitlines() == [b'{"index":%d}' % index for index in range(100)]
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from orjson import loads
+
+from src.api.responses import DocumentEncoder, dumps_json
+from src.repository.serializers.blog import blog_fields, serialize_blog
+from src.schema.blog import BlogResponseSchema
+
+
+def test_document_encoder_matches_the_response_model_serialization():
+    document = {
+        "_id": ObjectId("641a3679c14b677b622db74d"),
+        "title": "Blog Title",
+        "body": "Blog Body",
+        "authorName": "johndoe",
+        "authorId": "13243679c14b677b62132401",
+        "createdAt": "2023-03-19T14:47:27.468396",
+        "updatedAt": datetime(2023, 3, 20, 8, 0, 0, 123000),
+    }
+    encoder = DocumentEncoder(schema=BlogResponseSchema, field_keys=blog_fields)
+    for fields in (None, ["id", "title", "created_at"]):
+        expected = jsonable_encoder(
+            BlogResponseSchema.parse_obj(serialize_blog(blog=document, fields=fields)),
+            by_alias=True,
+            exclude_unset=True,
+        )
+        assert loads(dumps_json(content=encoder.encode(document=document, fields=fields))) == expected
@@ -0,0 +1,29 @@
+from orjson import dumps
+
+from src.api.routes.blog import blog_encoder
+from src.cli.export import build_resume_cursor
+from src.repository.crud.blog import BlogCRUDRepository
+from src.repository.database import db_manager
+
+
+async def test_resume_cursor_keeps_the_rows_sharing_the_last_exported_timestamp():
+    db_manager.connect()
+    try:
+        blog_repo = BlogCRUDRepository(collection_name="test-export-blogs")
+        await blog_repo.collection.insert_many(  # type: ignore
+            [
+                {"_id": f"{idx}", "title": "Title", "body": "Body", "createdAt": "2023-03-19T14:47:27.468396Z"}
+                for idx in range(4)
+            ]
+        )
+        exported_ids = [document["_id"] async for document in blog_repo.export_documents()]
+        last_exported_blog = await blog_repo.collection.find_one({"_id": exported_ids[1]})  # type: ignore
+        last_line = dumps(blog_encoder.encode(document=last_exported_blog))
+        resumed_ids = [
+            document["_id"]
+            async for document in blog_repo.export_documents(cursor=build_resume_cursor(line=last_line))
+        ]
+    finally:
+        await db_manager.db.drop_collection("test-export-blogs")  # type: ignore
+        db_manager.disconnect()
+    assert resumed_ids == exported_ids[2:]
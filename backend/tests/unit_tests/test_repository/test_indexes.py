@@ -0,0 +1,56 @@
+from pymongo import ASCENDING, DESCENDING
+from pymongo.collection import Collection
+
+from src.repository.database import db_manager
+from src.repository.indexes import index, index_signature
+
+declared_indexes = [
+    index(keys=[("a", ASCENDING)], name="a_matching"),
+    index(keys=[("c", ASCENDING)], name="c_drifted", sparse=True),
+    index(keys=[("e", DESCENDING)], name="e_created"),
+    index(keys=[("b", ASCENDING)], name="b_failed", unique=True),
+]
+
+
+async def list_index_signatures(collection: Collection) -> dict:
+    return {
+        existing["name"]: index_signature(existing) async for existing in collection.list_indexes()  # type: ignore
+    }
+
+
+async def test_reconciliation_reports_and_only_repairs_drift_when_asked():
+    db_manager.connect()
+    try:
+        collection = db_manager.get_collection(collection_name="test-index-reconciliation")
+        await collection.insert_many([{"a": 1, "b": 1}, {"a": 2, "b": 1}])  # type: ignore
+        await collection.create_indexes(  # type: ignore
+            indexes=[
+                index(keys=[("a", ASCENDING)], name="a_matching"),
+                index(keys=[("c", ASCENDING)], name="c_drifted"),
+                index(keys=[("d", ASCENDING)], name="d_unmanaged"),
+            ]
+        )
+
+        report = await db_manager.reconcile_indexes(
+            collection_name="test-index-reconciliation", indexes=declared_indexes
+        )
+        assert (report.created, report.unchanged, report.rebuilt) == (["e_created"], ["a_matching"], [])
+        assert (list(report.drifted), report.unmanaged, list(report.failed)) == (
+            ["c_drifted"],
+            ["d_unmanaged"],
+            ["b_failed"],
+        )
+        signatures = await list_index_signatures(collection=collection)
+        assert set(signatures) == {"_id_", "a_matching", "c_drifted", "d_unmanaged", "e_created"}
+        assert signatures["c_drifted"] != index_signature(declared_indexes[1].document)
+
+        report = await db_manager.reconcile_indexes(
+            collection_name="test-index-reconciliation", indexes=declared_indexes, is_drift_repaired=True
+        )
+        assert (report.created, report.unchanged, report.rebuilt) == ([], ["a_matching", "e_created"], ["c_drifted"])
+        assert (report.drifted, report.unmanaged, list(report.failed)) == ({}, ["d_unmanaged"], ["b_failed"])
+        signatures = await list_index_signatures(collection=collection)
+        assert signatures["c_drifted"] == index_signature(declared_indexes[1].document)
+    finally:
+        await db_manager.db.drop_collection("test-index-reconciliation")  # type: ignore
+        db_manager.disconnect()
@@ -0,0 +1,79 @@
+from asyncio import gather
+
+from pytest import MonkeyPatch
+
+from src.config.manager import settings
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.database import db_manager
+from src.services.cache.lru import cache_miss
+from src.services.cache.principal import principal_cache
+from src.services.security.password.algorithms import Argon2Algorithm, BCryptAlgorithm
+from src.services.security.password.hashing import get_hashing_function
+from src.services.security.password.service import pwd_hashing_service
+
+password = "Pa55w0rd!"
+
+
+def build_outdated_hashes() -> tuple[str, str]:
+    """
+    Hash like `PasswordManager` with the configured layers (`a2` is built as bcrypt, `bc` as argon2), at lower costs.
+    """
+    hashed_salt = BCryptAlgorithm(rounds=4).generate_hash(salt=settings.HASHING_SALT, secret=None)
+    hashed_password = Argon2Algorithm(time_cost=1, memory_cost=8192, parallelism=1).generate_hash(
+        salt=hashed_salt, secret=password
+    )
+    return (hashed_salt, hashed_password)
+
+
+async def test_login_rehashes_outdated_costs_once_and_keeps_the_user_able_to_log_in(monkeypatch: MonkeyPatch):
+    rehashed_pairs: list[tuple[str, str]] = list()
+    verify_and_update_password = pwd_hashing_service.verify_and_update_password
+
+    async def record_rehashes(**kwargs: str) -> tuple[bool, tuple[str, str] | None]:
+        is_verified, updated_hashes = await verify_and_update_password(**kwargs)
+        if updated_hashes:
+            rehashed_pairs.append(updated_hashes)
+        return (is_verified, updated_hashes)
+
+    monkeypatch.setattr(pwd_hashing_service, "verify_and_update_password", record_rehashes)
+    db_manager.connect()
+    try:
+        user_repo = UserCRUDRepository(collection_name="test-login-rehash-users")
+        hashed_salt, hashed_password = build_outdated_hashes()
+        await user_repo.collection.insert_one(  # type: ignore
+            {
+                "username": "jane",
+                "email": "jane@example.com",
+                "hashedSalt": hashed_salt,
+                "hashedPassword": hashed_password,
+            }
+        )
+        principal_cache.set(key="jane", value={"username": "jane"})
+
+        logins = await gather(
+            user_repo.read_user_in_login(user_data={"username": "jane", "password": password}),
+            user_repo.read_user_in_login(user_data={"username": "jane", "password": password}),
+            return_exceptions=True,
+        )
+        assert len(rehashed_pairs) == 2
+        failed_logins = [login for login in logins if isinstance(login, Exception)]
+        assert len(failed_logins) == 1
+        assert "changed during login" in str(failed_logins[0])
+        assert principal_cache.get(key="jane") is cache_miss
+        db_user = await user_repo.collection.find_one({"username": "jane"})  # type: ignore
+        stored_pair = (db_user["hashedSalt"], db_user["hashedPassword"])
+        assert stored_pair in rehashed_pairs
+        assert not get_hashing_function(algorithm=settings.PWD_ALGORITHM_LAYER_1).needs_update(
+            hashed_secret=stored_pair[0]
+        )
+        assert not get_hashing_function(algorithm=settings.PWD_ALGORITHM_LAYER_2).needs_update(
+            hashed_secret=stored_pair[1]
+        )
+
+        await user_repo.read_user_in_login(user_data={"username": "jane", "password": password})
+        assert len(rehashed_pairs) == 2
+        db_user = await user_repo.collection.find_one({"username": "jane"})  # type: ignore
+        assert (db_user["hashedSalt"], db_user["hashedPassword"]) == stored_pair
+    finally:
+        await db_manager.db.drop_collection("test-login-rehash-users")  # type: ignore
+        db_manager.disconnect()
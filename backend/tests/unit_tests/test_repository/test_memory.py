@@ -0,0 +1,92 @@
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pytest import raises
+
+from src.repository.indexes import collection_indexes, index_signature
+from src.repository.memory.client import MemoryClient
+from src.repository.pagination import build_keyset_filter, encode_cursor, keyset_sort
+from src.repository.search import build_search_pipeline
+
+
+async def create_collection(collection_name: str):
+    collection = MemoryClient().test[collection_name]
+    await collection.create_indexes(indexes=collection_indexes[collection_name])
+    return collection
+
+
+async def test_keyset_pages_are_index_scans_in_the_pagination_order():
+    collection = await create_collection(collection_name="blogs")
+    await collection.insert_many(
+        [{"_id": f"{idx:03d}", "createdAt": f"2023-03-{idx % 7:02d}", "authorId": "a"} for idx in range(30)]
+    )
+    expected_ids = [
+        document["_id"]
+        for document in sorted(collection.documents.values(), key=lambda d: (d["createdAt"], d["_id"]), reverse=True)
+    ]
+
+    ids: list[str] = list()
+    cursor = None
+    while page := (
+        await collection.find(build_keyset_filter(cursor=cursor), {"createdAt": 1})
+        .sort(keyset_sort)
+        .limit(4)
+        .to_list(length=4)
+    ):
+        assert all(set(document) == {"_id", "createdAt"} for document in page)
+        ids.extend(document["_id"] for document in page)
+        cursor = encode_cursor(created_at=page[-1]["createdAt"], id=page[-1]["_id"])
+    assert ids == expected_ids
+
+
+async def test_unique_indexes_reject_duplicates_on_insert_and_update():
+    collection = await create_collection(collection_name="users")
+    await collection.insert_one({"username": "jane", "email": "jane@example.com"})
+    with raises(DuplicateKeyError):
+        await collection.insert_one({"username": "jane", "email": "other@example.com"})
+    with raises(BulkWriteError) as bulk_write_error:
+        await collection.insert_many(
+            [{"username": "john", "email": "john@example.com"}, {"username": "jane", "email": "x@example.com"}],
+            ordered=False,
+        )
+    assert bulk_write_error.value.details["nInserted"] == 1
+    assert [error["index"] for error in bulk_write_error.value.details["writeErrors"]] == [1]
+    with raises(DuplicateKeyError):
+        await collection.find_one_and_update({"username": "john"}, {"$set": {"email": "jane@example.com"}})
+    assert await collection.count_documents({"email": "john@example.com"}) == 1
+
+
+async def test_find_one_and_update_claims_the_first_document_in_sort_order():
+    collection = await create_collection(collection_name="outbox")
+    await collection.insert_many(
+        [{"_id": idx, "status": "PENDING", "nextAttemptAt": 3 - idx, "attempts": 0} for idx in range(3)]
+    )
+    claimed = await collection.find_one_and_update(
+        {"$or": [{"status": "PENDING", "nextAttemptAt": {"$lte": 5}}]},
+        {"$set": {"status": "SENDING"}, "$inc": {"attempts": 1}},
+        sort=[("nextAttemptAt", ASCENDING)],
+        return_document=ReturnDocument.AFTER,
+    )
+    assert (claimed["_id"], claimed["status"], claimed["attempts"]) == (2, "SENDING", 1)
+    assert await collection.count_documents({"status": "PENDING"}) == 2
+
+
+async def test_text_search_ranks_title_matches_first_and_excludes_negated_terms():
+    collection = await create_collection(collection_name="blogs")
+    await collection.insert_many(
+        [
+            {"_id": "1", "title": "Notes", "body": "Caching makes reads cheap"},
+            {"_id": "2", "title": "Caching strategies", "body": "When to cache"},
+            {"_id": "3", "title": "Caching pitfalls", "body": "Stale reads"},
+        ]
+    )
+    pipeline = build_search_pipeline(query="caching -stale", cursor=None, limit=10, projection={"title": 1})
+    results = await collection.aggregate(pipeline).to_list(length=None)
+    assert [result["_id"] for result in results] == ["2", "1"]
+    assert results[0]["score"] > results[1]["score"]
+
+
+async def test_list_indexes_matches_the_declared_index_signatures():
+    collection = await create_collection(collection_name="blogs")
+    listed_signatures = {index["name"]: index_signature(index) async for index in collection.list_indexes()}
+    for declared_index in collection_indexes["blogs"]:
+        assert listed_signatures[declared_index.document["name"]] == index_signature(declared_index.document)
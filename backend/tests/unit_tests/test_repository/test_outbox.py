@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+from pydantic import EmailStr
+
+from src.repository.crud.outbox import OutboxCRUDRepository
+from src.repository.database import db_manager
+from src.schema.outbox import OutboxStatus
+from src.services.email.outbox import OutboxWorker
+from src.services.email.smtp import SMTPConnectionPool
+
+
+def expire_lease_of(outbox_repo: OutboxCRUDRepository, message_id: str):
+    return outbox_repo.collection.update_one(  # type: ignore
+        {"_id": message_id}, {"$set": {"lockedUntil": datetime.utcnow() - timedelta(seconds=1)}}
+    )
+
+
+async def test_leases_retries_and_lost_leases():
+    db_manager.connect()
+    try:
+        outbox_repo = OutboxCRUDRepository(collection_name="test-outbox")
+        message_id = await outbox_repo.enqueue(
+            recipients=[EmailStr("jane@example.com")], subject="Subject", body="Body"
+        )
+
+        [claimed_message] = await outbox_repo.claim_batch(limit=5, lease_seconds=60.0)
+        assert claimed_message["status"] == OutboxStatus.SENDING.value
+        assert await outbox_repo.claim_batch(limit=5, lease_seconds=60.0) == []
+
+        await expire_lease_of(outbox_repo=outbox_repo, message_id=message_id)
+        [expired_message] = await outbox_repo.claim_batch(limit=5, lease_seconds=60.0)
+        await outbox_repo.mark_sent(message=claimed_message)
+        db_message = await outbox_repo.collection.find_one({"_id": message_id})  # type: ignore
+        assert (db_message["status"], db_message["lockedUntil"], db_message["attempts"]) == (
+            OutboxStatus.SENDING.value,
+            expired_message["lockedUntil"],
+            0,
+        )
+
+        await outbox_repo.mark_failed(
+            message=expired_message, error="421 Try again", next_attempt_at=datetime.utcnow() - timedelta(seconds=1)
+        )
+        [retried_message] = await outbox_repo.claim_batch(limit=5, lease_seconds=60.0)
+        assert (retried_message["attempts"], retried_message["lastError"]) == (1, "421 Try again")
+
+        await outbox_repo.mark_failed(message=retried_message, error="550 No such user", next_attempt_at=None)
+        db_message = await outbox_repo.collection.find_one({"_id": message_id})  # type: ignore
+        assert (db_message["status"], db_message["attempts"]) == (OutboxStatus.FAILED.value, 2)
+        await expire_lease_of(outbox_repo=outbox_repo, message_id=message_id)
+        assert await outbox_repo.claim_batch(limit=5, lease_seconds=60.0) == []
+    finally:
+        await db_manager.db.drop_collection("test-outbox")  # type: ignore
+        db_manager.disconnect()
+
+
+def test_backoff_doubles_up_to_its_maximum_and_gives_up_after_the_last_attempt():
+    outbox_worker = OutboxWorker(
+        smtp_pool=SMTPConnectionPool(
+            hostname="127.0.0.1",
+            port=25,
+            username=None,
+            password=None,
+            use_tls=False,
+            start_tls=False,
+            size=1,
+            max_messages_per_connection=1,
+            timeout=1.0,
+        ),
+        batch_size=1,
+        poll_interval=1.0,
+        lease_seconds=60.0,
+        max_attempts=4,
+        backoff_base=10.0,
+        backoff_max=30.0,
+    )
+    for attempts, backoff in ((1, 10.0), (2, 20.0), (3, 30.0)):
+        delay = (outbox_worker.next_attempt_at(attempts=attempts) - datetime.utcnow()).total_seconds()  # type: ignore
+        assert backoff / 2 - 1 <= delay <= backoff
+    assert outbox_worker.next_attempt_at(attempts=4) is None
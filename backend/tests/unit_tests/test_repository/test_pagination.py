@@ -0,0 +1,32 @@
+from pytest import raises
+
+from src.repository.pagination import build_keyset_filter, decode_cursor, encode_cursor, paginate
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(created_at="2023-03-19T14:47:27.468396Z", id="641a3679c14b677b622db74d")
+    assert decode_cursor(cursor=cursor) == ("2023-03-19T14:47:27.468396Z", "641a3679c14b677b622db74d")
+
+
+def test_invalid_cursor_is_rejected():
+    with raises(ValueError):
+        decode_cursor(cursor="not-a-cursor")
+
+
+def test_keyset_filter_seeks_past_cursor():
+    cursor = encode_cursor(created_at="2023-03-19T14:47:27Z", id="641a3679c14b677b622db74d")
+    assert build_keyset_filter(cursor=None) == {}
+    assert build_keyset_filter(cursor=cursor) == {
+        "$or": [
+            {"createdAt": {"$lt": "2023-03-19T14:47:27Z"}},
+            {"createdAt": "2023-03-19T14:47:27Z", "_id": {"$lt": "641a3679c14b677b622db74d"}},
+        ]
+    }
+
+
+def test_paginate_returns_next_cursor_only_when_more_documents_exist():
+    documents = [{"_id": str(idx), "createdAt": f"2023-03-{idx:02d}"} for idx in range(3, 0, -1)]
+    page, next_cursor = paginate(documents=documents, limit=2)
+    assert [document["_id"] for document in page] == ["3", "2"]
+    assert decode_cursor(cursor=next_cursor) == ("2023-03-02", "2")  # type: ignore
+    assert paginate(documents=documents, limit=3) == (documents, None)
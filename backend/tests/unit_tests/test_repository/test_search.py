@@ -0,0 +1,35 @@
+from pytest import raises
+
+from src.repository.search import (
+    build_highlight_pattern,
+    build_search_pipeline,
+    build_snippet,
+    decode_search_cursor,
+    encode_search_cursor,
+    extract_query_terms,
+)
+
+
+def test_query_terms_keep_phrases_and_drop_negations():
+    assert extract_query_terms(query='carbon "credit market" -crypto') == ["carbon", "credit market"]
+
+
+def test_snippet_highlights_inflections_around_first_match():
+    pattern = build_highlight_pattern(terms=["credits"])
+    text = "An introduction. " * 20 + "Carbon credit <markets> are growing. " + "Filler text. " * 20
+    snippet = build_snippet(text=text, highlight_pattern=pattern, width=80)
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "<mark>credit</mark>" in snippet
+    assert "&lt;markets&gt;" in snippet
+
+
+def test_search_cursor_round_trip_and_seek():
+    cursor = encode_search_cursor(score=1.5, id="641a3679c14b677b622db74d")
+    assert decode_search_cursor(cursor=cursor) == (1.5, "641a3679c14b677b622db74d")
+    pipeline = build_search_pipeline(query="carbon", cursor=cursor, limit=10, projection={"title": 1})
+    assert pipeline[2] == {
+        "$match": {"$or": [{"score": {"$lt": 1.5}}, {"score": 1.5, "_id": {"$lt": "641a3679c14b677b622db74d"}}]}
+    }
+    assert pipeline[-1] == {"$limit": 11}
+    with raises(ValueError):
+        decode_search_cursor(cursor=encode_search_cursor(score=True, id="x"))  # type: ignore
@@ -0,0 +1,22 @@
+from asyncio import create_task, sleep
+
+from pytest import raises
+
+from src.services.admission.controller import AdmissionController
+from src.services.exceptions.custom import RequestAdmissionRejected
+
+
+async def test_admission_controller_queues_within_the_timeout_and_sheds_beyond_it():
+    controller = AdmissionController(name="test", max_cost=2, queue_timeout=0.1, retry_after=1)
+    await controller.acquire(cost=2)
+    queued_request = create_task(controller.acquire(cost=1))
+    await sleep(0.01)
+    controller.release(cost=2)
+    await queued_request
+    assert controller.in_flight_cost == 1
+
+    await controller.acquire(cost=1)
+    with raises(RequestAdmissionRejected):
+        await controller.acquire(cost=1)
+    assert controller.statistics["shed"] == 1
+    assert controller.statistics["queue_length"] == 0
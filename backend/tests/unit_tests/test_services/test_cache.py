@@ -0,0 +1,45 @@
+from src.services.cache.lru import cache_miss, registered_caches, TTLLRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = TTLLRUCache(name="test-lru", max_size=2, ttl=60.0)
+    cache.set(key="a", value=1)
+    cache.set(key="b", value=2)
+    assert cache.get(key="a") == 1
+    cache.set(key="c", value=3)
+    assert cache.get(key="b") is cache_miss
+    assert cache.get(key="a") == 1
+    assert cache.statistics["evictions"] == 1
+
+
+def test_cache_expires_positive_and_negative_entries_separately():
+    clock = FakeClock()
+    cache = TTLLRUCache(name="test-ttl", max_size=8, ttl=60.0, negative_ttl=5.0, clock=clock)
+    cache.set(key="blog", value={"title": "Blog Title"})
+    cache.set_missing(key="missing")
+    assert cache.get(key="missing") is None
+    clock.now = 10.0
+    assert cache.get(key="missing") is cache_miss
+    assert cache.get(key="blog") == {"title": "Blog Title"}
+    clock.now = 61.0
+    assert cache.get(key="blog") is cache_miss
+    assert cache.statistics["expirations"] == 2
+
+
+def test_disabled_cache_never_stores():
+    cache = TTLLRUCache(name="test-disabled", max_size=0, ttl=60.0)
+    cache.set(key="a", value=1)
+    assert cache.get(key="a") is cache_miss
+
+
+def test_only_application_caches_are_registered():
+    assert "test-lru" not in registered_caches
+    assert {"blogs", "blog-searches", "principals", "tokens", "compressed-responses"} <= set(registered_caches)
@@ -0,0 +1,29 @@
+from asyncio import sleep as async_sleep
+from time import sleep
+
+from pytest import MonkeyPatch, raises
+
+from src.services.exceptions.custom import PasswordHashingUnavailable
+from src.services.security.password import service
+from src.services.security.password.service import PasswordHashingService
+
+
+class SlowPasswordManager:
+    def generate_double_layered_password(self, password: str) -> tuple[str, str]:
+        sleep(0.2)
+        return (password, password)
+
+
+async def test_timed_out_calls_keep_their_queue_slot_until_the_job_finishes(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(service, "pwd_manager", SlowPasswordManager())
+    hashing_service = PasswordHashingService(max_workers=0, max_queue_size=1, timeout=0.05)
+
+    with raises(PasswordHashingUnavailable):
+        await hashing_service.generate_double_layered_password(password="password")
+    assert hashing_service.statistics["timeouts"] == 1
+    with raises(PasswordHashingUnavailable):
+        await hashing_service.generate_double_layered_password(password="password")
+    assert hashing_service.statistics["rejected"] == 1
+
+    await async_sleep(0.3)
+    assert hashing_service.in_flight == 0
@@ -0,0 +1,75 @@
+from socket import socket
+
+from aiosmtpd.controller import Controller
+from pytest import fixture
+
+from src.services.email.smtp import build_email_message, SMTPConnectionPool
+
+
+class CollectingHandler:
+    def __init__(self) -> None:
+        self.messages: list[bytes] = list()
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.messages.append(envelope.content)
+        return "250 Message accepted for delivery"
+
+
+@fixture(name="smtp_server")
+def smtp_server():  # type: ignore
+    with socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        port = free_socket.getsockname()[1]
+    handler = CollectingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield (handler, port)
+    controller.stop()
+
+
+def build_pool(port: int, size: int = 1) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname="127.0.0.1",
+        port=port,
+        username=None,
+        password=None,
+        use_tls=False,
+        start_tls=False,
+        size=size,
+        max_messages_per_connection=100,
+        timeout=5.0,
+    )
+
+
+def build_messages(count: int) -> list:
+    return [
+        build_email_message(
+            sender="noreply@example.com",
+            sender_name="Pala Blog",
+            recipients=[f"user{idx}@example.com"],
+            subject=f"Subject {idx}",
+            body="<p>Hello</p>",
+        )
+        for idx in range(count)
+    ]
+
+
+async def test_pool_sends_many_messages_over_one_connection(smtp_server):
+    handler, port = smtp_server
+    pool = build_pool(port=port)
+    assert await pool.send_messages(messages=build_messages(count=3)) == [None, None, None]
+    assert await pool.send_messages(messages=build_messages(count=2)) == [None, None]
+    assert len(handler.messages) == 5
+    assert pool.statistics["connections_opened"] == 1
+    await pool.close()
+    assert pool.statistics["open_connections"] == 0
+
+
+async def test_pool_reports_every_message_as_failed_when_the_server_is_down():
+    # A bound socket that never listens refuses every connection, and holds its port for the whole test.
+    with socket() as closed_socket:
+        closed_socket.bind(("127.0.0.1", 0))
+        pool = build_pool(port=closed_socket.getsockname()[1], size=2)
+        errors = await pool.send_messages(messages=build_messages(count=3))
+    assert all(error is not None for error in errors)
+    assert pool.statistics["messages_failed"] == 3
@@ -0,0 +1,26 @@
+from time import perf_counter
+
+from pytest import raises
+
+from src.services.metrics.startup import StartupReport
+
+
+def test_budget_overruns_name_the_slowest_startup_step():
+    startup_report = StartupReport(started_at=perf_counter() - 2.0, import_budget_ms=1500.0, startup_budget_ms=500.0)
+    startup_report.mark_imported()
+    startup_report.mark_imported()
+    startup_report.step_durations_ms.update({"database-connection": 100.0, "database-bootstrap": 450.0})
+
+    overruns = startup_report.budget_overruns
+    assert len(overruns) == 2
+    assert overruns[0].startswith("import took 2")
+    assert "`database-bootstrap` 450 ms" in overruns[1]
+
+
+def test_measure_records_the_duration_of_a_failed_step():
+    startup_report = StartupReport(started_at=perf_counter(), import_budget_ms=1500.0, startup_budget_ms=500.0)
+    with raises(RuntimeError):
+        with startup_report.measure(step="email-outbox"):
+            raise RuntimeError()
+    assert set(startup_report.statistics["steps_ms"]) == {"email-outbox"}  # type: ignore
+    assert startup_report.statistics["budget_overruns"] == []
@@ -0,0 +1,25 @@
+from src.config.manager import settings
+from src.services.email.templates import EmailTemplateRenderer
+
+
+def test_renderer_prerenders_styles_and_escapes_context():
+    renderer = EmailTemplateRenderer(
+        template_dir=settings.TEMPLATE_DIR, bytecode_cache_dir=None, is_auto_reloaded=False
+    )
+    renderer.warm_up()
+    assert "<style>" in str(renderer.environment.globals["styles"])
+    html = renderer.render(
+        template_name="verification", url="https://example.com", username="<b>jane</b>", subject="S"
+    )
+    assert "<style>" in html
+    assert "&lt;b&gt;jane&lt;/b&gt;" in html
+
+
+def test_batch_rendering_matches_single_rendering():
+    renderer = EmailTemplateRenderer(
+        template_dir=settings.TEMPLATE_DIR, bytecode_cache_dir=None, is_auto_reloaded=False
+    )
+    contexts = [{"url": f"https://example.com/{idx}", "username": f"user{idx}", "subject": "S"} for idx in range(3)]
+    assert renderer.render_batch(template_name="verification", contexts=contexts) == [
+        renderer.render(template_name="verification", **context) for context in contexts
+    ]
@@ -0,0 +1,38 @@
+from asyncio import gather, sleep as async_sleep
+from time import sleep
+
+from src.services.metrics.timing import request_timings, RequestTimings, timed_span
+
+
+def test_nested_spans_only_count_their_own_time():
+    timings = RequestTimings()
+    context_token = request_timings.set(timings)
+    try:
+        with timed_span(name="db"):
+            sleep(0.01)
+            with timed_span(name="hash"):
+                sleep(0.03)
+    finally:
+        request_timings.reset(context_token)
+
+    assert 0.01 <= timings.durations["db"] < 0.03
+    assert timings.durations["hash"] >= 0.03
+    assert [metric.split(";")[0] for metric in timings.to_header().split(", ")] == ["hash", "db", "total"]
+
+
+async def test_concurrent_nested_spans_add_up_to_their_parent():
+    async def hash_password() -> None:
+        with timed_span(name="hash"):
+            await async_sleep(0.03)
+
+    timings = RequestTimings()
+    context_token = request_timings.set(timings)
+    try:
+        with timed_span(name="db"):
+            await gather(hash_password(), hash_password())
+    finally:
+        request_timings.reset(context_token)
+
+    assert timings.durations["hash"] >= 0.06
+    assert timings.counts["hash"] == 2
+    assert timings.durations["db"] < 0.01